@@ -0,0 +1,91 @@
+"""
+Sözdizimi etiketlerini uygulama mikro-kıyaslaması.
+
+Eski işaret (mark) yürütme yöntemi (token başına mark_set + mark_set + tag_add) ile
+SyntaxHighlighter'ın toplu Tcl betiği yöntemini aynı token dizisi üzerinde karşılaştırır.
+
+Kullanım (proje kök dizininden, grafik ortam gerekir):
+    python benchmarks/bench_tag_apply.py [hedef_kb]
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pygments.lexers import PythonLexer
+
+from text_editor.utils.highlighter import SyntaxHighlighter
+from text_editor.utils.tokenizer import lex_document
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "text_editor", "ui", "editor.py")
+
+
+def build_source(target_kb: int) -> str:
+    """Örnek dosyayı hedef boyuta ulaşana kadar tekrarlar."""
+    with open(SAMPLE_FILE, "r", encoding="utf-8") as f:
+        sample = f.read()
+    repeat = max(1, (target_kb * 1024) // len(sample) + 1)
+    return sample * repeat
+
+
+def apply_mark_walking(text_widget: tk.Text, tokens) -> None:
+    """Eski yöntem: her token için üç Tcl çağrısı ve 'range_start + Nc' indeks aritmetiği."""
+    text_widget.mark_set("range_start", "1.0")
+    for token, value in tokens:
+        tag_name = f"{SyntaxHighlighter.TAG_PREFIX}{str(token)}"
+        text_widget.mark_set("range_end", f"range_start + {len(value)}c")
+        text_widget.tag_add(tag_name, "range_start", "range_end")
+        text_widget.mark_set("range_start", "range_end")
+
+
+def clear_syntax_tags(text_widget: tk.Text) -> None:
+    for tag in text_widget.tag_names():
+        if tag.startswith(SyntaxHighlighter.TAG_PREFIX):
+            text_widget.tag_remove(tag, "1.0", "end")
+
+
+def main() -> None:
+    target_kb = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    content = build_source(target_kb)
+
+    root = tk.Tk()
+    root.withdraw()
+    text_widget = tk.Text(root)
+    text_widget.insert("1.0", content)
+    highlighter = SyntaxHighlighter(text_widget)
+
+    _, tokens = lex_document(content, PythonLexer(), SyntaxHighlighter.CHECKPOINT_INTERVAL)
+    print(f"Boyut: {len(content) / 1024:.0f} KB, satır: {content.count(chr(10)) + 1}, token: {len(tokens)}")
+
+    clear_syntax_tags(text_widget)
+    started = time.perf_counter()
+    apply_mark_walking(text_widget, tokens)
+    mark_time = time.perf_counter() - started
+    mark_ranges = {tag: text_widget.tag_ranges(tag) for tag in text_widget.tag_names()
+                   if tag.startswith(SyntaxHighlighter.TAG_PREFIX)}
+
+    clear_syntax_tags(text_widget)
+    started = time.perf_counter()
+    highlighter._apply_tokens("1.0", tokens)
+    batch_time = time.perf_counter() - started
+    batch_ranges = {tag: text_widget.tag_ranges(tag) for tag in text_widget.tag_names()
+                    if tag.startswith(SyntaxHighlighter.TAG_PREFIX)}
+
+    same = all(str(mark_ranges.get(tag)) == str(batch_ranges.get(tag))
+               for tag in set(mark_ranges) | set(batch_ranges)
+               if mark_ranges.get(tag) or batch_ranges.get(tag))
+
+    print(f"İşaret yürütme : {mark_time * 1000:8.1f} ms ({3 * len(tokens)} Tcl çağrısı)")
+    print(f"Toplu betik    : {batch_time * 1000:8.1f} ms (1 Tcl çağrısı)")
+    print(f"Hızlanma       : {mark_time / batch_time if batch_time else float('inf'):8.1f}x")
+    print(f"Aynı aralıklar : {'evet' if same else 'HAYIR'}")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+import re
+import sys
+import tkinter as tk
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pygments.util
+from pygments.lexer import Lexer
+from pygments.styles import get_style_by_name
+
+from text_editor.ui.minimap import (
+    MAX_HIGHLIGHT_CHARS, UPDATE_DELAY_MS, calculate_hover_color, calculate_viewport_color,
+)
+from text_editor.utils.highlighter import LexerRegistry, SyntaxHighlighter
+from text_editor.utils.document_model import DocumentModel
+from text_editor.utils.tokenizer import TokenCache, lex_document
+
+# Yapılandırma Sabitleri
+BITMAP_WIDTH: int = 80  # Piksel; her sütun bir piksel
+LINE_HEIGHT: int = 3  # Bir satırın piksel yüksekliği
+INK_HEIGHT: int = 2  # Satırın boyanan kısmı (kalanı satır arası boşluk)
+DEFAULT_FG: str = "#d4d4d4"
+
+# (başlangıç sütunu, bitiş sütunu, renk)
+Run = Tuple[int, int, str]
+
+_INK = re.compile(r"\S+")
+
+
+def build_line_runs(content: str, line_starts: Sequence[int], first: int, last: int,
+                    tokens: Optional[Sequence[Tuple[Any, str]]] = None,
+                    token_starts: Optional[Sequence[int]] = None,
+                    color_of: Optional[Callable[[Any], str]] = None,
+                    default_color: str = DEFAULT_FG,
+                    max_columns: int = BITMAP_WIDTH,
+                    content_offset: int = 0) -> List[Tuple[Run, ...]]:
+    """
+    [first, last) satırları (0 tabanlı) için renk koşularını (run) hesaplar.
+
+    Her satır, boşluk olmayan karakter dizilerinin (başlangıç sütunu, bitiş sütunu, renk)
+    listesine dönüşür; renk, karakterleri kapsayan token'ın tipinden `color_of` ile bulunur.
+    Token verilmezse tüm metin `default_color` ile çizilir. Token'ların başlangıç konumları
+    (`token_starts`) ile pencerenin ilk token'ı ikili aramayla bulunur, böylece maliyet belge
+    uzunluğuna değil pencereye bağlıdır. `max_columns` ötesindeki sütunlar kırpılır.
+    `content` belgenin sadece bir parçası olabilir: `content_offset` ilk karakterinin belgedeki
+    konumudur; `line_starts` ve token konumları belgeye göredir.
+    """
+    count = last - first
+    if count <= 0:
+        return []
+    runs: List[List[Run]] = [[] for _ in range(count)]
+    begin = line_starts[first]
+    end = line_starts[last] if last < len(line_starts) else content_offset + len(content)
+
+    if tokens is None or token_starts is None or color_of is None:
+        segments = [(content_offset, content, default_color)]
+    else:
+        segments = []
+        index = max(bisect_right(token_starts, begin) - 1, 0)
+        while index < len(tokens) and token_starts[index] < end:
+            token_type, text = tokens[index]
+            segments.append((token_starts[index], text, color_of(token_type)))
+            index += 1
+
+    for pos, text, color in segments:
+        for match in _INK.finditer(text, max(begin - pos, 0), min(end - pos, len(text))):
+            start = pos + match.start()
+            line = bisect_right(line_starts, start) - 1
+            column = start - line_starts[line]
+            if column >= max_columns:
+                continue
+            stop = min(pos + match.end() - line_starts[line], max_columns)
+            line_runs = runs[line - first]
+            # Aynı renkteki bitişik token'lar tek dikdörtgende birleşir
+            if line_runs and line_runs[-1][1] == column and line_runs[-1][2] == color:
+                line_runs[-1] = (line_runs[-1][0], stop, color)
+            else:
+                line_runs.append((column, stop, color))
+    return [tuple(line_runs) for line_runs in runs]
+
+
+def _union(span: Optional[Tuple[int, int]], other: Tuple[int, int]) -> Tuple[int, int]:
+    """İki [ilk, son) satır aralığını kapsayan en küçük aralık."""
+    return other if span is None else (min(span[0], other[0]), max(span[1], other[1]))
+
+
+class BitmapMinimap(tk.Canvas):
+    """
+    Belgeyi küçültülmüş renk blokları olarak bir Canvas üzerine çizen minimap.
+
+    Metin tabanlı `Minimap`'in aksine tamponun ikinci bir kopyasını ve etiketlerini tutmaz.
+    Sadece minimap penceresinin yüksekliği kadar bir `PhotoImage` vardır; her satır
+    `LINE_HEIGHT` piksellik bir banttır ve bant, satırın token renk koşularından
+    `PhotoImage.put` dikdörtgenleriyle boyanır. İçeriğin kopyası tutulmaz: bir düzenlemede
+    (`notify_edit`) sadece düzenlenen satırların bantları geçersiz olur ve bu satırlar
+    DocumentModel'den okunur; konumlar modelin satır başı dizininden alınır. Her bandın son
+    çizilen koşuları saklanır ve sadece koşuları değişen bantlar yeniden çizilir (tek bir Tcl
+    betiğiyle).
+    Pillow burada bilerek kullanılmaz: bir PIL resmini göstermek her güncellemede resmin
+    tamamını `ImageTk` ile Tk'ye yeniden aktarmayı gerektirir; `put`/`copy` ise Tk resmini
+    yerinde değiştirir, böylece sadece değişen bantlar yazılır. Renkler editörün
+    `TokenCache`'e yayınladığı token'lardan okunur.
+
+    Tıklama/sürükleme ile gezinme, fare tekerleği ve görünüm alanı göstergesi `Minimap` ile
+    aynı şekilde çalışır; gösterge ve hover, resmin altındaki dikdörtgenlerdir (boş pikseller
+    saydamdır).
+    """
+
+    def __init__(self, master: tk.Widget, main_text: tk.Text,
+                 token_cache: Optional[TokenCache] = None, document: Optional[DocumentModel] = None,
+                 style_name: str = "monokai",
+                 **kwargs: Any) -> None:
+        """
+        Bitmap minimap'i başlatır.
+
+        Argümanlar:
+            master: Ebeveyn pencere öğesi.
+            main_text: Senkronize edilecek ana metin düzenleyici pencere öğesi.
+            token_cache: Editörün vurgulayıcısının token yayınladığı paylaşılan önbellek.
+                Verilmezse içerik burada lexlenir.
+            document: Editörün DocumentModel'i. Verilmezse her güncellemede widget'tan doldurulan
+                yerel bir model kullanılır.
+            style_name: Token renklerinin alınacağı pygments stili.
+            **kwargs: Canvas için ek yapılandırma seçenekleri.
+        """
+        super().__init__(
+            master,
+            width=BITMAP_WIDTH,
+            bd=0,
+            highlightthickness=0,
+            cursor="arrow",
+            takefocus=False,
+            **kwargs
+        )
+
+        self.main_text = main_text
+        self._owns_document = document is None
+        self.document = document if document is not None else DocumentModel()
+        self.current_lexer: Optional[Lexer] = LexerRegistry.get_instance().get_lexer_by_name("text")
+        self.fg = DEFAULT_FG
+        self._colors: Dict[Any, str] = {}
+        self._style: Any = None
+        self._load_style(style_name)
+
+        self._update_task: Optional[str] = None
+        self._render_job: Optional[str] = None
+        self._full_refresh = True
+
+        # Son alınan token'lar (token önbelleği yoksa burada lexlenen metinle birlikte). Belge
+        # değişince eskirler: yenileri gelene kadar yeniden hesaplanan bantlar renksiz çizilir
+        # ve bu satırlar (`_plain_lines`) token'lar gelince yeniden hesaplanır.
+        self._tokens: Optional[List[Tuple[Any, str]]] = None
+        self._token_starts: Optional[List[int]] = None
+        self._tokens_stale = True
+        self._plain_lines: Optional[Tuple[int, int]] = None
+        self._lexed_text: Optional[str] = None
+        self._token_version = -1
+        # Bantları yeniden hesaplanacak satırlar [ilk, son) (0 tabanlı) ve son çizilen üst satır
+        self._stale_lines: Optional[Tuple[int, int]] = (0, sys.maxsize)
+        self._drawn_top = -1
+
+        # Kaydırma durumu: ana metnin kesri ve minimapte en üstte çizilen satır (0 tabanlı)
+        self._fraction = 0.0
+        self._top_line = 0
+        # Her banda son çizilen koşular (değişmeyen bantlar yeniden çizilmez)
+        self._rows: List[Tuple[Run, ...]] = []
+
+        self._image = tk.PhotoImage(master=self, width=BITMAP_WIDTH, height=LINE_HEIGHT)
+        self._blank = tk.PhotoImage(master=self, width=1, height=1)
+        self._hover_item = self.create_rectangle(0, 0, 0, 0, width=0, fill="#4e4e52", state="hidden")
+        self._viewport_item = self.create_rectangle(0, 0, 0, 0, width=0, fill="#3e3e42")
+        self.create_image(0, 0, anchor="nw", image=self._image)
+
+        # Paylaşılan token önbelleği; içerik için henüz token yayınlanmadıysa renkler bekletilir
+        self.token_cache = token_cache
+        self._highlight_pending = False
+        if token_cache is not None:
+            token_cache.add_listener(self._on_tokens_published)
+            self.bind("<Destroy>", lambda e: token_cache.remove_listener(self._on_tokens_published), add="+")
+
+        self._bind_events()
+
+    def _bind_events(self) -> None:
+        """Fare etkileşimlerini, kaydırma ve yeniden boyutlandırma olaylarını bağlar."""
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Leave>", self._on_leave)
+        # Linux kaydırma düğmeleri desteği
+        self.bind("<Button-4>", self._on_wheel)
+        self.bind("<Button-5>", self._on_wheel)
+
+    def _load_style(self, style_name: str) -> None:
+        try:
+            self._style = get_style_by_name(style_name)
+        except pygments.util.ClassNotFound:
+            self._style = get_style_by_name("monokai")
+        self._colors.clear()
+
+    def _token_color(self, token_type: Any) -> str:
+        """Token tipinin stildeki ön plan rengi (yoksa varsayılan ön plan)."""
+        color = self._colors.get(token_type)
+        if color is None:
+            value = self._style.style_for_token(token_type).get("color")
+            color = f"#{value}" if value else self.fg
+            self._colors[token_type] = color
+        return color
+
+    def update_content(self, event: Optional[tk.Event] = None) -> None:
+        """
+        Minimap içeriğini ana metin düzenleyici ile senkronize eder.
+        Neyin değiştiği bilinmediği için penceredeki tüm bantlar yeniden hesaplanır; düzenlenen
+        satırlar biliniyorsa notify_edit kullanılmalıdır. Performans için debouncing (gecikmeli güncelleme) kullanır.
+        """
+        self._full_refresh = True
+        self._schedule_update()
+
+    def notify_edit(self, first_line: int, old_last_line: int, new_last_line: int) -> None:
+        """
+        Ana metinde [first_line, old_last_line] satırlarının [first_line, new_last_line]
+        satırlarıyla değiştirildiğini bildirir; sadece bu satırların (satır sayısı değiştiyse
+        sonrakilerin de) bantları yeniden hesaplanır. Belge modeli zaten güncellenmiş olmalıdır.
+        """
+        # Araya giren bir kaydırma çizimi de yeni satırları okusun diye hemen işaretlenir;
+        # eski metnin token'ları yeni konumlara uymaz
+        self._invalidate_lines(first_line - 1,
+                               new_last_line if new_last_line == old_last_line else sys.maxsize)
+        self._tokens_stale = True
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        if self._update_task:
+            self.after_cancel(self._update_task)
+
+        self._update_task = self.after(UPDATE_DELAY_MS, self._perform_update)
+
+    def force_update(self) -> None:
+        """Anlık güncellemeyi zorlar (debouncing olmadan)."""
+        if self._update_task:
+            self.after_cancel(self._update_task)
+            self._update_task = None
+        self._perform_update()
+
+    def _perform_update(self) -> None:
+        """Bildirilen satırların (veya tümünün) bantlarını geçersiz kılar, token'ları okur ve çizer."""
+        self._update_task = None
+        if self._owns_document:
+            try:
+                self.document.reset(self.main_text.get("1.0", "end-1c"))
+            except tk.TclError:
+                return
+            self._full_refresh = True
+        if self._full_refresh:
+            self._invalidate_lines(0, sys.maxsize)
+            self._tokens_stale = True
+        self._full_refresh = False
+        self._load_tokens()
+        self._render()
+
+    def _invalidate_lines(self, first: int, last: int) -> None:
+        """[first, last) satırlarının (0 tabanlı) bantlarını bir sonraki çizimde yeniden hesaplatır."""
+        self._stale_lines = _union(self._stale_lines, (first, last))
+
+    def _load_tokens(self) -> None:
+        """Geçerli belge için token'ları önbellekten (yoksa doğrudan lexleyerek) alır."""
+        lexer = self.current_lexer
+        cache = self.token_cache
+        if lexer is None:
+            self._set_tokens(None)
+        elif cache is not None:
+            # Yayınlanan metin modelin bu sürümdeki metninin kendisiyse token'lar günceldir
+            current = cache.tokens is not None and cache.lexer is lexer and self._is_current(cache.content)
+            # Editör bu içeriği henüz lexlemediyse yayın geldiğinde renklendirilir
+            self._highlight_pending = not current
+            if current and (self._tokens_stale or cache.tokens is not self._tokens):
+                stale = (0, sys.maxsize)
+                if (cache.changed is not None and self._tokens is not None
+                        and cache.version == self._token_version + 1):
+                    # Bir önceki yayına göre sadece bu aralığın renkleri değişmiş olabilir
+                    stale = (self.document.line_col(cache.changed[0])[0] - 1,
+                             self.document.line_col(cache.changed[1])[0])
+                self._token_version = cache.version
+                self._set_tokens(cache.tokens, cache.token_starts(), stale)
+        elif len(self.document) < MAX_HIGHLIGHT_CHARS:
+            text = self.document.text()
+            tokens = self._tokens
+            if tokens is None or text != self._lexed_text:
+                self._lexed_text = text
+                try:
+                    tokens = lex_document(text, lexer, SyntaxHighlighter.CHECKPOINT_INTERVAL)[1]
+                except Exception:
+                    tokens = None
+            self._set_tokens(tokens)
+        else:
+            self._set_tokens(None)
+
+    def _is_current(self, content: Optional[str]) -> bool:
+        """`content`, belgenin şu anki metni mi? Editörün modelinde bu bir kimlik karşılaştırmasıdır."""
+        if self._owns_document:
+            return content == self.document.text()
+        return self.document.is_text(content)
+
+    def _set_tokens(self, tokens: Optional[List[Tuple[Any, str]]],
+                    token_starts: Optional[List[int]] = None,
+                    stale: Tuple[int, int] = (0, sys.maxsize)) -> None:
+        """Güncel token'ları kaydeder; `stale` satırları ve renksiz çizilmiş satırlar yeniden hesaplanır."""
+        if tokens is self._tokens and not self._tokens_stale:
+            return
+        self._tokens_stale = False
+        self._invalidate_lines(*stale)
+        if self._plain_lines is not None:
+            self._invalidate_lines(*self._plain_lines)
+            self._plain_lines = None
+        if tokens is self._tokens:
+            return
+        self._tokens = tokens
+        if tokens is not None and token_starts is None:
+            token_starts = list(accumulate((len(text) for _, text in tokens), initial=0))
+        self._token_starts = token_starts
+
+    def _on_tokens_published(self) -> None:
+        """Önbelleğe yeni token'lar yayınlandığında bekleyen renklendirmeyi planlar."""
+        if self._highlight_pending:
+            self._schedule_update()
+
+    def _schedule_render(self) -> None:
+        """Aynı olay döngüsündeki çizim isteklerini tek bir çizimde birleştirir."""
+        if self._render_job is None:
+            try:
+                self._render_job = self.after_idle(self._render)
+            except tk.TclError:
+                pass
+
+    def _compute_top_line(self) -> int:
+        """Ana metnin kaydırma kesrine göre minimapin en üst satırını (0 tabanlı) bulur."""
+        total = self.document.line_count
+        rows = len(self._rows)
+        if total <= rows:
+            return 0
+        return max(0, min(int(self._fraction * total), total - rows))
+
+    def _render(self) -> None:
+        """Penceredeki satırların koşularını hesaplar ve sadece değişen bantları yeniden çizer."""
+        if self._render_job is not None:
+            try:
+                self.after_cancel(self._render_job)
+            except tk.TclError:
+                pass
+            self._render_job = None
+
+        rows = len(self._rows)
+        top = self._top_line = self._compute_top_line()
+        stale, self._stale_lines = self._stale_lines, None
+        if top != self._drawn_top:
+            first_row, last_row = 0, rows
+        elif stale is not None:
+            first_row, last_row = max(stale[0] - top, 0), min(stale[1] - top, rows)
+        else:
+            first_row = last_row = 0
+        self._drawn_top = top
+        first, last = top + first_row, min(top + last_row, self.document.line_count)
+        tokens = self._tokens
+        if self._tokens_stale:
+            tokens = None
+            if first < last:
+                self._plain_lines = _union(self._plain_lines, (first, last))
+        window = self._line_runs(first, last, tokens)
+
+        image = self._image.name
+        blank = self._blank.name
+        commands = []
+        for row in range(first_row, last_row):
+            index = row - first_row
+            line_runs = window[index] if index < len(window) else ()
+            if self._rows[row] == line_runs:
+                continue
+            self._rows[row] = line_runs
+            y = row * LINE_HEIGHT
+            # Bandı saydam yap, sonra koşuları boya
+            commands.append(
+                f"{image} copy {blank} -to 0 {y} {BITMAP_WIDTH} {y + LINE_HEIGHT} -compositingrule set")
+            for x1, x2, color in line_runs:
+                commands.append(f"{image} put {color} -to {x1} {y} {x2} {y + INK_HEIGHT}")
+        try:
+            if commands:
+                self.tk.eval("\n".join(commands))
+            self._update_viewport_indicator()
+        except tk.TclError:
+            pass
+
+    def _line_runs(self, first: int, last: int,
+                   tokens: Optional[List[Tuple[Any, str]]]) -> List[Tuple[Run, ...]]:
+        """[first, last) satırlarının (0 tabanlı) koşuları; sadece bu satırlar modelden okunur."""
+        if last <= first:
+            return []
+        text = self.document.get_lines(first + 1, last)
+        base = self.document.offset(first + 1) if tokens is not None else 0
+        starts = list(accumulate((len(line) + 1 for line in text.split("\n")[:-1]), initial=base))
+        return build_line_runs(text, starts, 0, len(starts), tokens, self._token_starts,
+                               self._token_color, self.fg, content_offset=base)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """Yükseklik değişince resmi pencereye göre yeniden boyutlandırır."""
+        rows = max(1, event.height // LINE_HEIGHT)
+        if rows == len(self._rows):
+            return
+        self._image.blank()
+        self._image.configure(height=rows * LINE_HEIGHT)
+        self._rows = [()] * rows
+        self._drawn_top = -1
+        self._schedule_render()
+
+    def on_scroll(self, *args: Any) -> None:
+        """
+        Ana metin düzenleyici kaydırıldığında çağrılan geri çağırma işlevi.
+        Minimap penceresini senkronize eder ve görünüm alanı göstergesini günceller.
+        """
+        self.yview_moveto(args[0])
+
+    def yview_moveto(self, fraction: Any) -> None:
+        """Minimap penceresini ana metnin kaydırma kesrine taşır."""
+        self._fraction = float(fraction)
+        self._schedule_render()
+
+    def _update_viewport_indicator(self) -> None:
+        """Kodun şu anda görünen kısmını göstermek için görünüm alanı dikdörtgenini taşır."""
+        try:
+            first = int(self.main_text.index("@0,0").split(".")[0])
+            height = self.main_text.winfo_height()
+            last = int(self.main_text.index(f"@0,{height}").split(".")[0])
+        except tk.TclError:
+            return
+        top = self._top_line
+        self.coords(self._viewport_item, 0, (first - 1 - top) * LINE_HEIGHT,
+                    BITMAP_WIDTH, (last - top) * LINE_HEIGHT)
+
+    def _line_at(self, y_coord: int) -> int:
+        """Y koordinatındaki satır numarasını (1 tabanlı, belgeyle sınırlı) döndürür."""
+        line = self._top_line + max(0, y_coord) // LINE_HEIGHT + 1
+        return min(line, self.document.line_count)
+
+    def _on_click(self, event: tk.Event) -> str:
+        """Tıklanan konumu merkeze alacak şekilde kaydırır."""
+        self._jump_to_position(event.y, center=True)
+        return "break"
+
+    def _on_drag(self, event: tk.Event) -> str:
+        """Sürükleme sırasında konumu günceller."""
+        self._jump_to_position(event.y, center=True)
+        return "break"
+
+    def _on_wheel(self, event: tk.Event) -> str:
+        """Tutarlı kaydırma sağlamak için fare tekerleği olaylarını ana metin düzenleyiciye iletir."""
+        if hasattr(event, "delta") and event.delta:
+            self.main_text.event_generate("<MouseWheel>", delta=event.delta)
+        elif event.num == 4:
+            self.main_text.event_generate("<Button-4>")
+        elif event.num == 5:
+            self.main_text.event_generate("<Button-5>")
+        return "break"
+
+    def _jump_to_position(self, y_coord: int, center: bool = True) -> None:
+        """
+        Verilen Y koordinatına göre ana düzenleyiciyi kaydırır.
+
+        Argümanlar:
+            y_coord: Tıklanan yerin Y piksel koordinatı
+            center: True ise, tıklanan satırı ekranın ortasına getirmeye çalışır.
+        """
+        try:
+            target_line = self._line_at(y_coord)
+            total_lines = self.document.line_count
+
+            if center:
+                # Görünür satır sayısını tahmin et
+                try:
+                    top_idx = self.main_text.index("@0,0")
+                    bottom_idx = self.main_text.index(f"@0,{self.main_text.winfo_height()}")
+                    visible_lines = float(bottom_idx) - float(top_idx)
+                except ValueError:
+                    visible_lines = 30.0  # Varsayılan değer
+
+                # Hedef satırı ortaya almak için üst satırı hesapla
+                top_line = max(1, target_line - (visible_lines / 2))
+                fraction = (top_line - 1) / total_lines
+            else:
+                fraction = (target_line - 1) / total_lines
+
+            self.main_text.yview_moveto(fraction)
+        except Exception:
+            pass
+
+    def _on_motion(self, event: tk.Event) -> None:
+        """Fare hareketi sırasında altındaki satırı vurgular."""
+        row = self._line_at(event.y) - 1 - self._top_line
+        self.coords(self._hover_item, 0, row * LINE_HEIGHT, BITMAP_WIDTH, (row + 1) * LINE_HEIGHT)
+        self.itemconfigure(self._hover_item, state="normal")
+
+    def _on_leave(self, event: tk.Event) -> None:
+        """Fare minimap'ten ayrıldığında vurguyu temizler."""
+        self.itemconfigure(self._hover_item, state="hidden")
+
+    def configure_colors(self, bg: str, fg: str) -> None:
+        """Minimap'in arka plan ve ön plan renklerini günceller."""
+        self.configure(bg=bg)
+        self.fg = fg
+        self._colors.clear()
+        self.itemconfigure(self._viewport_item, fill=calculate_viewport_color(self, bg))
+        self.itemconfigure(self._hover_item, fill=calculate_hover_color(self, bg))
+        self._drawn_top = -1  # Renkler değişti: tüm bantlar yeniden hesaplanır
+        self._schedule_render()
+
+    def set_lexer(self, lexer: Any) -> None:
+        """Sözdizimi lexer'ını ayarlar ve içeriği yeniler."""
+        self.current_lexer = lexer
+        self.update_content()
+
+    def update_style(self, style_name: str) -> None:
+        """Sözdizimi vurgulama stil şemasını günceller; renkleri değişen bantlar yeniden çizilir."""
+        self._load_style(style_name)
+        self.update_content()
@@ -2,10 +2,32 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
+import queue
+import re
+import threading
+import time
 from text_editor.config import FONT_FAMILY, FONT_SIZE
 from text_editor.utils.highlighter import SyntaxHighlighter
+from text_editor.utils.tokenizer import TokenCache
 from text_editor.utils.autocompleter import AutoCompleter
+from text_editor.utils.change_tracker import ChangeTracker
+from text_editor.utils.document_model import DocumentModel
+from text_editor.utils.file_loader import StreamingFileLoader
+from text_editor.utils.save_service import SaveService
+from text_editor.utils.recovery_journal import RecoveryJournal
+from text_editor.utils.undo_manager import UndoManager
+from text_editor.utils.line_transforms import apply_transform, changed_span
+from text_editor.utils.smart_indent import SmartIndenter
+from text_editor.utils.occurrence_finder import MAX_OCCURRENCES, compile_pattern, find_occurrences_async
+from text_editor.utils.shortcut_manager import ShortcutManager
+from text_editor.utils.encoding_detector import (
+    SAMPLE_SIZE, candidate_encodings, detect_encoding, detect_file_encoding, encoding_label,
+    normalize_fallbacks,
+)
+from text_editor.utils.event_bus import EditorEventBus, TIER_IMMEDIATE, TIER_FRAME, TIER_HIGHLIGHT
 from text_editor.ui.minimap import Minimap
+from text_editor.ui.bitmap_minimap import BitmapMinimap
+from text_editor.utils.settings_manager import SettingsManager
 from pygments.lexers import get_lexer_for_filename, get_lexer_by_name, TextLexer
 from text_editor.ui.line_numbers import LineNumbers
 # Clean Code: Feature Extentions
@@ -22,6 +44,13 @@ class CodeEditor(ctk.CTkFrame):
     Sözdizimi vurgulama, satır numaraları, minimap ve otomatik tamamlama
     özelliklerine sahip gelişmiş metin editörü bileşeni.
     """
+    STREAM_THRESHOLD = 1 * 1024 * 1024  # Bundan büyük dosyalar arka planda parça parça yüklenir
+    LOAD_SLICE_MS = 12  # Olay döngüsüne dönmeden önce parça eklemeye ayrılan süre
+    LOAD_POLL_MS = 5
+    SAVE_POLL_MS = 30
+    OCCURRENCE_POLL_MS = 10
+    INDENT_PRIME_MS = 20  # Girinti derinliği önbelleğinin boşta doldurulma aralığı
+
     def __init__(self, master, file_path=None, **kwargs):
         super().__init__(master, **kwargs)
         
@@ -30,9 +59,23 @@ class CodeEditor(ctk.CTkFrame):
         self.font_size = FONT_SIZE
         self.last_mtime = 0
         self.syntax_highlighting_enabled = True  # Büyük dosyalar için performans optimizasyonu
+        # Dosyanın tespit edilen kodlaması ve BOM'u; kaydederken aynen geri yazılır
+        self.encoding = "utf-8"
+        self.bom = False
         
         # Çoklu imleç desteği
         self.multi_cursor_mode = False  # Çoklu imleç modunda mıyız? (cursor_manager tarafından güncellenir)
+
+        # Arka planda süren dosya yüklemesi (StreamingFileLoader) ve ekleme zamanlayıcısı
+        self._loader = None
+        self._load_job = None
+        self._load_callbacks = []  # Yükleme bitince çağrılacaklar (when_loaded)
+        self._indent_prime_job = None  # SmartIndenter blok toplamlarını boşta dolduran zamanlayıcı
+
+        # Arka planda süren "tüm eşleşmeleri seç" araması
+        self._occurrence_results = queue.Queue()
+        self._occurrence_cancel = None
+        self._occurrence_job = None
         
         # Yerleşimi yapılandır
         self.grid_columnconfigure(0, weight=0) # Satır numaraları
@@ -42,12 +85,26 @@ class CodeEditor(ctk.CTkFrame):
 
         # Metin Alanı (Daha iyi etiket desteği için standart tk.Text kullanılıyor)
         # Bir çerçeveye mi saracağız yoksa doğrudan mı yerleştireceğiz? Doğrudan ızgaraya yerleştiriliyor.
-        self.text_area = tk.Text(self, wrap="none", undo=True, font=(FONT_FAMILY, self.font_size),
+        # Geri alma Tk yerine UndoManager ile yapılır (aşağıda)
+        self.text_area = tk.Text(self, wrap="none", undo=False, font=(FONT_FAMILY, self.font_size),
                                  bd=0, highlightthickness=0, padx=5, pady=5)
         self.text_area.grid(row=0, column=1, sticky="nsew")
 
+        # Tüm içerik değişiklikleri (yazma, yapıştırma, geri alma, programatik) bu vekilden yayınlanır
+        self.change_tracker = ChangeTracker(self.text_area)
+        # Belgenin Python tarafındaki aynası; okuyucular widget'tan tüm tamponu kopyalamaz.
+        # Diğer dinleyicilerden önce güncellenmesi için ilk dinleyici olarak kaydedilir.
+        self.document = DocumentModel(self.change_tracker)
+        # Değişiklik patlamalarını gecikme katmanlarına göre tek bildirimde birleştiren olay yolu
+        self.events = EditorEventBus(self.text_area)
+        self.change_tracker.add_listener(self.events.publish)
+        # Farklara dayalı geri alma geçmişi (işlem gruplama, yazma birleştirme, bellek sınırı)
+        self.undo = UndoManager(self.text_area, self.change_tracker)
+        # Dile duyarlı otomatik girinti; önceki satırların parantez derinliğini önbellekte tutar
+        self.indenter = SmartIndenter(self.document, self.change_tracker)
+
         # Satır Numaraları
-        self.line_numbers = LineNumbers(self, self.text_area) # text_widget'ı doğrudan geçir
+        self.line_numbers = LineNumbers(self, self.text_area, document=self.document) # text_widget'ı doğrudan geçir
         self.line_numbers.grid(row=0, column=0, sticky="ns")
         
         # LineNumbers'ı bağla (__init__ içinde zaten yapıldı, ancak referans için gerekirse saklayın veya kaldırın)
@@ -57,17 +114,21 @@ class CodeEditor(ctk.CTkFrame):
         self.scrollbar_y = ctk.CTkScrollbar(self, command=self.on_scroll_y)
         self.scrollbar_y.grid(row=0, column=2, sticky="ns")
         
-        # Minimap
-        self.minimap = Minimap(self, self.text_area)
+        # Vurgulayıcı ve minimap arasında paylaşılan token önbelleği (belge tek sefer lexlenir)
+        self.token_cache = TokenCache()
+
+        # Minimap ("bitmap": Canvas üzerine renk blokları, "text": küçültülmüş metin kopyası)
+        minimap_class = (BitmapMinimap if SettingsManager.get_instance().get("minimap_mode") == "bitmap"
+                         else Minimap)
+        self.minimap = minimap_class(self, self.text_area, token_cache=self.token_cache,
+                                      document=self.document)
         self.minimap.grid(row=0, column=3, sticky="ns")
         
         self.scrollbar_x = ctk.CTkScrollbar(self, command=self.text_area.xview, orientation="horizontal")
         self.scrollbar_x.grid(row=1, column=1, sticky="ew")
         
         self.text_area.configure(yscrollcommand=self.on_text_scroll, xscrollcommand=self.scrollbar_x.set)
-        # Sadece ana metin alanı kaydırıldığında satır numaralarını hareket ettir (Tek yönlü senkronizasyon)
-        # Bu, satır numaraları her yenilendiğinde (delete/insert) ana pencerenin yukarı zıplamasını önler.
-        self.line_numbers.configure(yscrollcommand=None)
+        # Satır numaraları kendi kaydırma durumunu tutmaz; ana metin kaydırıldıkça görünen satırları yeniden çizer
         
         # Fare tekerleği olaylarını satır numaralarından ana metne ilet
         self.line_numbers.bind("<MouseWheel>", self.on_line_numbers_wheel)
@@ -78,14 +139,16 @@ class CodeEditor(ctk.CTkFrame):
         # Editörün ana metin alanı ile satır numaraları ve minimap arasındaki
         # kaydırma senkronizasyonunu sağlar.
 
-        # Sözdizimi Vurgulayıcı
-        self.highlighter = SyntaxHighlighter(self.text_area)
+        # Sözdizimi Vurgulayıcı (lexing arka plan iş parçacığında yapılır)
+        self.highlighter = SyntaxHighlighter(self.text_area, background=True, token_cache=self.token_cache,
+                                             document=self.document)
+        self.text_area.bind("<Destroy>", lambda e: self.highlighter.close(), add="+")
         
         # Otomatik Tamamlayıcı
-        self.completer = AutoCompleter(self.text_area)
+        self.completer = AutoCompleter(self.text_area, change_tracker=self.change_tracker,
+                                       document=self.document)
         
         # Olaylar
-        self.text_area.bind("<<Change>>", self.on_content_change)
         self.text_area.bind("<KeyRelease>", self.on_key_release)
         self.text_area.bind("<Key>", self.on_key_press)
         self.text_area.bind("<ButtonRelease-1>", self.on_click)
@@ -98,6 +161,7 @@ class CodeEditor(ctk.CTkFrame):
         # Çoklu İmleç Olayları
         self.text_area.bind("<Alt-Button-1>", self.add_cursor_at_click)  # Alt+Click ile imleç ekle
         self.text_area.bind("<Control-d>", self.select_next_occurrence)  # Ctrl+D ile kelime seç
+        self.text_area.bind("<Alt-F3>", self.select_all_occurrences)  # Tüm eşleşmeleri seç
         self.text_area.bind("<Escape>", self.clear_extra_cursors)  # Escape ile imlçleri temizle
         
         # Satır İşlemleri Kısayolları
@@ -106,10 +170,32 @@ class CodeEditor(ctk.CTkFrame):
         self.text_area.bind("<Alt-Down>", self.move_line_down)  # Satırı aşağı taşı
         self.text_area.bind("<Control-Shift-K>", self.delete_line)  # Satırı sil
         self.text_area.bind("<Control-j>", self.join_lines)  # Satırları birleştir
+        self.text_area.bind("<F9>", self.sort_selected_lines)  # Seçili satırları sırala
+        self.text_area.bind("<Control-Shift-bracketleft>", self.fold_all)  # Tümünü katla
+        self.text_area.bind("<Control-Shift-bracketright>", self.unfold_all)  # Tüm katlamaları aç
+
+        # Geri Al / Yinele (menüdeki <<Undo>>/<<Redo>> olayları ve kısayollar)
+        shortcuts = ShortcutManager.get_instance()
+        for sequence in ("<<Undo>>", shortcuts.get("undo")):
+            if sequence:
+                self.text_area.bind(sequence, self.undo_edit)
+        for sequence in ("<<Redo>>", shortcuts.get("redo")):
+            if sequence:
+                self.text_area.bind(sequence, self.redo_edit)
 
         # Özellik Yöneticileri
         self.code_folder = CodeFolder(self)
         self.cursor_manager = MultiCursorManager(self)
+        self.change_tracker.add_listener(self._on_text_change)
+        self.events.subscribe(self._on_cursor_tier, TIER_IMMEDIATE)
+        self.events.subscribe(self._on_frame_tier, TIER_FRAME)
+        self.events.subscribe(self._on_highlight_tier, TIER_HIGHLIGHT)
+        # Kaydedilmemiş değişiklikler için çökme kurtarma günlüğü (auto_backup)
+        self.journal = RecoveryJournal.get_instance().open_buffer(self)
+        self.text_area.bind("<Destroy>", lambda e: self.events.close(), add="+")
+        self.text_area.bind("<Destroy>", lambda e: self._stop_loader(), add="+")
+        self.text_area.bind("<Destroy>", lambda e: self._cancel_occurrence_search(), add="+")
+        self.text_area.bind("<Destroy>", lambda e: self.journal.close(), add="+")
         
         # İlk Kurulum
         if file_path:
@@ -126,6 +212,9 @@ class CodeEditor(ctk.CTkFrame):
             
         lexer = self.highlighter.set_lexer_from_filename(filename)
         self.minimap.set_lexer(lexer)
+        if lexer:
+            self.indenter.set_language(lexer.name)
+            self._schedule_indent_prime()
         if lexer and self.completer:
             self.completer.set_language(lexer.name)
             
@@ -135,6 +224,9 @@ class CodeEditor(ctk.CTkFrame):
             
         lexer = self.highlighter.set_lexer_by_name(name)
         self.minimap.set_lexer(lexer)
+        if lexer:
+            self.indenter.set_language(lexer.name)
+            self._schedule_indent_prime()
         if lexer and self.completer:
             self.completer.set_language(lexer.name)
 
@@ -144,6 +236,8 @@ class CodeEditor(ctk.CTkFrame):
         akıllı girinti, parantez kapatma) uygular.
         Çoklu imleç modunda ise tüm imlçlere aynı işlemi uygular.
         """
+        self.events.record_keystroke()
+
         # Çoklu imleç modunda yazı yazma
         if self.cursor_manager.active:
             if event.char and not event.state & 0x4:  # Ctrl tuşu basılı değilse
@@ -162,9 +256,19 @@ class CodeEditor(ctk.CTkFrame):
             res = self.completer.handle_key(event)
             if res == "break":
                 return "break"
+
+        # Birden çok satır seçiliyken Tab / Shift+Tab seçili satırların girintisini değiştirir
+        if event.keysym in ("Tab", "ISO_Left_Tab"):
+            outdent = event.keysym == "ISO_Left_Tab" or bool(event.state & 0x1)
+            if outdent or self._selection_spans_lines():
+                return self.transform_lines("outdent" if outdent else "indent")
             
-        # Parantezleri otomatik kapatma
+        # Kapanış parantezi / blok anahtar kelimesi yazılırken satırın girintisi düzeltilir
         char = event.char
+        if char and char in ")]}:":
+            self._reindent_on_close(char)
+
+        # Parantezleri otomatik kapatma
         pairs = {
             '(': ')',
             '{': '}',
@@ -177,33 +281,75 @@ class CodeEditor(ctk.CTkFrame):
             self.text_area.insert("insert", pairs[char])
             self.text_area.mark_set("insert", "insert-1c")
             
-        # Akıllı Girinti
-        if event.keysym == "Return":
-            # Mevcut satırı al
-            current_idx = self.text_area.index("insert")
-            line_idx = current_idx.split('.')[0]
-            line_text = self.text_area.get(f"{line_idx}.0", "end-1c") # tüm satırı al
-            
-            # Basit girinti: önceki satır boşluklarıyla eşleştir
-            indent = ""
-            for char in line_text:
-                if char in [' ', '\t']:
-                    indent += char
-                else:
-                    break
-            
-            # Eğer : ile bitiyorsa ekstra girinti (Python'a özgü, ancak yeterince genel)
-            if line_text.strip().endswith(":"):
-                indent += "    "
-            
-            # Önce varsayılan enter işleminin yapılmasına izin verilsin mi? Hayır, araya girmemiz gerek
-            self.text_area.after(1, lambda: self.text_area.insert("insert", indent))
+        # Akıllı Girinti: yeni satır ve girintisi tek düzenlemede eklenir
+        if event.keysym in ("Return", "KP_Enter"):
+            return self.insert_newline()
 
-    def on_content_change(self, event=None):
-        self.content_modified = True
-        self.update_line_numbers()
+    def _tab_size(self):
+        try:
+            return max(1, int(SettingsManager.get_instance().get("tab_size", 4) or 4))
+        except (TypeError, ValueError):
+            return 4
+
+    def insert_newline(self, event=None):
+        """
+        Enter: seçimi (varsa) ve imleçten sonraki boşlukları yeni satır + girintiyle tek bir
+        `replace` çağrısında değiştirir. Girinti SmartIndenter'dan gelir; sadece imleçteki satır
+        okunur.
+        """
+        text = self.text_area
+        if text.tag_ranges("sel"):
+            start, end = text.index("sel.first"), text.index("sel.last")
+        else:
+            start = end = text.index("insert")
+        line, col = map(int, start.split('.'))
+        end_line, end_col = map(int, end.split('.'))
+        before = self.document.line(line)[:col]
+        after = self.document.line(end_line)[end_col:]
+        inserted, caret, consumed = self.indenter.newline(line, before, after, " " * self._tab_size())
+        text.replace(start, f"{end_line}.{end_col + consumed}", inserted)
+        text.mark_set("insert", f"{start}+{caret}c")
+        text.see("insert")
+        return "break"
+
+    def _reindent_on_close(self, char):
+        """Kapanış parantezi veya blok anahtar kelimesinden sonraki ":" için satırı geri çeker."""
+        if self.text_area.tag_ranges("sel"):
+            return
+        line, col = map(int, self.text_area.index("insert").split('.'))
+        before = self.document.line(line)[:col]
+        indent = self.indenter.closing_indent(line, before, char, " " * self._tab_size())
+        if indent is None:
+            return
+        current = len(before) - len(before.lstrip(" \t"))
+        self.text_area.replace(f"{line}.0", f"{line}.{current}", indent)
+
+    def _on_text_change(self, change):
+        """
+        ChangeTracker dinleyicisi: her düzenlemeden hemen sonra çağrılır.
+        Sadece ucuz defter tutma yapılır; görünüm güncellemeleri olay yolu katmanlarındadır.
+        Akışlı yükleme sürerken eklenen parçalar kullanıcı değişikliği sayılmaz.
+        """
+        self.code_folder.on_change(change)
+        if self._loader is None:
+            self.content_modified = True
+
+    def _on_cursor_tier(self, changes):
         self.update_status_bar()
 
+    def _on_frame_tier(self, changes):
+        """Kare başına bir kez: satır numaraları ve minimap'e biriken satır aralıkları."""
+        self.update_line_numbers()
+        for change in changes:
+            self.minimap.notify_edit(change.start_line, change.old_end_line, change.new_end_line)
+        if self.cursor_manager.active:
+            self.cursor_manager.update_visuals()
+
+    def _on_highlight_tier(self, changes):
+        """Yazma duraksayınca: değişen bölge artımlı olarak yeniden vurgulanır."""
+        if self.syntax_highlighting_enabled:
+            self.highlighter.highlight_incremental()
+
     def update_line_numbers(self):
         self.line_numbers.redraw()
         
@@ -213,8 +359,14 @@ class CodeEditor(ctk.CTkFrame):
 
     def on_text_scroll(self, *args):
         self.scrollbar_y.set(*args)
-        self.line_numbers.yview_moveto(args[0])
+        self.line_numbers.redraw()
         self.minimap.on_scroll(*args)
+        # Ek imleçler sadece görünür alanda çizilir
+        if self.cursor_manager.active:
+            self.cursor_manager.update_visuals()
+        # Büyük dosyalarda vurgulama kapsamını görünür alana göre tembel olarak genişlet
+        if self.syntax_highlighting_enabled and self.highlighter.viewport_mode:
+            self.highlighter.highlight_visible()
 
     def on_line_numbers_wheel(self, event):
         """Satır numaraları üzerindeki fare tekerleği hareketini ana metne iletir."""
@@ -230,28 +382,13 @@ class CodeEditor(ctk.CTkFrame):
         """Bu yöntem artık doğrudan yscrollcommand olarak kullanılmıyor, ancak gerekirse manuel çağrılabilir."""
         self.text_area.yview_moveto(args[0])
         self.scrollbar_y.set(*args)
+        self.line_numbers.redraw()
         self.minimap.yview_moveto(args[0])
 
     def on_key_release(self, event=None):
-        if event and event.keysym not in ["Control_L", "Control_R", "Shift_L", "Shift_R", "Alt_L", "Alt_R"]:
-            self.content_modified = True
-            if self.syntax_highlighting_enabled:
-                self.minimap.update_content()
-            
-        # Sadece satır sayısı değiştiyse satır numaralarını güncelle
-        current_line_count = int(self.text_area.index("end-1c").split('.')[0])
-        if not hasattr(self, '_last_line_count') or self._last_line_count != current_line_count:
-            self._last_line_count = current_line_count
-            self.update_line_numbers()
-            
+        # İçerik değişiklikleri olay yolu (self.events) katmanlarından gelir; otomatik tamamlayıcı
+        # <KeyRelease>'i kendisi dinler
         self.update_status_bar()
-        if event and event.keysym in ["Return", "BackSpace", "Delete", "space"]:
-             if self.syntax_highlighting_enabled:
-                self.highlighter.highlight()
-             
-        # Otomatik tamamlama olayını tetikle
-        if self.completer and event and self.syntax_highlighting_enabled:
-            self.completer.on_key_release(event)
 
     def on_click(self, event):
         if self.syntax_highlighting_enabled:
@@ -262,7 +399,7 @@ class CodeEditor(ctk.CTkFrame):
             line, col = index.split('.')
             
             # Toplam satır sayısını al
-            total_lines = int(self.text_area.index("end-1c").split('.')[0])
+            total_lines = self.document.line_count
             
             main_window = self.winfo_toplevel()
             if hasattr(main_window, 'status_bar'):
@@ -279,73 +416,96 @@ class CodeEditor(ctk.CTkFrame):
                     
                     main_window.status_bar.set_file_info(
                         file_info["type"], 
-                        "UTF-8"
+                        encoding_label(self.encoding, self.bom)
                     )
         except:
             pass
 
     def load_file(self, file_path):
-        """Belirtilen yoldaki dosyayı okur ve editöre yükler."""
-        encodings = ['utf-8', 'cp1254', 'cp1252', 'latin-1']
+        """
+        Belirtilen yoldaki dosyayı okur ve editöre yükler.
+
+        Küçük dosyalar bir kerede okunur. STREAM_THRESHOLD'dan büyük dosyalar arka planda
+        parça parça çözülür ve metin alanına zaman dilimli `after` gruplarıyla eklenir;
+        ilerleme durum çubuğunda gösterilir ve Esc ile iptal edilebilir. Yükleme geri alma
+        yığınına kayıt eklemez.
+
+        Kodlama, dosyanın başındaki en fazla SAMPLE_SIZE baytlık örnekten tespit edilir (BOM,
+        UTF-8 doğrulaması, ardından ayarlardaki `fallback_encodings` kod sayfaları) ve
+        kaydederken kullanılmak üzere editörde saklanır.
+        """
+        fallbacks = normalize_fallbacks(SettingsManager.get_instance().get("fallback_encodings"))
+        self._stop_loader()
         
         # Dosya boyutu kontrolü
         try:
             file_size = os.path.getsize(file_path)
             
-            # Limitler (1MB ve 10MB)
+            # Limitler (1MB ve ayarlardaki max_file_size, varsayılan 10MB)
             HIGHLIGHT_LIMIT = 1 * 1024 * 1024 # 1 MB
-            HARD_LIMIT = 10 * 1024 * 1024 # 10 MB
+            limit_mb = SettingsManager.get_instance().get("max_file_size", 10)
+            HARD_LIMIT = int(limit_mb * 1024 * 1024)
             
-            if file_size > HIGHLIGHT_LIMIT:
-                self.syntax_highlighting_enabled = False
-            else:
-                self.syntax_highlighting_enabled = True
+            # Büyük dosyalarda vurgulama kapatılmaz, sadece görünür alanla sınırlandırılır
+            self.syntax_highlighting_enabled = True
+            self.highlighter.set_viewport_mode(file_size > HIGHLIGHT_LIMIT)
                 
             read_size = -1 # Tümünü oku
             if file_size > HARD_LIMIT:
-                if messagebox.askyesno("Büyük Dosya", "Bu dosya çok büyük (>10MB). Performans sorunlarını önlemek için sadece ilk 10MB yüklensin mi?\n(Hayır derseniz tamamı yüklenmeye çalışılacak fakat uygulama donabilir.)"):
+                if messagebox.askyesno("Büyük Dosya", f"Bu dosya çok büyük (>{limit_mb}MB). Performans sorunlarını önlemek için sadece ilk {limit_mb}MB yüklensin mi?\n(Hayır derseniz tamamı arka planda yüklenir; yükleme Esc ile iptal edilebilir.)"):
                     read_size = HARD_LIMIT
             
         except OSError:
             file_size = 0
+            read_size = -1
+
+        if file_size > self.STREAM_THRESHOLD:
+            try:
+                detected = detect_file_encoding(file_path, fallbacks)
+            except OSError as e:
+                print(f"Error loading file: {e}")
+                messagebox.showerror("Hata", f"Dosya açılamadı: {e}")
+                return
+            self._begin_load()
+            self.text_area.configure(state="disabled")  # Yükleme sürerken kullanıcı düzenlemesi yok
+            self.bom = detected.bom_length > 0
+            self._loader = StreamingFileLoader(file_path, candidate_encodings(detected, fallbacks),
+                                               read_size, offset=detected.bom_length)
+            self._loader.start()
+            self._set_status(f"Yükleniyor: {os.path.basename(file_path)} (İptal: Esc)", "working")
+            self._load_job = self.after(self.LOAD_POLL_MS, self._pump_load, file_path)
+            return
             
         content = None
         last_error = None
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read(read_size)
-                break
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                last_error = e
+
+        # Dosya bir kez okunur; kodlamalar bellekteki baytlar üzerinde denenir
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            data = None
+            last_error = e
+
+        if data is not None:
+            detected = detect_encoding(data[:SAMPLE_SIZE], fallbacks, complete=len(data) <= SAMPLE_SIZE)
+            # Değiştirilmeden kaydedilen dosya yeniden yazılmaz
+            SaveService.get_instance().remember(file_path, data)
+            body = data[detected.bom_length:]
+            for encoding in candidate_encodings(detected, fallbacks):
+                try:
+                    content = body.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
+                except UnicodeDecodeError:
+                    continue
+                self.encoding = encoding
+                self.bom = detected.bom_length > 0
                 break
         
         if content is not None:
             try:
-                self.text_area.delete('1.0', 'end')
+                self._begin_load()
                 self.text_area.insert('1.0', content)
-                self.update_line_numbers()
-                
-                if self.syntax_highlighting_enabled:
-                    self.minimap.update_content()
-                    self.highlighter.highlight()
-                else:
-                    # Uyarı ver
-                    main_window = self.winfo_toplevel()
-                    if hasattr(main_window, 'status_bar'):
-                        main_window.status_bar.set_message("Büyük dosya: Sözdizimi vurgulama devre dışı bırakıldı.", "warning")
-                
-                self.content_modified = False
-                
-                # Son değişiklik zamanını kaydet
-                try:
-                    self.last_mtime = os.path.getmtime(file_path)
-                except OSError:
-                    self.last_mtime = 0
-                    
+                self._finish_load(file_path)
             except Exception as e:
                 print(f"Error updating editor content: {e}")
                 messagebox.showerror("Error", f"Could not update editor content: {e}")
@@ -354,26 +514,201 @@ class CodeEditor(ctk.CTkFrame):
             print(f"Error loading file: {final_error}")
             messagebox.showerror("Hata", f"Dosya açılamadı: {final_error}")
 
-    def save_file(self):
-        """Editördeki içeriği mevcut dosya yoluna kaydeder."""
-        if self.file_path:
+    def _begin_load(self):
+        """Metin alanını boşaltır; yükleme süresince geri alma ve kurtarma kaydı tutulmaz."""
+        self.journal.suspend()
+        self.undo.suspend()
+        self.text_area.configure(state="normal")
+        self.text_area.delete('1.0', 'end')
+
+    def _finish_load(self, file_path):
+        """Yüklemeyi tamamlar: geri alma yığını sıfırlanır, vurgulama ve durum güncellenir."""
+        self.text_area.configure(state="normal")
+        self.undo.reset()
+        self.journal.mark_clean()
+        self.update_line_numbers()
+        
+        if self.syntax_highlighting_enabled:
+            self.highlighter.refresh()
+            
+        if self.highlighter.viewport_mode:
+            # Bilgi ver
+            self._set_status("Büyük dosya: Sözdizimi vurgulama sadece görünür alana uygulanıyor.", "info")
+        
+        self.content_modified = False
+        
+        # Son değişiklik zamanını kaydet
+        try:
+            self.last_mtime = os.path.getmtime(file_path)
+        except OSError:
+            self.last_mtime = 0
+
+        callbacks, self._load_callbacks = self._load_callbacks, []
+        for callback in callbacks:
+            callback()
+        self._schedule_indent_prime()
+
+    def _schedule_indent_prime(self):
+        """
+        Girinti derinliği bloklarını boşta, dilim dilim sayar; böylece büyük dosyada ilk Enter
+        imlecin üstündeki tüm satırları saymak zorunda kalmaz.
+        """
+        if self._indent_prime_job is None:
+            self._indent_prime_job = self.after(self.INDENT_PRIME_MS, self._prime_indenter)
+
+    def _prime_indenter(self):
+        self._indent_prime_job = None
+        if self._loader is None and not self.indenter.prime():
+            self._schedule_indent_prime()
+
+    def _pump_load(self, file_path):
+        """
+        Yükleyicinin kuyruğundaki parçaları LOAD_SLICE_MS süresince metin alanına ekler,
+        ardından olay döngüsüne dönüp bir sonraki dilimi planlar.
+        """
+        self._load_job = None
+        loader = self._loader
+        if loader is None:
+            return
+        deadline = time.perf_counter() + self.LOAD_SLICE_MS / 1000
+        progress = None
+        self.text_area.configure(state="normal")
+        try:
+            while time.perf_counter() < deadline:
+                messages = loader.poll()
+                if not messages:
+                    break
+                kind, *payload = messages[0]
+                if kind == "data":
+                    self.text_area.insert("end-1c", payload[0])
+                elif kind == "progress":
+                    progress = payload
+                elif kind == "reset":
+                    self.text_area.delete("1.0", "end")
+                elif kind == "done":
+                    self._loader = None
+                    self.encoding = payload[0]
+                    self._finish_load(file_path)
+                    self._set_status(f"Yüklendi: {os.path.basename(file_path)}", "success")
+                    return
+                elif kind == "error":
+                    self.cancel_load(message=None)
+                    print(f"Error loading file: {payload[0]}")
+                    messagebox.showerror("Hata", f"Dosya açılamadı: {payload[0]}")
+                    return
+        finally:
+            if self._loader is loader:
+                self.text_area.configure(state="disabled")
+
+        if progress is not None:
+            read, total = progress
+            percent = int(read * 100 / total) if total else 100
+            self._set_status(f"Yükleniyor: {os.path.basename(file_path)} %{percent} (İptal: Esc)", "working")
+        self._load_job = self.after(self.LOAD_POLL_MS, self._pump_load, file_path)
+
+    @property
+    def is_loading(self):
+        """Dosya hâlâ arka planda yükleniyor mu? Bu sürede belge kaydedilemez."""
+        return self._loader is not None
+
+    def when_loaded(self, callback):
+        """
+        `callback` yükleme tamamlanınca çağrılır; süren yükleme yoksa hemen çağrılır.
+        Yükleme iptal edilir veya başarısız olursa hiç çağrılmaz.
+        """
+        if self.is_loading:
+            self._load_callbacks.append(callback)
+        else:
+            callback()
+
+    def _stop_loader(self):
+        """Süren arka plan yüklemesini durdurur; metin alanına dokunmaz. Yükleme varsa True döner."""
+        if self._load_job is not None:
             try:
-                content = self.text_area.get('1.0', 'end-1c') # Sondaki fazladan yeni satırı alma
-                with open(self.file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                self.content_modified = False
-                
-                # Son değişiklik zamanını güncelle
-                try:
-                    self.last_mtime = os.path.getmtime(self.file_path)
-                except OSError:
-                    pass
-                    
-                return True
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not save file: {e}")
-                return False
-        return False
+                self.after_cancel(self._load_job)
+            except tk.TclError:
+                pass
+            self._load_job = None
+        loader, self._loader = self._loader, None
+        if loader is not None:
+            loader.cancel()
+            self._load_callbacks = []
+        return loader is not None
+
+    def cancel_load(self, message="Yükleme iptal edildi."):
+        """
+        Süren yüklemeyi iptal eder. Yarım yüklenmiş içerik kaydedilip dosyanın üzerine
+        yazılmasın diye metin alanı boşaltılır ve dosya yolu unutulur.
+        """
+        if not self._stop_loader():
+            return False
+        self.text_area.configure(state="normal")
+        self.text_area.delete('1.0', 'end')
+        self.undo.reset()
+        self.journal.mark_clean()
+        self.file_path = None
+        self.content_modified = False
+        if message:
+            self._set_status(message, "warning")
+        return True
+
+    def _set_status(self, message, status="info"):
+        main_window = self.winfo_toplevel()
+        if hasattr(main_window, 'status_bar'):
+            main_window.status_bar.set_message(message, status)
+
+    def save_file(self, on_complete=None):
+        """
+        Editördeki içeriği mevcut dosya yoluna kaydeder.
+
+        İçeriğin anlık görüntüsü alınır ve SaveService ile arka planda atomik olarak yazılır
+        (geçici dosya + fsync + os.replace); yazma sürerken arayüz yanıt vermeye devam eder.
+        Kayıt sıraya konduysa True döner. Yazma bitince `on_complete(result)` (SaveResult)
+        çağrılır; başarı/hata bildirimi çağırana aittir. `on_complete` verilmezse hata burada
+        gösterilir. Hata durumunda belge yeniden değiştirilmiş sayılır.
+
+        Yükleme sürerken kayıt reddedilir: yarım yüklenmiş içerik dosyanın üzerine yazılmaz.
+        """
+        if not self.file_path:
+            return False
+        if self.is_loading:
+            self._set_status("Dosya hâlâ yükleniyor; yükleme bitmeden kaydedilemez.", "warning")
+            return False
+        future = SaveService.get_instance().save(self.file_path, self.document.text(),
+                                                 self.encoding, self.bom)
+        self.content_modified = False
+        self._poll_save(future, self.document.version, on_complete)
+        return True
+
+    def _poll_save(self, future, version, on_complete=None):
+        """Arka plandaki kaydın sonucunu bekler, editör durumunu günceller ve `on_complete`'i çağırır."""
+        if not future.done():
+            self.after(self.SAVE_POLL_MS, self._poll_save, future, version, on_complete)
+            return
+        result = future.result()
+        try:
+            if not self.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        if not result.ok:
+            self.content_modified = True
+            if on_complete is not None:
+                on_complete(result)
+            else:
+                messagebox.showerror("Error", f"Could not save file: {result.error}")
+            return
+        if result.encoding != self.encoding:
+            # Yeni eklenen karakterler dosyanın kod sayfasında yoktu; dosya UTF-8 olarak yazıldı
+            self._set_status(f"{encoding_label(self.encoding)} bazı karakterleri desteklemiyor; dosya UTF-8 olarak kaydedildi.", "warning")
+        self.encoding, self.bom = result.encoding, result.bom
+        # Son değişiklik zamanını güncelle (dosya izleyicisi kendi kaydımızı harici değişiklik saymaz)
+        self.last_mtime = result.mtime
+        if self.document.version == version:
+            # Kayıttan sonra düzenleme yapılmadı; kurtarma günlüğüne gerek kalmadı
+            self.journal.mark_clean()
+        if on_complete is not None:
+            on_complete(result)
 
     def on_zoom(self, event):
         if event.delta > 0:
@@ -392,8 +727,8 @@ class CodeEditor(ctk.CTkFrame):
             self.line_numbers.configure(font=new_font)
 
     def on_scroll_y(self, *args):
+        # Satır numaraları on_text_scroll (yscrollcommand) üzerinden yeniden çizilir
         self.text_area.yview(*args)
-        self.line_numbers.yview(*args)
 
     # === Görünüm Ayarları ===
     
@@ -512,6 +847,28 @@ class CodeEditor(ctk.CTkFrame):
     def toggle_fold(self, line_num):
         self.code_folder.toggle_fold(line_num)
 
+    def fold_all(self, event=None):
+        """Tüm blokları katlar. Kısayol: Ctrl+Shift+["""
+        self.code_folder.fold_all()
+        return "break"
+
+    def unfold_all(self, event=None):
+        """Tüm katlamaları açar. Kısayol: Ctrl+Shift+]"""
+        self.code_folder.unfold_all()
+        return "break"
+
+
+    # === Geri Alma ===
+
+    def undo_edit(self, event=None):
+        """Son düzenleme adımını geri alır. Kısayol: Ctrl+Z"""
+        self.undo.undo()
+        return "break"
+
+    def redo_edit(self, event=None):
+        """Geri alınan son adımı yineler. Kısayol: Ctrl+Y"""
+        self.undo.redo()
+        return "break"
 
     # === Çoklu İmleç İşlevleri ===
     
@@ -519,6 +876,9 @@ class CodeEditor(ctk.CTkFrame):
         return self.cursor_manager.add_cursor_at_click(event)
     
     def clear_extra_cursors(self, event=None):
+        # Esc, süren bir dosya yüklemesini de iptal eder
+        if self.cancel_load():
+            return "break"
         return self.cursor_manager.clear_cursors(event)
     
     def update_cursor_visuals(self):
@@ -553,12 +913,6 @@ class CodeEditor(ctk.CTkFrame):
             # Satır sonunu ekle ve kopyalanan metni yapıştır
             self.text_area.insert(end_idx, "\n" + selected_lines)
             
-            # İçerik değişikliğini bildir
-            self.content_modified = True
-            self.update_line_numbers()
-            self.highlighter.highlight()
-            self.minimap.update_content()
-            
         except Exception as e:
             print(f"Satır çoğaltma hatası: {e}")
         
@@ -588,26 +942,14 @@ class CodeEditor(ctk.CTkFrame):
                 start_line = current_line
                 end_line = current_line
             
-            # Taşınacak satırları al
-            lines_text = self.text_area.get(f"{start_line}.0", f"{end_line}.end")
-            
-            # Üst satırı al
-            upper_line_text = self.text_area.get(f"{start_line - 1}.0", f"{start_line - 1}.end")
-            
-            # Satırları değiştir
-            self.text_area.delete(f"{start_line - 1}.0", f"{end_line}.end")
-            self.text_area.insert(f"{start_line - 1}.0", lines_text + "\n" + upper_line_text)
+            # Üst satır ve taşınacak satırlar tek bir replace ile yer değiştirir
+            lines = self.document.get_lines(start_line - 1, end_line).split("\n")
+            self._replace_lines(start_line - 1, lines, lines[1:] + lines[:1])
             
             # İmleci yeni pozisyona taşı
             col = current_pos.split('.')[1]
             self.text_area.mark_set("insert", f"{current_line - 1}.{col}")
             
-            # İçerik değişikliğini bildir
-            self.content_modified = True
-            self.update_line_numbers()
-            self.highlighter.highlight()
-            self.minimap.update_content()
-            
         except Exception as e:
             print(f"Satır yukarı taşıma hatası: {e}")
         
@@ -622,7 +964,7 @@ class CodeEditor(ctk.CTkFrame):
             # Mevcut satır bilgisini al
             current_pos = self.text_area.index("insert")
             current_line = int(current_pos.split('.')[0])
-            total_lines = int(self.text_area.index("end-1c").split('.')[0])
+            total_lines = self.document.line_count
             
             # Son satırsa taşıyamayız
             if current_line >= total_lines:
@@ -638,26 +980,14 @@ class CodeEditor(ctk.CTkFrame):
                 start_line = current_line
                 end_line = current_line
             
-            # Taşınacak satırları al
-            lines_text = self.text_area.get(f"{start_line}.0", f"{end_line}.end")
-            
-            # Alt satırı al
-            lower_line_text = self.text_area.get(f"{end_line + 1}.0", f"{end_line + 1}.end")
-            
-            # Satırları değiştir
-            self.text_area.delete(f"{start_line}.0", f"{end_line + 1}.end")
-            self.text_area.insert(f"{start_line}.0", lower_line_text + "\n" + lines_text)
+            # Taşınacak satırlar ve alt satır tek bir replace ile yer değiştirir
+            lines = self.document.get_lines(start_line, end_line + 1).split("\n")
+            self._replace_lines(start_line, lines, lines[-1:] + lines[:-1])
             
             # İmleci yeni pozisyona taşı
             col = current_pos.split('.')[1]
             self.text_area.mark_set("insert", f"{current_line + 1}.{col}")
             
-            # İçerik değişikliğini bildir
-            self.content_modified = True
-            self.update_line_numbers()
-            self.highlighter.highlight()
-            self.minimap.update_content()
-            
         except Exception as e:
             print(f"Satır aşağı taşıma hatası: {e}")
         
@@ -678,7 +1008,7 @@ class CodeEditor(ctk.CTkFrame):
                 start_line = int(current_pos.split('.')[0])
                 end_line = start_line
             
-            total_lines = int(self.text_area.index("end-1c").split('.')[0])
+            total_lines = self.document.line_count
             
             # Satırları sil
             if end_line < total_lines:
@@ -692,12 +1022,6 @@ class CodeEditor(ctk.CTkFrame):
                     # Tek satırlık dosya
                     self.text_area.delete("1.0", "end")
             
-            # İçerik değişikliğini bildir
-            self.content_modified = True
-            self.update_line_numbers()
-            self.highlighter.highlight()
-            self.minimap.update_content()
-            
         except Exception as e:
             print(f"Satır silme hatası: {e}")
         
@@ -717,7 +1041,7 @@ class CodeEditor(ctk.CTkFrame):
             except tk.TclError:
                 current_pos = self.text_area.index("insert")
                 start_line = int(current_pos.split('.')[0])
-                total_lines = int(self.text_area.index("end-1c").split('.')[0])
+                total_lines = self.document.line_count
                 
                 # Son satırsa birleştirme yapılamaz
                 if start_line >= total_lines:
@@ -725,27 +1049,103 @@ class CodeEditor(ctk.CTkFrame):
                     
                 end_line = start_line + 1
             
-            # Tüm satırları al
-            all_text = self.text_area.get(f"{start_line}.0", f"{end_line}.end")
-            
             # Satır sonlarını boşlukla değiştir (gereksiz boşlukları kaldır)
-            joined_text = " ".join(line.strip() for line in all_text.split("\n"))
+            lines = self.document.get_lines(start_line, end_line).split("\n")
+            joined_text = " ".join(line.strip() for line in lines)
             
-            # Eski satırları sil ve birleştirilmiş metni ekle
-            self.text_area.delete(f"{start_line}.0", f"{end_line}.end")
-            self.text_area.insert(f"{start_line}.0", joined_text)
-            
-            # İçerik değişikliğini bildir
-            self.content_modified = True
-            self.update_line_numbers()
-            self.highlighter.highlight()
-            self.minimap.update_content()
+            # Eski satırlar tek bir replace ile birleştirilmiş metinle değişir
+            self._replace_lines(start_line, lines, [joined_text])
             
         except Exception as e:
             print(f"Satır birleştirme hatası: {e}")
         
         return "break"
 
+    def _last_selection_text(self):
+        """Son seçili aralığın metni (çoklu seçimde en sondaki); seçim yoksa TclError."""
+        last_range = self.text_area.tag_prevrange("sel", "end")
+        if not last_range:
+            raise tk.TclError("seçim yok")
+        return self.text_area.get(*last_range)
+
+    def transform_lines(self, operation, **options):
+        """
+        Seçili satırlara (seçim yoksa girintide imleçteki satıra, diğerlerinde tüm belgeye)
+        toplu bir satır dönüşümü uygular: "sort", "unique", "reverse", "shuffle", "indent",
+        "outdent", "trim". Dönüşüm Python tarafında tek seferde hesaplanır ve metin alanına
+        tek bir `replace` ile, sadece değişen satırlar için uygulanır; tek geri alma adımıdır.
+        """
+        selected = self.text_area.tag_ranges("sel")
+        if selected:
+            first = int(str(selected[0]).split('.')[0])
+            last_line, last_col = map(int, str(selected[-1]).split('.'))
+            # Bir sonraki satırın başında biten seçim o satırı kapsamaz
+            last = last_line - 1 if last_col == 0 and last_line > first else last_line
+        elif operation in ("indent", "outdent"):
+            first = last = int(self.text_area.index("insert").split('.')[0])
+        else:
+            first, last = 1, self.document.line_count
+
+        if operation in ("indent", "outdent"):
+            tab_size = self._tab_size()
+            if operation == "indent":
+                options.setdefault("unit", " " * tab_size)
+            else:
+                options.setdefault("tab_size", tab_size)
+
+        lines = self.document.get_lines(first, last).split("\n")
+        new_lines = apply_transform(operation, lines, **options)
+        insert = self.text_area.index("insert")
+        if not self._replace_lines(first, lines, new_lines):
+            return "break"
+
+        if selected or first != last:
+            self.text_area.tag_add("sel", f"{first}.0", f"{first + len(new_lines) - 1}.end")
+        else:
+            # Tek satırın girintisi değişti: imleç satırdaki yerini korur
+            line, col = map(int, insert.split('.'))
+            col = max(0, col + len(new_lines[0]) - len(lines[0]))
+            self.text_area.mark_set("insert", f"{line}.{col}")
+        if len(new_lines) != len(lines):
+            self._set_status(f"{len(lines) - len(new_lines)} satır kaldırıldı.", "info")
+        return "break"
+
+    def sort_selected_lines(self, event=None):
+        """
+        F9: sadece seçili satırları sıralar. Seçim yokken tüm belgeyi tek tuşla yeniden
+        sıralamamak için bir şey yapılmaz; tüm belge Düzenle menüsünden sıralanabilir.
+        """
+        if not self.text_area.tag_ranges("sel"):
+            self._set_status("Sıralamak için satırları seçin (tüm belge için Düzenle menüsü).", "warning")
+            return "break"
+        return self.transform_lines("sort")
+
+    def _replace_lines(self, first, old_lines, new_lines):
+        """
+        `first` satırından başlayan `old_lines` satırlarını `new_lines` ile değiştirir.
+        Baştaki ve sondaki ortak satırlar dokunulmadan bırakılır; kalan bölüm tek bir
+        `replace` çağrısıyla ve tek geri alma adımında değişir. Değişiklik yoksa False döner.
+        """
+        span = changed_span(old_lines, new_lines)
+        if span is None:
+            return False
+        head, old_end, new_end = span
+        if old_end == head or new_end == head:
+            # Sadece satır ekleme/silme: satır sonu karakterleri için komşu bir satır da dahil edilir
+            if head > 0:
+                head -= 1
+            elif old_end < len(old_lines) and new_end < len(new_lines):
+                old_end += 1
+                new_end += 1
+        with self.undo.transaction():
+            self.text_area.replace(f"{first + head}.0", f"{first + old_end - 1}.end",
+                                   "\n".join(new_lines[head:new_end]))
+        return True
+
+    def _selection_spans_lines(self):
+        selected = self.text_area.tag_ranges("sel")
+        return bool(selected) and str(selected[0]).split('.')[0] != str(selected[-1]).split('.')[0]
+
     def select_next_occurrence(self, event=None):
         """
         Ctrl+D ile seçili kelimeyi bulur ve bir sonrakini seçer.
@@ -754,7 +1154,7 @@ class CodeEditor(ctk.CTkFrame):
         try:
             # Seçili metin var mı?
             try:
-                selected_text = self.text_area.get("sel.first", "sel.last")
+                selected_text = self._last_selection_text()
             except:
                 # Seçili metin yoksa, imlçteki kelimeyi al
                 current_pos = self.text_area.index("insert")
@@ -787,18 +1187,117 @@ class CodeEditor(ctk.CTkFrame):
             if next_pos:
                 # Bir sonraki oluşumu seçmek yerine, oraya bir imleç ekleyelim
                 line, col = map(int, next_pos.split('.'))
-                cursor_pos = (line, col)
+                end_pos = f"{line}.{col + len(selected_text)}"
                 
-                if cursor_pos not in self.cursors:
-                    self.cursors.append(cursor_pos)
-                    self.multi_cursor_mode = True
-                    self.update_cursor_visuals()
-                    
-                    # Seçimi yeni pozisyona taşı
-                    end_col = col + len(selected_text)
-                    self.text_area.tag_remove("sel", "1.0", "end")
-                    self.text_area.tag_add("sel", f"{line}.{col}", f"{line}.{end_col}")
+                if not self.cursor_manager.active:
+                    # İlk seçim de düzenlenecek imleçlerden biri olur
+                    self.cursor_manager.add_cursor("sel.last")
+                if self.cursor_manager.add_cursor(end_pos):
+                    # Önceki seçimler korunur; yazılan metin hepsinin yerine geçer
+                    self.text_area.tag_add("sel", next_pos, end_pos)
+                    self.text_area.mark_set("insert", end_pos)
+                    self.text_area.see(end_pos)
         except Exception as e:
             print(f"Select next occurrence error: {e}")
         
         return "break"
+
+    def select_all_occurrences(self, event=None, regex=False, nocase=False, whole_word=None):
+        """
+        Seçili metnin (seçim yoksa imleçteki kelimenin) tüm eşleşmelerini seçer ve her
+        birinin sonuna bir imleç koyar. Kısayol: Alt+F3
+
+        Arama, belgenin anlık görüntüsü üzerinde tek bir derlenmiş düzenli ifadeyle arka
+        plan iş parçacığında yapılır; eşleşmeler Tk'ya tek seferde yerleştirilir.
+        """
+        try:
+            pattern = self._last_selection_text()
+            if whole_word is None:
+                whole_word = False
+        except tk.TclError:
+            line, col = self.text_area.index("insert").split('.')
+            line_text = self.document.line(int(line))
+            match = None
+            for candidate in re.finditer(r"\w+", line_text):
+                if candidate.start() <= int(col) <= candidate.end():
+                    match = candidate
+                    break
+            if match is None:
+                return "break"
+            pattern = match.group()
+            if whole_word is None:
+                whole_word = True
+        if not pattern:
+            return "break"
+        try:
+            compiled = compile_pattern(pattern, regex=regex, nocase=nocase, whole_word=whole_word)
+        except re.error as e:
+            self._set_status(f"Geçersiz düzenli ifade: {e}", "error")
+            return "break"
+
+        if self._occurrence_cancel is not None:
+            self._occurrence_cancel.set()
+        token = self._occurrence_cancel = threading.Event()
+        version = self.document.version
+
+        def deliver(occurrences):
+            self._occurrence_results.put((token, version, occurrences))
+
+        find_occurrences_async(self.document.text(), compiled, deliver, token)
+        if self._occurrence_job is None:
+            self._occurrence_job = self.after(self.OCCURRENCE_POLL_MS, self._poll_occurrences)
+        return "break"
+
+    def _poll_occurrences(self):
+        self._occurrence_job = None
+        current = self._occurrence_cancel
+        if current is None or current.is_set():
+            return  # İptal edilen aramalar sonuç teslim etmez; bekleyecek bir şey yok
+        while True:
+            try:
+                token, version, occurrences = self._occurrence_results.get_nowait()
+            except queue.Empty:
+                self._occurrence_job = self.after(self.OCCURRENCE_POLL_MS, self._poll_occurrences)
+                return
+            if token is current:
+                break
+            # Yerini yenisine bırakmış bir aramanın sonucu
+        self._occurrence_cancel = None
+        if version != self.document.version:
+            self._set_status("Belge arama sırasında değişti; tekrar deneyin.", "warning")
+            return
+        self._place_occurrences(occurrences)
+
+    def _cancel_occurrence_search(self):
+        """Süren aramayı iptal eder ve sonuç yoklamasını durdurur."""
+        if self._occurrence_cancel is not None:
+            self._occurrence_cancel.set()
+            self._occurrence_cancel = None
+        if self._occurrence_job is not None:
+            try:
+                self.after_cancel(self._occurrence_job)
+            except tk.TclError:
+                pass
+            self._occurrence_job = None
+
+    def _place_occurrences(self, occurrences):
+        """Eşleşmeleri tek bir `tag add` çağrısıyla seçer ve sonlarına imleç koyar."""
+        if not occurrences:
+            self._set_status("Eşleşme bulunamadı.", "info")
+            return
+        ranges = []
+        ends = []
+        for start_line, start_col, end_line, end_col in occurrences:
+            end = f"{end_line}.{end_col}"
+            ranges.extend((f"{start_line}.{start_col}", end))
+            ends.append(end)
+        self.cursor_manager.clear_cursors()
+        self.text_area.tag_remove("sel", "1.0", "end")
+        self.text_area.tag_add("sel", *ranges)
+        self.text_area.mark_set("insert", ends[0])
+        self.cursor_manager.add_cursors(ends)
+        self.text_area.see("insert")
+        message = f"{len(occurrences)} eşleşme seçildi."
+        if len(occurrences) >= MAX_OCCURRENCES:
+            message += f" (İlk {MAX_OCCURRENCES} eşleşme)"
+        self._set_status(message, "success")
@@ -1,36 +1,35 @@
+from text_editor.utils.indent_index import IndentIndex
+
+
 class CodeFolder:
+    """
+    Girintiye dayalı kod katlama.
+
+    Katlanabilirlik ve blok sınırları belge başına tutulan IndentIndex'ten okunur. Dizin,
+    her TextChange'te sadece düzenlenen satırlar için güncellenir (`on_change`); katlama
+    tablosu bir sonraki sorguda düzenlemeyi içeren blok için yeniden kurulur.
+    Satır numaraları (gutter) işaretçileri de aynı dizinden beslenir.
+    """
     def __init__(self, editor):
         self.editor = editor
         self.text_area = editor.text_area
+        self.indent_index = IndentIndex(editor.document)
+
+    def on_change(self, change):
+        """ChangeTracker dinleyicisi (DocumentModel güncellendikten sonra çağrılır)."""
+        self.indent_index.apply_change(change.start_line, change.old_end_line, change.new_end_line)
+
+    def sync(self):
+        """Bekleyen düzenlemelerin katlama tablosunu günceller."""
+        self.indent_index.refresh()
 
     def is_line_foldable(self, line_num):
         """
         Bir satırın katlanabilir olup olmadığını girintisine (indentation) bakarak belirler.
-        Eğer sonraki satırın girintisi daha fazlaysa, bu satır bir blok başlangıcıdır.
+        Eğer sonraki dolu satırın girintisi daha fazlaysa, bu satır bir blok başlangıcıdır.
         """
-        try:
-            line_text = self.text_area.get(f"{line_num}.0", f"{line_num}.end")
-            if not line_text.strip():
-                return False
-                
-            indent_current = len(line_text) - len(line_text.lstrip())
-            
-            # Girintiyi kontrol etmek için bir sonraki boş olmayan satırı bul
-            next_line_num = line_num + 1
-            while True:
-                if self.text_area.compare(f"{next_line_num}.0", ">=", "end"):
-                    return False # EOF'a ulaşıldı
-                    
-                next_line_text = self.text_area.get(f"{next_line_num}.0", f"{next_line_num}.end")
-                if next_line_text.strip():
-                    break
-                next_line_num += 1
-            
-            indent_next = len(next_line_text) - len(next_line_text.lstrip())
-            
-            return indent_next > indent_current
-        except Exception:
-            return False
+        self.sync()
+        return self.indent_index.is_foldable(line_num)
 
     def is_line_folded(self, line_num):
         """Bir satırın şu anda katlanmış durumda olup olmadığını kontrol eder."""
@@ -47,44 +46,48 @@ class CodeFolder:
             return
 
         tag_name = f"fold_{line_num}"
-        
+
         if self.is_line_folded(line_num):
             # Katlamayı aç
             self.text_area.tag_delete(tag_name)
         else:
-            # Katla
-            # Başlangıç girintisini bul
-            line_text = self.text_area.get(f"{line_num}.0", f"{line_num}.end")
-            start_indent = len(line_text) - len(line_text.lstrip())
-            
-            # Bitiş satırını bul
-            current_line = line_num + 1
-            while True:
-                if self.text_area.compare(f"{current_line}.0", ">=", "end"):
-                    break
-                    
-                content = self.text_area.get(f"{current_line}.0", f"{current_line}.end")
-                
-                # Eğer boş olmayan satır aynı veya daha az girintiye sahipse, blok bitti
-                if content.strip():
-                    curr_indent = len(content) - len(content.lstrip())
-                    if curr_indent <= start_indent:
-                        break
-                
-                current_line += 1
-            
-            # Blok line_num+1'den current_line-1'e kadardır
-            # SONRAKİ satırdan başlayarak, kesme satırının başına kadar katlamak istiyoruz.
-            # Yani aralık: line_num+1.0'dan current_line.0'a
-            
-            end_line = current_line
-            
-            self.text_area.tag_add(tag_name, f"{line_num+1}.0", f"{end_line}.0")
-            self.text_area.tag_config(tag_name, elide=True)
-            self.text_area.tag_raise(tag_name) # Katlamanın her şeyi gizlediğinden emin ol
-            
+            # Katla: SONRAKİ satırdan başlayarak bloğu sonlandıran satırın başına kadar
+            self._fold(line_num)
+
+        self._refresh_views()
+
+    def fold_all(self):
+        """Tüm katlanabilir blokları tek bir Tcl betiğiyle katlar."""
+        self.sync()
+        commands = []
+        widget = self.text_area._w
+        for line_num in self.indent_index.foldable_lines():
+            tag_name = f"fold_{line_num}"
+            end_line = self.indent_index.fold_end(line_num)
+            commands.append(f"{widget} tag add {tag_name} {line_num + 1}.0 {end_line}.0")
+            commands.append(f"{widget} tag configure {tag_name} -elide 1")
+            commands.append(f"{widget} tag raise {tag_name}")
+        if commands:
+            self.text_area.tk.eval("\n".join(commands))
+        self._refresh_views()
+
+    def unfold_all(self):
+        """Tüm katlamaları açar."""
+        fold_tags = [tag for tag in self.text_area.tag_names() if tag.startswith("fold_")]
+        if fold_tags:
+            self.text_area.tag_delete(*fold_tags)
+        self._refresh_views()
+
+    def _fold(self, line_num):
+        tag_name = f"fold_{line_num}"
+        end_line = self.indent_index.fold_end(line_num)
+        self.text_area.tag_add(tag_name, f"{line_num+1}.0", f"{end_line}.0")
+        self.text_area.tag_config(tag_name, elide=True)
+        self.text_area.tag_raise(tag_name) # Katlamanın her şeyi gizlediğinden emin ol
+
+    def _refresh_views(self):
         if hasattr(self.editor, 'line_numbers'):
             self.editor.line_numbers.redraw()
-        
+
         if hasattr(self.editor, 'minimap'):
             self.editor.minimap.update_content()
@@ -1,107 +1,167 @@
 class MultiCursorManager:
+    """
+    Tk işaretlerine (mark) dayalı çoklu imleç.
+
+    Her ek imleç sağ yerçekimli (gravity right) bir `mc_<n>` işaretidir; başka yerlerde
+    yapılan düzenlemelerde Tk işaretleri kendiliğinden kaydırır, konumlar hiç eskimez ve
+    yeniden hesaplanmaz. Tüm imleçler tek ve paylaşılan CURSOR_TAG etiketiyle çizilir;
+    çizim sadece görünür alandaki imleçler için yapılır (`mark next` ile görünür aralıktaki
+    işaretler gezilir).
+
+    Tüm imleçlerdeki ekleme/silme tek geri alma adımıdır: her imleçteki küçük düzenleme
+    sondan başa ayrı ayrı uygulanır. Böylece her fark sadece kendi karakterini taşır (arada
+    kalan metin ve etiketleri/katlamaları yeniden yazılmaz), ardışık tuş vuruşları imleç başına
+    birleşir ve işaretler sağ yerçekimiyle kendiliğinden kayar.
+    """
+    CURSOR_TAG = "multi_cursor"
+    MARK_PREFIX = "mc_"
+
     def __init__(self, editor):
         self.editor = editor
         self.text_area = editor.text_area
-        self.cursors = [] # (line, col) tuples
+        self.marks = []  # Ek imleç işaretlerinin adları (eklenme sırasıyla)
         self.active = False
-        
+        self._next_id = 0
+        self.text_area.tag_config(self.CURSOR_TAG, background="red", foreground="white")
+
+    @property
+    def cursors(self):
+        """İmleçlerin (satır, sütun) konumları; her çağrıda işaretlerden okunur."""
+        return [tuple(map(int, self.text_area.index(mark).split('.'))) for mark in self.marks]
+
+    def add_cursor(self, index):
+        """Verilen konuma bir imleç ekler; orada zaten varsa False döner."""
+        if self._cursor_at(index) is not None:
+            return False
+        self._add_mark(index)
+        self.update_state()
+        self.update_visuals()
+        return True
+
+    def add_cursors(self, indices):
+        """Birden çok imleci tek seferde ekler (çizim bir kez yapılır)."""
+        for index in indices:
+            self._add_mark(index)
+        self.update_state()
+        self.update_visuals()
+
+    def _add_mark(self, index):
+        name = f"{self.MARK_PREFIX}{self._next_id}"
+        self._next_id += 1
+        self.text_area.mark_set(name, index)
+        self.text_area.mark_gravity(name, "right")
+        self.marks.append(name)
+
+    def _cursor_at(self, index):
+        """Konumdaki imleç işaretinin adı; yoksa None."""
+        position = self.text_area.index(index)
+        name = self.text_area.mark_next(position)
+        while name and self.text_area.compare(name, "==", position):
+            if name.startswith(self.MARK_PREFIX):
+                return name
+            name = self.text_area.mark_next(name)
+        return None
+
     def add_cursor_at_click(self, event):
-        """Alt+Click ile tıklanan yere yeni bir imleç ekler."""
-        # Tıklanan pozisyonu al
+        """Alt+Click ile tıklanan yere yeni bir imleç ekler; orada imleç varsa kaldırır."""
         index = self.text_area.index(f"@{event.x},{event.y}")
-        line, col = map(int, index.split('.'))
-        
-        # Bu pozisyonda zaten imleç var mı kontrol et
-        cursor_pos = (line, col)
-        if cursor_pos in self.cursors:
-            # Varsa kaldır
-            self.cursors.remove(cursor_pos)
+        existing = self._cursor_at(index)
+        if existing is not None:
+            self.marks.remove(existing)
+            self.text_area.mark_unset(existing)
         else:
-            # Yoksa ekle
-            self.cursors.append(cursor_pos)
-        
+            self._add_mark(index)
+
         self.update_state()
         self.update_visuals()
         return "break"
-    
+
     def clear_cursors(self, event=None):
         """Tüm ek imlçleri temizler."""
-        self.cursors = []
+        if self.marks:
+            self.text_area.mark_unset(*self.marks)
+        self.marks = []
+        self.text_area.tag_remove(self.CURSOR_TAG, "1.0", "end")
         self.update_state()
-        self.update_visuals()
         # "break" dönmeyebiliriz, belki ESC başka şeyler de yapıyordur (Completion popup vs)
         # Ancak orijinal kodda break vardı.
         return "break"
-    
+
     def update_state(self):
         """Aktiflik durumunu günceller."""
-        self.active = len(self.cursors) > 0
+        self.active = len(self.marks) > 0
         self.editor.multi_cursor_mode = self.active # Geriye dönük uyumluluk için
 
     def update_visuals(self):
-        """Ekrandaki imleç görsellerini günceller."""
-        # Önce eski cursor tag'lerini temizle
-        for tag in self.text_area.tag_names():
-            if tag.startswith("multi_cursor_"):
-                self.text_area.tag_delete(tag)
-        
-        # Yeni cursorları çiz
-        for i, (line, col) in enumerate(self.cursors):
-            # İmleç pozisyonu
-            pos = f"{line}.{col}"
-            
-            # Tag oluştur
-            tag_name = f"multi_cursor_{i}"
-            
-            # Eğer o satır o an ekranda görünüyorsa
-            # (Tkinter zaten görünmeyeni optimize eder ama logic burası)
-            # İmleç = yanıp sönen ince çizgi. 
-            # Tkinter text widget'ında özel karakter yerine background color kullanmak daha kolay olabilir
-            # veya 'insert' mark'ı simüle eden ince bir dikdörtgen.
-            # Ancak en basit yöntem 1 karakterlik alana 'cursor' stili vermektir.
-            
-            # Orijinal implementasyonda nasıl yapıldığını bilmediğimiz için
-            # Standart bir dikey çizgi simülasyonu yapalım:
-            # Seçim rengi gibi arka plan vermek:
-            
-            self.text_area.tag_add(tag_name, pos)
-            self.text_area.tag_config(tag_name, background="red", foreground="white") # Geçici görsel
-            
-            # Daha iyi bir görsel için: Theme içindeki accent color'ı almalı
-            # Ama şimdilik basit tutalım.
-    
+        """
+        Görünür alandaki imleçleri yeniden çizer. Görünmeyen alandaki eski çizimler, o alan
+        kaydırılıp göründüğünde düzeltilir.
+        """
+        text = self.text_area
+        first = text.index("@0,0 linestart")
+        last = text.index(f"@0,{text.winfo_height()} lineend")
+        text.tag_remove(self.CURSOR_TAG, first, f"{last}+1c")
+        if not self.active:
+            return
+        ranges = []
+        name = text.mark_next(first)
+        while name and text.compare(name, "<=", last):
+            if name.startswith(self.MARK_PREFIX):
+                ranges.extend((name, f"{name}+1c"))
+            name = text.mark_next(name)
+        if ranges:
+            text.tag_add(self.CURSOR_TAG, *ranges)  # Tek çağrıda tüm aralıklar
+            text.tag_raise(self.CURSOR_TAG)
+
     def insert_at_all_cursors(self, char):
-        """Tüm imlçlere karakter ekler."""
-        # Ters sırayla işle ki indeksler kaymasın
-        sorted_cursors = sorted(self.cursors, key=lambda x: (x[0], x[1]), reverse=True)
-        
-        new_cursors = []
-        for line, col in sorted_cursors:
-            pos = f"{line}.{col}"
-            self.text_area.insert(pos, char)
-            new_cursors.append((line, col + 1))
-            
-        self.cursors = new_cursors
-        self.update_visuals()
+        """
+        Tüm imleçlere karakter ekler (tek düzenleme grubu; işaretler kendiliğinden kayar).
+        Seçili aralıklar varsa önce silinir, yazılan metin seçimlerin yerine geçer; aynı
+        konuma düşen imleçler birleştirilir ve oraya bir kez yazar.
+        """
+        with self.editor.undo.transaction():
+            if self._delete_selections():
+                self._merge_overlapping()
+            for mark in self._marks_from_end():
+                self.text_area.insert(mark, char)
 
     def delete_at_all_cursors(self, direction="backspace"):
-        """Tüm imlçlerde silme yapar."""
-        sorted_cursors = sorted(self.cursors, key=lambda x: (x[0], x[1]), reverse=True)
-        
-        new_cursors = []
-        for line, col in sorted_cursors:
-            pos = f"{line}.{col}"
-            
-            if direction == "backspace":
-                if col > 0:
-                    self.text_area.delete(f"{pos}-1c", pos)
-                    new_cursors.append((line, col - 1))
-                else:
-                    # Satır birleştirme vs. karmaşık durumlar, şimdilik atla
-                    new_cursors.append((line, col))
-            else: # delete
-                self.text_area.delete(pos, f"{pos}+1c")
-                new_cursors.append((line, col))
-                
-        self.cursors = new_cursors
-        self.update_visuals()
+        """
+        Tüm imleçlerde silme yapar; seçim varsa sadece seçili aralıklar silinir. Aynı konuma
+        düşen imleçler birleştirilir.
+        """
+        with self.editor.undo.transaction():
+            if not self._delete_selections():
+                for mark in self._marks_from_end():
+                    if direction == "backspace":
+                        self.text_area.delete(f"{mark}-1c", mark)
+                    else: # delete
+                        self.text_area.delete(mark, f"{mark}+1c")
+        self._merge_overlapping()
+
+    def _marks_from_end(self):
+        """İmleç işaretleri, belgedeki konumlarına göre sondan başa."""
+        return [mark for _, mark in sorted(zip(self.cursors, self.marks), reverse=True)]
+
+    def _delete_selections(self):
+        """Tüm seçili aralıkları sondan başa siler; seçim varsa True döner."""
+        ranges = [str(index) for index in self.text_area.tag_ranges("sel")]
+        for i in range(len(ranges) - 2, -1, -2):
+            self.text_area.delete(ranges[i], ranges[i + 1])
+        return bool(ranges)
+
+    def _merge_overlapping(self):
+        """Silme sonrası aynı konuma düşen imleçlerden sadece birini tutar."""
+        seen = set()
+        kept, dropped = [], []
+        for mark in self.marks:
+            position = self.text_area.index(mark)
+            if position in seen:
+                dropped.append(mark)
+            else:
+                seen.add(position)
+                kept.append(mark)
+        if dropped:
+            self.text_area.mark_unset(*dropped)
+            self.marks = kept
+            self.update_state()
@@ -32,6 +32,9 @@ class GoToLineDialog(ctk.CTkToplevel):
 
     def _get_total_lines(self) -> int:
         """Editördeki toplam satır sayısını hesaplar."""
+        if hasattr(self.editor, "known_line_count"):
+            # Büyük dosya görüntüleyicisi: dizin tamamlanana kadar dizinlenmiş satır sayısı
+            return self.editor.known_line_count()
         try:
             # "end-1c", Tkinter'ın eklediği sondaki yeni satır karakterini hariç tutar
             index = self.editor.text_area.index("end-1c")
@@ -164,8 +167,13 @@ class GoToLineDialog(ctk.CTkToplevel):
             return False
             
         line_num = int(value)
+        if hasattr(self.editor, "known_line_count"):
+            self._total_lines = self.editor.known_line_count()
         if not (1 <= line_num <= self._total_lines):
-            self._show_error(f"⚠️ 1 ile {self._total_lines} arasında olmalı.")
+            if not getattr(self.editor, "index_complete", True):
+                self._show_error(f"⚠️ Satır dizini hazırlanıyor ({self._total_lines} satır hazır).")
+            else:
+                self._show_error(f"⚠️ 1 ile {self._total_lines} arasında olmalı.")
             return False
             
         return True
@@ -178,6 +186,14 @@ class GoToLineDialog(ctk.CTkToplevel):
             line_num: Hedef satır numarası (1 tabanlı).
         """
         try:
+            if hasattr(self.editor, "goto_line"):
+                # Büyük dosya görüntüleyicisi satırı içeren sayfayı kendisi yükler
+                if self.editor.goto_line(line_num):
+                    self.destroy()
+                else:
+                    self._show_error("⚠️ Satır henüz dizinlenmedi.")
+                return
+
             # İmleci taşı ve kaydır
             target_index = f"{line_num}.0"
             self.editor.text_area.mark_set("insert", target_index)
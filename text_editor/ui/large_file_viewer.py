@@ -0,0 +1,410 @@
+import customtkinter as ctk
+import tkinter as tk
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from text_editor.config import FONT_FAMILY, FONT_SIZE
+from text_editor.utils.encoding_detector import detect_file_encoding, encoding_label, normalize_fallbacks
+from text_editor.utils.mmap_document import MappedFile, is_ascii_compatible
+from text_editor.utils.settings_manager import SettingsManager
+
+
+class LargeFileViewer(ctk.CTkFrame):
+    """
+    `max_file_size` sınırını aşan dosyalar için salt okunur, sayfalı görüntüleyici.
+
+    - Dosya bellek eşlemesiyle (mmap) açılır, satır dizini arka planda oluşturulur
+    - Metin alanında sadece görünür alanın çevresindeki PAGE_LINES satır tutulur;
+      görünüm sayfanın kenarına yaklaşınca sayfa yeni konumun çevresinde yeniden okunur
+    - Dikey kaydırma çubuğu sayfayı değil dosyanın tamamını (bayt konumuna göre) temsil eder
+    - Satıra gitme ve arama doğrudan eşleme üzerinde çalışır
+
+    Bellek kullanımı dosya boyutundan bağımsızdır: bir sayfa, satır dizini ve işletim
+    sisteminin önbelleğe aldığı eşleme sayfaları.
+    """
+    PAGE_LINES = 400        # Metin alanında tutulan en fazla satır
+    EDGE_LINES = 60         # Görünüm sayfa kenarına bu kadar satır yaklaşınca yeniden sayfalanır
+    LINE_LIMIT = 16 * 1024  # Bir satırın gösterilen en fazla baytı (daha uzunları kırpılır)
+    INDEX_POLL_MS = 200
+    SEARCH_POLL_MS = 30
+
+    def __init__(self, master, file_path=None, **kwargs):
+        super().__init__(master, **kwargs)
+
+        # Durum Değişkenleri
+        self.file_path = file_path
+        self.content_modified = False
+        self.last_mtime = 0
+        self.encoding = "utf-8"
+        self.bom = False
+        self.mapped: Optional[MappedFile] = None
+        self._page_offsets: List[int] = []  # Sayfadaki her satırın dosyadaki bayt konumu
+        self._page_end: Optional[int] = None  # Sayfadan sonraki satırın konumu (dosya sonuysa None)
+        self._numbered = False  # Sayfanın satır numaraları yazıldı mı
+        self._repage_job = None
+        self._index_job = None
+        self._search_job = None
+        self._search_cancel: Optional[threading.Event] = None
+        self._search_results: "queue.Queue" = queue.Queue()
+
+        # Grid Yapılandırması
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        font = (FONT_FAMILY, FONT_SIZE)
+        self.gutter = tk.Text(self, width=8, wrap="none", font=font, bd=0, highlightthickness=0,
+                              padx=5, pady=5, takefocus=0, cursor="arrow", state="disabled")
+        self.gutter.grid(row=0, column=0, sticky="ns")
+        self.gutter.tag_configure("right", justify="right")
+
+        self.text_area = tk.Text(self, wrap="none", undo=False, font=font, bd=0, highlightthickness=0,
+                                 padx=5, pady=5, state="disabled",
+                                 yscrollcommand=self._on_text_scroll)
+        self.text_area.grid(row=0, column=1, sticky="nsew")
+
+        # Kaydırma çubukları: dikey olan dosyanın tamamına eşlenir
+        self.scrollbar_y = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar_y.grid(row=0, column=2, sticky="ns")
+        self.scrollbar_x = ctk.CTkScrollbar(self, orientation="horizontal", command=self.text_area.xview)
+        self.scrollbar_x.grid(row=1, column=1, sticky="ew")
+        self.text_area.configure(xscrollcommand=self.scrollbar_x.set)
+
+        # Bilgi Çubuğu
+        self.toolbar = ctk.CTkFrame(self, height=28, corner_radius=0, fg_color=("gray90", "#2b2b2b"))
+        self.toolbar.grid(row=2, column=0, columnspan=3, sticky="ew")
+        self.info_label = ctk.CTkLabel(self.toolbar, text="", font=("Segoe UI", 12))
+        self.info_label.pack(side="left", padx=15)
+
+        # --- Olay Bağlayıcıları ---
+        # Salt okunur: widget devre dışı olduğu için odak ve seçim için tıklamada odak alınır
+        self.text_area.bind("<Button-1>", lambda e: self.text_area.focus_set(), add="+")
+        self.text_area.bind("<ButtonRelease-1>", self._update_cursor_info, add="+")
+        self.text_area.bind("<KeyRelease>", self._update_cursor_info, add="+")
+        self.text_area.bind("<Control-Home>", lambda e: self._go_to_start())
+        self.text_area.bind("<Control-End>", lambda e: self._go_to_end())
+        self.gutter.bind("<MouseWheel>", self._on_gutter_wheel)
+        self.gutter.bind("<Button-4>", self._on_gutter_wheel)
+        self.gutter.bind("<Button-5>", self._on_gutter_wheel)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+        if file_path:
+            self.load_file(file_path)
+
+    # --- Yükleme ---
+
+    @staticmethod
+    def can_open(file_path: str) -> bool:
+        """Dosyanın kodlaması bayt düzeyinde satır aramaya uygun mu (UTF-16/32 değil)."""
+        try:
+            fallbacks = normalize_fallbacks(SettingsManager.get_instance().get("fallback_encodings"))
+            return is_ascii_compatible(detect_file_encoding(file_path, fallbacks).encoding)
+        except OSError:
+            return False
+
+    def load_file(self, file_path: str):
+        """Dosyayı eşler, satır dizinini başlatır ve ilk sayfayı gösterir."""
+        self._close_mapping()
+        fallbacks = normalize_fallbacks(SettingsManager.get_instance().get("fallback_encodings"))
+        detected = detect_file_encoding(file_path, fallbacks)
+        self.mapped = MappedFile(file_path, detected)
+        self.mapped.start()
+        self.file_path = file_path
+        self.encoding = detected.encoding
+        self.bom = detected.bom_length > 0
+        self.content_modified = False
+        try:
+            self.last_mtime = os.path.getmtime(file_path)
+        except OSError:
+            self.last_mtime = 0
+
+        self._show_page(self.mapped.bom_length)
+        self._poll_index()
+
+    def _close_mapping(self):
+        for job in (self._repage_job, self._index_job, self._search_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._repage_job = self._index_job = self._search_job = None
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._close_mapping()
+
+    def _poll_index(self):
+        """Dizin ilerlemesini bilgi çubuğunda gösterir; sayfanın eksik satır numaralarını tamamlar."""
+        self._index_job = None
+        mapped = self.mapped
+        if mapped is None:
+            return
+        if not self._numbered:
+            self._render_gutter()
+        self._update_info()
+        if not mapped.index_complete:
+            self._index_job = self.after(self.INDEX_POLL_MS, self._poll_index)
+
+    def _update_info(self):
+        mapped = self.mapped
+        size = f"{mapped.size / (1024 * 1024):,.1f} MB"
+        if mapped.index_complete:
+            lines = f"{mapped.line_count:,} satır"
+        else:
+            lines = f"Satır dizini: %{mapped.progress * 100:.0f}"
+        self.info_label.configure(
+            text=f"🔒 Salt okunur  ·  {size}  ·  {lines}  ·  {encoding_label(self.encoding, self.bom)}")
+
+    # --- Sayfalama ---
+
+    def _show_page(self, anchor: int, top_row_offset: int = 0):
+        """
+        `anchor` konumundaki satırın çevresindeki sayfayı okur ve o satırı görünümün
+        üstünden `top_row_offset` satır aşağıya yerleştirir.
+        """
+        mapped = self.mapped
+        anchor = mapped.line_start(anchor)
+        start = anchor
+        for _ in range(self.PAGE_LINES // 2):
+            previous = mapped.prev_line(start)
+            if previous is None:
+                break
+            start = previous
+
+        offsets, lines = [], []
+        pos: Optional[int] = start
+        while pos is not None and len(offsets) < self.PAGE_LINES:
+            text, next_pos = mapped.read_line(pos, self.LINE_LIMIT)
+            offsets.append(pos)
+            lines.append(text)
+            pos = next_pos
+        self._page_offsets = offsets
+        self._page_end = pos
+
+        self.text_area.configure(state="normal")
+        self.text_area.delete("1.0", "end")
+        self.text_area.insert("1.0", "\n".join(lines))
+        self.text_area.configure(state="disabled")
+        self._render_gutter()
+
+        row = offsets.index(anchor) if anchor in offsets else 0
+        self.text_area.yview_moveto(max(row - top_row_offset, 0) / len(offsets))
+
+    def _render_gutter(self):
+        """Sayfanın satır numaralarını yazar; ilk satır henüz dizinlenmediyse boş bırakır."""
+        first = self.mapped.line_of_offset(self._page_offsets[0]) if self._page_offsets else None
+        self._numbered = first is not None
+        numbers = ""
+        if first is not None:
+            numbers = "\n".join(str(n) for n in range(first, first + len(self._page_offsets)))
+            self.gutter.configure(width=max(len(str(first + len(self._page_offsets))), 4) + 1)
+        self.gutter.configure(state="normal")
+        self.gutter.delete("1.0", "end")
+        self.gutter.insert("1.0", numbers, "right")
+        self.gutter.configure(state="disabled")
+        self.gutter.yview_moveto(self.text_area.yview()[0])
+
+    def _on_text_scroll(self, first, last):
+        """Metin alanı kaydırıldıkça kaydırma çubuğunu dosya konumuna göre günceller."""
+        self.gutter.yview_moveto(first)
+        if not self._page_offsets or self.mapped is None:
+            return
+        top_row, bottom_row = self._visible_rows()
+        size = max(self.mapped.size, 1)
+        top = self._page_offsets[top_row]
+        bottom = self._page_offsets[bottom_row + 1] if bottom_row + 1 < len(self._page_offsets) \
+            else (self._page_end if self._page_end is not None else self.mapped.size)
+        self.scrollbar_y.set(top / size, bottom / size)
+
+        near_top = top_row < self.EDGE_LINES and self._page_offsets[0] > self.mapped.bom_length
+        near_bottom = len(self._page_offsets) - bottom_row < self.EDGE_LINES and self._page_end is not None
+        if (near_top or near_bottom) and self._repage_job is None:
+            # Kaydırma geri çağrısının içinde metni değiştirmemek için olay döngüsüne bırakılır
+            self._repage_job = self.after_idle(self._repage)
+
+    def _visible_rows(self):
+        """Görünür ilk ve son satırın sayfa içindeki (0 tabanlı) sırası."""
+        top = int(self.text_area.index("@0,0").split(".")[0]) - 1
+        bottom = int(self.text_area.index(f"@0,{self.text_area.winfo_height()}").split(".")[0]) - 1
+        last = len(self._page_offsets) - 1
+        return min(top, last), min(bottom, last)
+
+    def _repage(self):
+        """Görünür satırı koruyarak sayfayı yeni konumun çevresinde yeniden okur."""
+        self._repage_job = None
+        if self.mapped is None:
+            return
+        top_row, _ = self._visible_rows()
+        insert = self._offset_of_index("insert")
+        self._show_page(self._page_offsets[top_row])
+        self._restore_insert(insert)
+
+    def _on_scrollbar(self, *args):
+        """Kaydırma çubuğu: 'moveto' dosyada konuma atlar, birim/sayfa kaydırma metin alanına iletilir."""
+        if self.mapped is None:
+            return
+        if args[0] == "moveto":
+            fraction = min(max(float(args[1]), 0.0), 1.0)
+            self._show_page(int(fraction * self.mapped.size))
+        elif args[0] == "scroll":
+            self.text_area.yview_scroll(int(args[1]), args[2])
+
+    def _on_gutter_wheel(self, event):
+        if event.num == 4:
+            self.text_area.yview_scroll(-1, "units")
+        elif event.num == 5:
+            self.text_area.yview_scroll(1, "units")
+        elif event.delta:
+            self.text_area.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        return "break"
+
+    def _go_to_start(self):
+        self._show_page(0)
+        self.text_area.mark_set("insert", "1.0")
+        return "break"
+
+    def _go_to_end(self):
+        self._show_page(self.mapped.size, self.PAGE_LINES)
+        self.text_area.mark_set("insert", "end-1c")
+        self.text_area.see("insert")
+        return "break"
+
+    # --- Konum çevirileri ---
+
+    def _offset_of_index(self, index: str) -> Optional[int]:
+        """Sayfadaki bir Tk indeksini dosyadaki bayt konumuna çevirir."""
+        if not self._page_offsets:
+            return None
+        row, col = map(int, self.text_area.index(index).split("."))
+        row = min(row, len(self._page_offsets))
+        prefix = self.text_area.get(f"{row}.0", f"{row}.{col}")
+        return self._page_offsets[row - 1] + len(prefix.encode(self.encoding, errors="replace"))
+
+    def _index_of_offset(self, offset: int) -> Optional[str]:
+        """Dosyadaki bir bayt konumunu sayfadaki Tk indeksine çevirir (sayfada değilse None)."""
+        line_start = self.mapped.line_start(offset)
+        try:
+            row = self._page_offsets.index(line_start) + 1
+        except ValueError:
+            return None
+        return f"{row}.{len(self.mapped.decode(line_start, offset))}"
+
+    def _restore_insert(self, offset: Optional[int]):
+        index = self._index_of_offset(offset) if offset is not None else None
+        self.text_area.mark_set("insert", index or "@0,0")
+
+    def _update_cursor_info(self, event=None):
+        """Durum çubuğunda imlecin dosyadaki satır numarasını gösterir."""
+        if self.mapped is None or not self._page_offsets:
+            return
+        row, col = map(int, self.text_area.index("insert").split("."))
+        line = self.mapped.line_of_offset(self._page_offsets[min(row, len(self._page_offsets)) - 1])
+        main_window = self.winfo_toplevel()
+        if hasattr(main_window, 'status_bar') and line is not None:
+            main_window.status_bar.set_cursor_info(line, col, self.mapped.indexed_lines)
+            main_window.status_bar.set_file_info("Metin", encoding_label(self.encoding, self.bom))
+
+    # --- Satıra gitme ve arama ---
+
+    def known_line_count(self) -> int:
+        """Şu ana kadar dizinlenmiş satır sayısı (dizin tamamsa dosyanın satır sayısı)."""
+        return self.mapped.indexed_lines if self.mapped else 1
+
+    @property
+    def index_complete(self) -> bool:
+        return self.mapped is None or self.mapped.index_complete
+
+    def goto_line(self, line: int) -> bool:
+        """Satıra gider ve satırı seçer; satır henüz dizinlenmediyse False döner."""
+        offset = self.mapped.line_offset(line) if self.mapped else None
+        if offset is None:
+            return False
+        self._show_page(offset, top_row_offset=5)
+        index = self._index_of_offset(offset)
+        self.text_area.mark_set("insert", index)
+        self.text_area.tag_remove("sel", "1.0", "end")
+        self.text_area.tag_add("sel", index, f"{index} lineend")
+        self.text_area.focus_set()
+        self._update_cursor_info()
+        return True
+
+    def search_file(self, pattern: str, nocase: bool = False, whole_word: bool = False,
+             on_result: Optional[Callable[[bool, bool], None]] = None) -> None:
+        """
+        İmleçten sonraki eşleşmeyi arka planda arar (gerekirse baştan devam eder). Bulunan
+        eşleşme gösterilip seçilir; `on_result(bulundu, başa_dönüldü)` UI iş parçacığında çağrılır.
+        """
+        if self.mapped is None:
+            return
+        try:
+            compiled = self.mapped.compile(pattern, nocase=nocase, whole_word=whole_word)
+        except UnicodeEncodeError:
+            if on_result:
+                on_result(False, False)
+            return
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+        self._search_cancel = threading.Event()
+        start = self._offset_of_index("insert") or 0
+        token = self._search_cancel
+
+        def deliver(match, wrapped):
+            self._search_results.put((token, match, wrapped, on_result))
+
+        self.mapped.search_async(compiled, start, True, deliver, self._search_cancel)
+        if self._search_job is None:
+            self._search_job = self.after(self.SEARCH_POLL_MS, self._poll_search)
+
+    def _poll_search(self):
+        self._search_job = None
+        try:
+            token, match, wrapped, on_result = self._search_results.get_nowait()
+        except queue.Empty:
+            self._search_job = self.after(self.SEARCH_POLL_MS, self._poll_search)
+            return
+        if token is not self._search_cancel or token.is_set():
+            self._search_job = self.after(self.SEARCH_POLL_MS, self._poll_search)
+            return  # Yerini yenisine bırakmış bir aramanın sonucu
+        if match is not None:
+            self._select_match(*match)
+        if on_result:
+            on_result(match is not None, wrapped)
+
+    def _select_match(self, start: int, end: int):
+        self._show_page(start, top_row_offset=5)
+        first = self._index_of_offset(start)
+        last = f"{first}+{len(self.mapped.decode(start, end))}c"
+        self.text_area.tag_remove("sel", "1.0", "end")
+        self.text_area.tag_add("sel", first, last)
+        self.text_area.mark_set("insert", last)
+        self.text_area.see(first)
+        self._update_cursor_info()
+
+    # --- Tema ---
+
+    def apply_theme(self, theme: Dict[str, Any]):
+        bg = theme.get("editor_bg", "#1e1e1e")
+        fg = theme.get("editor_fg", theme.get("fg", "#d4d4d4"))
+        self.configure(fg_color=bg)
+        self.text_area.configure(bg=bg, fg=fg, insertbackground=theme.get("caret", fg),
+                                 selectbackground=theme.get("menu_hover", "#3c3c3c"))
+        self.gutter.configure(bg=theme.get("line_num_bg", bg), fg=theme.get("line_num_fg", fg))
+        self.toolbar.configure(fg_color=theme.get("menu_bg", "#2b2b2b"))
+        self.info_label.configure(text_color=theme.get("fg", fg))
+
+    # Uyumluluk
+    def save_file(self): return True
+    def set_lexer_from_file(self, f): pass
+    def toggle_line_numbers(self, show=None): pass
+    def toggle_minimap(self, show=None): pass
+    def toggle_word_wrap(self, enable=None): pass
+    def get_view_states(self): return {}
+    def duplicate_line(self): pass
+    def move_line_up(self): pass
+    def move_line_down(self): pass
+    def delete_line(self): pass
+    def join_lines(self): pass
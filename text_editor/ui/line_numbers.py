@@ -1,113 +1,129 @@
 import tkinter as tk
+import tkinter.font as tkfont
 from text_editor.config import FONT_FAMILY, FONT_SIZE
 
-class LineNumbers(tk.Text):
+class LineNumbers(tk.Canvas):
     """
     Ana metin editörünün sol tarafında satır numaralarını gösteren bileşen.
     Metin editörü ile senkronize çalışır ve sadece görünür satırları çizer.
     Ayrıca kod katlama (folding) işaretçilerini de gösterir.
+
+    Sanallaştırılmış bir Canvas'tır: her çizimde sadece ana metnin görünen satırları
+    `dlineinfo` ile bulunur ve o satırlar için metin öğeleri oluşturulur. Çizim maliyeti
+    dosya uzunluğuna değil pencere yüksekliğine bağlıdır.
     """
-    def __init__(self, master, text_widget, **kwargs):
-        super().__init__(master, width=8, padx=4, pady=5, highlightthickness=0, bd=0, 
-                         font=(FONT_FAMILY, FONT_SIZE), state="disabled", cursor="arrow", wrap="none", **kwargs)
+    PAD_X = 4
+    MARKER_FOLDABLE = "▼"
+    MARKER_FOLDED = "▶"
+
+    def __init__(self, master, text_widget, document=None, **kwargs):
+        self.fg = kwargs.pop("fg", "#858585")
+        self.font = kwargs.pop("font", (FONT_FAMILY, FONT_SIZE))
+        super().__init__(master, width=60, highlightthickness=0, bd=0, cursor="arrow", **kwargs)
         self.text_widget = text_widget
-        # redundant bindings removed to prevent multiple redraws and jumping issues
-        # self.text_widget.bind("<<Change>>", self.redraw)
-        # self.text_widget.bind("<Configure>", self.redraw)
+        self.document = document  # Verilirse satır sayısı Tk'ya sorulmadan okunur
+        self._redraw_job = None
+        self._digits = 0
         self.bind("<Button-1>", self.on_click)
+        # Yeniden çizim sadece kaydırma (editörden) ve yeniden boyutlandırmada gerekir
+        self.bind("<Configure>", self.redraw)
+
+    def configure(self, cnf=None, **kwargs):
+        """Canvas'ın desteklemediği `fg` ve `font` seçeneklerini yakalar, kalanını Canvas'a iletir."""
+        repaint = False
+        if "fg" in kwargs:
+            self.fg = kwargs.pop("fg")
+            repaint = True
+        if "font" in kwargs:
+            self.font = kwargs.pop("font")
+            self._digits = 0  # Genişlik yeniden hesaplansın
+            repaint = True
+        result = super().configure(cnf, **kwargs) if (cnf or kwargs) else None
+        if repaint:
+            self.redraw()
+        return result
+
+    config = configure
+
+    def yview_moveto(self, fraction):
+        """Geriye dönük uyumluluk: kaydırma konumu ana metinden okunduğu için sadece yeniden çizer."""
+        self.redraw()
+
+    def yview(self, *args):
+        self.redraw()
 
     def redraw(self, *args):
         """
-        Satır numaralarını yeniden çizer.
-        Tüm dosyayı işler ve text_widget ile senkronize scrolling sağlar.
+        Satır numaralarının yeniden çizilmesini planlar.
+        Aynı olay döngüsündeki çağrılar tek bir çizimde birleştirilir.
         """
-        self.configure(state="normal")
-        self.delete("1.0", "end")
-        
-        # Metin içeriğini al
+        if self._redraw_job is None:
+            try:
+                self._redraw_job = self.after_idle(self._draw)
+            except tk.TclError:
+                pass
+
+    def _draw(self):
+        """Sadece görünen satırları çizer."""
+        self._redraw_job = None
+        text = self.text_widget
         try:
-            full_content = self.text_widget.get("1.0", "end-1c")
-        except:
-             # Widget destroyed
+            if self.document is not None:
+                total_lines = self.document.line_count
+            else:
+                total_lines = int(text.index("end-1c").split(".")[0])
+            height = text.winfo_height()
+            index = text.index("@0,0 display linestart")
+        except tk.TclError:
+            # Widget destroyed
             return
 
-        lines = full_content.split('\n')
-        total_lines = len(lines)
-        
-        # Katlanmış satırları belirle
-        folded_lines = set()
-        try:
-            for tag in self.text_widget.tag_names():
-                if tag.startswith("fold_"):
-                    try:
-                        line_num = int(tag.split('_')[1])
-                        folded_lines.add(line_num)
-                    except:
-                        pass
-        except:
-            pass
-        
-        # Girinti hesaplama yardımcısı
-        def get_indent(s):
-            return len(s) - len(s.lstrip())
-            
-        buffer = []
-        
-        for i, line_content in enumerate(lines):
-            linenum = i + 1
-            marker = "  " # Varsayılan: 2 boşluk
-            
-            # Katlanabilirlik kontrolü
-            if line_content.strip():
-                curr_indent = get_indent(line_content)
-                
-                # Sonraki satırları kontrol et
-                for j in range(i + 1, total_lines):
-                    next_line = lines[j]
-                    if next_line.strip():
-                        # İlk dolu satırı bulduk
-                        if get_indent(next_line) > curr_indent:
-                            if linenum in folded_lines:
-                                marker = "▶ "
-                            else:
-                                marker = "▼ "
-                        break
-            
-            buffer.append(f"{marker}{linenum:>4}\n")
-        
-        self.insert("1.0", "".join(buffer))
-        
-        # Katlama etiketlerini uygula
-        try:
-            for tag in self.text_widget.tag_names():
-                if tag.startswith("fold_"):
-                    ranges = self.text_widget.tag_ranges(tag)
-                    if ranges:
-                        self.tag_add(tag, *ranges)
-                        self.tag_config(tag, elide=True)
-        except:
-             pass
+        self._update_width(total_lines)
+        self.delete("all")
 
-        # Scrolling'i senkronize et (Async yap ki render tamamlansın)
-        def sync_scroll():
-            try:
-                self.yview_moveto(self.text_widget.yview()[0])
-            except:
-                pass
-                
-        self.after_idle(sync_scroll)
-            
-        self.configure(state="disabled")
+        is_foldable = getattr(self.master, "is_line_foldable", None)
+        is_folded = getattr(self.master, "is_line_folded", None)
+        right = int(self.cget("width")) - self.PAD_X
+
+        while True:
+            dline = text.dlineinfo(index)
+            if dline is None or dline[1] > height:
+                break
+            line_str, col = index.split(".")
+            if col == "0":
+                # Mantıksal satırın ilk görüntü satırı: numara ve katlama işaretçisi
+                y = dline[1]
+                line_num = int(line_str)
+                self.create_text(right, y, anchor="ne", text=line_str, fill=self.fg, font=self.font)
+                if is_foldable is not None and is_foldable(line_num):
+                    marker = self.MARKER_FOLDED if is_folded and is_folded(line_num) else self.MARKER_FOLDABLE
+                    self.create_text(self.PAD_X, y, anchor="nw", text=marker, fill=self.fg, font=self.font)
+            next_index = text.index(f"{index} +1 display lines display linestart")
+            if next_index == index:
+                break
+            index = next_index
+
+    def _update_width(self, total_lines):
+        """Gutter genişliğini en uzun satır numarasına göre ayarlar (sadece basamak sayısı değişince)."""
+        digits = max(4, len(str(total_lines)))
+        if digits == self._digits:
+            return
+        self._digits = digits
+        try:
+            measure = tkfont.Font(font=self.font).measure
+            width = measure(f"{self.MARKER_FOLDABLE} ") + measure("9" * digits) + 2 * self.PAD_X
+        except tk.TclError:
+            width = 60
+        super().configure(width=width)
 
     def on_click(self, event):
         """
         Satır numaraları alanına tıklama olayını işler.
         """
         try:
-            index = self.index(f"@{event.x},{event.y}")
+            index = self.text_widget.index(f"@0,{event.y}")
             line_idx = int(index.split('.')[0])
-            
-            # Basitleştirilmiş mantık: LineNumbers satır indeksi == Gerçek satır numarası
+
             # Master (CodeEditor) üzerinde toggle_fold metodunu çağırır
             if hasattr(self.master, 'toggle_fold'):
                 self.master.toggle_fold(line_idx)
@@ -13,6 +13,7 @@ from .markdown.styler import MarkdownStyler
 from .markdown.renderer import MarkdownRenderer
 from .markdown.exporter import MarkdownExporter
 from .context_menu import ModernContextMenu
+from text_editor.utils.event_bus import TIER_PREVIEW
 
 class MarkdownPreview(ctk.CTkFrame):
     """
@@ -25,7 +26,6 @@ class MarkdownPreview(ctk.CTkFrame):
         
         self.editor = editor
         self.theme = theme or {}
-        self._update_job = None
         self._sync_scroll_enabled = True
         self._zoom_level = 100
         self._base_font_size = 12
@@ -258,13 +258,20 @@ class MarkdownPreview(ctk.CTkFrame):
             self.sync_indicator.configure(text="🔓", text_color="#808080")
             self.sync_btn.configure(fg_color="transparent")
 
+    def _editor_content(self):
+        """Editör içeriği; editörün DocumentModel'i varsa Tk tamponu kopyalanmaz."""
+        document = getattr(self.editor, 'document', None)
+        if document is not None:
+            return document.text()
+        return self.editor.text_area.get("1.0", "end-1c")
+
     def refresh(self):
         """Markdown içeriğini yeniden render eder."""
         if not self.editor:
             return
             
         try:
-            content = self.editor.text_area.get("1.0", "end-1c")
+            content = self._editor_content()
             scroll_pos = self.preview_text.yview()
             
             # File path güncelle
@@ -299,34 +306,36 @@ class MarkdownPreview(ctk.CTkFrame):
     def set_editor(self, editor):
         """Bağlı editörü ayarlar."""
         # Eskileri çöz (Unbind)
-        if self.editor and hasattr(self.editor, 'text_area'):
-            try:
-                self.editor.text_area.unbind("<<Modified>>")
-                self.editor.text_area.unbind("<KeyRelease>")
-            except: pass
+        events = getattr(self.editor, 'events', None)
+        if events:
+            events.unsubscribe(self._on_editor_change)
             
         self.editor = editor
         self.exporter.editor = editor
         
         if editor:
-            editor.text_area.bind("<<Modified>>", self._on_editor_change)
-            editor.text_area.bind("<KeyRelease>", self._on_editor_change)
+            # Değişiklikler editörün olay yolundan, önizleme katmanında (~300 ms) birleştirilerek gelir
+            events = getattr(editor, 'events', None)
+            if events:
+                events.subscribe(self._on_editor_change, TIER_PREVIEW)
             editor.text_area.bind("<MouseWheel>", self._on_editor_scroll)
             # Gerekirse Linux bağlamaları
             self.refresh()
             self.update_theme(self.theme) # Temayı başlangıçta uygula
 
-    def _on_editor_change(self, event=None):
-        if self._update_job:
-            self.after_cancel(self._update_job)
-        self._update_job = self.after(300, self.refresh)
+    def _on_editor_change(self, changes=None):
+        self.refresh()
 
     def _on_editor_scroll(self, event=None):
         if not self._sync_scroll_enabled or not self.editor: return
         try:
             first_visible = self.editor.text_area.index("@0,0")
             line_num = int(first_visible.split(".")[0])
-            total_lines = int(self.editor.text_area.index("end-1c").split(".")[0])
+            document = getattr(self.editor, 'document', None)
+            if document is not None:
+                total_lines = document.line_count
+            else:
+                total_lines = int(self.editor.text_area.index("end-1c").split(".")[0])
             if total_lines > 1:
                 fraction = line_num / total_lines
                 self.preview_text.yview_moveto(fraction)
@@ -366,7 +375,7 @@ class MarkdownPreview(ctk.CTkFrame):
     def _show_toc(self):
         """İçindekiler tablosunu gösterir."""
         if not self.editor: return
-        content = self.editor.text_area.get("1.0", "end-1c")
+        content = self._editor_content()
         lines = content.split("\n")
         toc = []
         for i, line in enumerate(lines):
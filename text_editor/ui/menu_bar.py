@@ -242,6 +242,14 @@ class MenuBar(ctk.CTkFrame):
             {"icon": "🗑️", "label": self.lang.get("menu.items.delete_line"), "shortcut": fmt(shortcuts.get("delete_line")), "command": tm.delete_line},
             {"icon": "🔗", "label": self.lang.get("menu.items.join_lines"), "shortcut": fmt(shortcuts.get("join_lines")), "command": tm.join_lines},
             {"separator": True},
+            {"icon": "🔤", "label": self.lang.get("menu.items.sort_lines"), "command": lambda: tm.transform_lines("sort")},
+            {"icon": "🔢", "label": self.lang.get("menu.items.sort_lines_numeric"), "command": lambda: tm.transform_lines("sort", mode="numeric")},
+            {"icon": "🔡", "label": self.lang.get("menu.items.sort_lines_natural"), "command": lambda: tm.transform_lines("sort", mode="natural")},
+            {"icon": "🧹", "label": self.lang.get("menu.items.unique_lines"), "command": lambda: tm.transform_lines("unique")},
+            {"icon": "🔃", "label": self.lang.get("menu.items.reverse_lines"), "command": lambda: tm.transform_lines("reverse")},
+            {"icon": "🔀", "label": self.lang.get("menu.items.shuffle_lines"), "command": lambda: tm.transform_lines("shuffle")},
+            {"icon": "✂️", "label": self.lang.get("menu.items.trim_trailing"), "command": lambda: tm.transform_lines("trim")},
+            {"separator": True},
             {"icon": "📋", "label": self.lang.get("menu.items.copy_path"), "shortcut": fmt(shortcuts.get("copy_path")), "command": tm.copy_path},
             {"icon": "📂", "label": self.lang.get("menu.items.relative_path"), "shortcut": fmt(shortcuts.get("copy_relative_path")), "command": tm.copy_relative_path}
         ]
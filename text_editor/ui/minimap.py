@@ -1,11 +1,14 @@
 import tkinter as tk
+from bisect import bisect_left, bisect_right
 from typing import Any, Optional, Tuple
 
 from pygments.lexer import Lexer
-from pygments.lexers import get_lexer_by_name
 
 from text_editor.config import FONT_FAMILY
-from text_editor.utils.highlighter import SyntaxHighlighter
+from text_editor.utils.highlighter import LexerRegistry, SyntaxHighlighter
+from text_editor.utils.document_model import DocumentModel
+from text_editor.utils.line_index import LineIndex
+from text_editor.utils.tokenizer import TokenCache
 
 # Yapılandırma Sabitleri
 MINIMAP_WIDTH: int = 20
@@ -15,6 +18,93 @@ HOVER_TAG: str = "hover"
 MAX_HIGHLIGHT_CHARS: int = 100000  # Büyük dosyalar için vurgulamayı devre dışı bırak
 UPDATE_DELAY_MS: int = 50
 
+# Satır düzenlemesi: (ilk satır, eski belgedeki son satır, yeni belgedeki son satır); satırlar 1'den başlar
+LineEdit = Tuple[int, int, int]
+
+
+def merge_line_edits(pending: Optional[LineEdit], edit: LineEdit) -> LineEdit:
+    """
+    Ardışık iki satır düzenlemesini tek bir düzenlemede birleştirir.
+    `edit`, `pending` uygulanmış belgeye göredir. Sonuç, ilk belgeden son belgeye giden
+    (gerekirse fazladan satır içeren) tek bir aralıktır.
+    """
+    if pending is None:
+        return edit
+    first, old_last, new_last = pending
+    edit_first, edit_old_last, edit_new_last = edit
+    shift = new_last - old_last
+    merged_old_last = max(old_last, edit_old_last - shift)
+    return (min(first, edit_first), merged_old_last,
+            merged_old_last + shift + (edit_new_last - edit_old_last))
+
+
+def splice_lines(content: str, line_index: LineIndex, first: int, old_last: int, new_text: str) -> str:
+    """`content` içindeki [first, old_last] satırlarını (satır sonları hariç) `new_text` ile değiştirir."""
+    begin = line_index.line_start(first)
+    if old_last < line_index.line_count:
+        end = line_index.line_start(old_last + 1) - 1
+    else:
+        end = len(content)
+    return content[:begin] + new_text + content[end:]
+
+
+def calculate_viewport_color(widget: tk.Misc, bg_color: str) -> str:
+    """Arka plan rengine göre uygun bir viewport rengi hesaplar."""
+    try:
+        # winfo_rgb kullanarak rengi ayrıştır (isimleri ve hex kodlarını destekler)
+        # winfo_rgb 16-bit değerler döndürür (0-65535), 8-bite çeviriyoruz
+        rgb = widget.winfo_rgb(bg_color)
+        r, g, b = rgb[0] // 256, rgb[1] // 256, rgb[2] // 256
+
+        # Parlaklık hesapla (Luma)
+        brightness = (r * 0.299 + g * 0.587 + b * 0.114)
+
+        # Eğer arka plan koyu ise, viewport daha açık olmalı (ama çok parlak değil)
+        # Eğer arka plan açık ise, viewport daha koyu olmalı
+
+        if brightness < 128:  # Koyu Tema
+            # Rengi biraz aç (%20)
+            factor = 1.2
+            new_r = min(255, int(r * factor + 30))
+            new_g = min(255, int(g * factor + 30))
+            new_b = min(255, int(b * factor + 30))
+        else:  # Açık Tema
+            # Rengi koyulaştır (%20)
+            factor = 0.8
+            new_r = max(0, int(r * factor - 30))
+            new_g = max(0, int(g * factor - 30))
+            new_b = max(0, int(b * factor - 30))
+
+        return f"#{new_r:02x}{new_g:02x}{new_b:02x}"
+    except Exception:
+        return "#3e3e42"
+
+
+def calculate_hover_color(widget: tk.Misc, bg_color: str) -> str:
+    """Arka plan rengine göre uygun bir hover (üzerine gelme) rengi hesaplar."""
+    try:
+        rgb = widget.winfo_rgb(bg_color)
+        r, g, b = rgb[0] // 256, rgb[1] // 256, rgb[2] // 256
+
+        brightness = (r * 0.299 + g * 0.587 + b * 0.114)
+
+        if brightness < 128:  # Koyu Tema
+            # Viewport'tan daha hafif bir aydınlatma
+            factor = 1.1
+            new_r = min(255, int(r * factor + 15))
+            new_g = min(255, int(g * factor + 15))
+            new_b = min(255, int(b * factor + 15))
+        else:  # Açık Tema
+            # Viewport'tan daha hafif bir koyulaştırma
+            factor = 0.95
+            new_r = max(0, int(r * factor - 10))
+            new_g = max(0, int(g * factor - 10))
+            new_b = max(0, int(b * factor - 10))
+
+        return f"#{new_r:02x}{new_g:02x}{new_b:02x}"
+    except Exception:
+        return "#4e4e52"
+
 
 class Minimap(tk.Text):
     """
@@ -22,13 +112,18 @@ class Minimap(tk.Text):
     Görsel genel bakış ve doğrudan gezinme işlevselliği sağlar.
     """
 
-    def __init__(self, master: tk.Widget, main_text: tk.Text, **kwargs: Any) -> None:
+    def __init__(self, master: tk.Widget, main_text: tk.Text,
+                 token_cache: Optional[TokenCache] = None, document: Optional[DocumentModel] = None,
+                 **kwargs: Any) -> None:
         """
         Minimap aracını başlatır.
 
         Argümanlar:
             master: Ebeveyn pencere öğesi.
             main_text: Senkronize edilecek ana metin düzenleyici pencere öğesi.
+            token_cache: Editörün vurgulayıcısının token yayınladığı paylaşılan önbellek.
+                Verilirse minimap kendi lexing'ini yapmaz, önbellekteki token'ları uygular.
+            document: Editörün DocumentModel'i. Verilirse içerik ve satırlar Tk yerine buradan okunur.
             **kwargs: Metin (Text) pencere öğesi için ek yapılandırma seçenekleri.
         """
         super().__init__(
@@ -45,11 +140,29 @@ class Minimap(tk.Text):
         )
         
         self.main_text = main_text
+        self.document = document
         self.highlighter: Optional[SyntaxHighlighter] = SyntaxHighlighter(self)
-        self.current_lexer: Optional[Lexer] = get_lexer_by_name("text")
+        self.current_lexer: Optional[Lexer] = LexerRegistry.get_instance().get_lexer_by_name("text")
         
         self._update_task: Optional[str] = None
-        self._last_content_hash: Optional[int] = None
+
+        # Ana metnin Python tarafındaki kopyası ve henüz uygulanmamış satır düzenlemeleri.
+        # Düzenleme bildirilmeden yapılan güncellemeler (update_content) tüm içeriği karşılaştırır.
+        self._content: Optional[str] = None
+        self._line_index: Optional[LineIndex] = None
+        self._pending_edit: Optional[LineEdit] = None
+        self._full_refresh = True
+
+        # Paylaşılan token önbelleği; içerik için henüz token yayınlanmadıysa vurgulama bekletilir.
+        # Yayınların değişen aralıkları birleştirilir ve sadece o aralık yeniden etiketlenir.
+        self.token_cache = token_cache
+        self._retag_all = True
+        self._retag_range: Optional[Tuple[int, int]] = None
+        self._seen_token_version = 0
+        self._published_length = 0
+        if token_cache is not None:
+            token_cache.add_listener(self._on_tokens_published)
+            self.bind("<Destroy>", lambda e: token_cache.remove_listener(self._on_tokens_published), add="+")
         
         self._configure_appearance()
         self._bind_events()
@@ -74,8 +187,22 @@ class Minimap(tk.Text):
     def update_content(self, event: Optional[tk.Event] = None) -> None:
         """
         Minimap içeriğini ana metin düzenleyici ile senkronize eder.
-        Performans için debouncing (gecikmeli güncelleme) kullanır.
+        Neyin değiştiği bilinmediği için tüm içerik karşılaştırılır; düzenlenen satırlar
+        biliniyorsa notify_edit kullanılmalıdır. Performans için debouncing (gecikmeli güncelleme) kullanır.
+        """
+        self._full_refresh = True
+        self._schedule_update()
+
+    def notify_edit(self, first_line: int, old_last_line: int, new_last_line: int) -> None:
+        """
+        Ana metinde [first_line, old_last_line] satırlarının [first_line, new_last_line]
+        satırlarıyla değiştirildiğini bildirir. Bir sonraki güncellemede sadece bu satırlar
+        ana metinden okunup minimapte değiştirilir; art arda gelen düzenlemeler birleştirilir.
         """
+        self._pending_edit = merge_line_edits(self._pending_edit, (first_line, old_last_line, new_last_line))
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
         if self._update_task:
             self.after_cancel(self._update_task)
             
@@ -92,39 +219,124 @@ class Minimap(tk.Text):
         """Gerçek içerik güncelleme işlemi."""
         self._update_task = None
         try:
-            # Ana düzenleyiciden geçerli içeriği al
-            content = self.main_text.get("1.0", "end-1c")
-            content_hash = hash(content)
-            
-            # OPTİMİZASYON: İçerik değişmediyse sadece görünüm alanını güncelle
-            if self._last_content_hash == content_hash:
-                self._update_viewport_indicator()
-                return
-            
-            self._last_content_hash = content_hash
-            
-            # Minimap içeriğini güncelle
-            self.configure(state="normal")
-            self.replace("1.0", "end", content)
-            
+            edit, self._pending_edit = self._pending_edit, None
+            if self._full_refresh or self._content is None or not self._patch_lines(edit):
+                self._refresh_all()
+            self._full_refresh = False
+
             # OPTİMİZASYON: Çok büyük dosyalarda vurgulamayı atla
-            if len(content) < MAX_HIGHLIGHT_CHARS:
-                self._highlight_content(content)
-            
-            self.configure(state="disabled")
-            
+            if len(self._content) < MAX_HIGHLIGHT_CHARS:
+                self._highlight_content(self._content)
+
             # Görünüm alanını güncelle
             self._update_viewport_indicator()
         except Exception:
             pass
 
+    def _refresh_all(self) -> None:
+        """Ana metnin tamamını okur; içerik değiştiyse minimap metnini baştan yazar."""
+        if self.document is not None:
+            content = self.document.text()
+        else:
+            content = self.main_text.get("1.0", "end-1c")
+        if content == self._content:
+            return
+        self._set_text("1.0", "end", content)
+        self._content = content
+        self._line_index = None
+        self._retag_all = True
+
+    def _patch_lines(self, edit: Optional[LineEdit]) -> bool:
+        """
+        Bildirilen satır düzenlemesini uygular: sadece değişen satırlar ana metinden okunur ve
+        minimapte değiştirilir. Düzenleme belgeyle tutarsızsa False döner (tam yenileme gerekir).
+        """
+        if edit is None:
+            return True
+        first, old_last, new_last = edit
+        if self._line_index is None:
+            self._line_index = LineIndex(self._content)
+        line_count = self._line_index.line_count
+        new_count = (self.document.line_count if self.document is not None
+                     else int(self.main_text.index("end-1c").split(".")[0]))
+        if not (1 <= first <= old_last <= line_count and first <= new_last
+                and new_count == line_count + new_last - old_last):
+            return False
+
+        if self.document is not None:
+            new_text = self.document.get_lines(first, new_last)
+        else:
+            new_text = self.main_text.get(f"{first}.0", f"{new_last}.0 lineend")
+        self._set_text(f"{first}.0", f"{old_last}.0 lineend", new_text)
+        if self.document is not None:
+            self._content = self.document.text()
+        else:
+            self._content = splice_lines(self._content, self._line_index, first, old_last, new_text)
+        self._line_index = None
+        if self.token_cache is None:
+            self._retag_all = True  # Kendi lexing'imiz tüm belgeyi yeniden etiketler
+        return True
+
+    def _set_text(self, start: str, end: str, text: str) -> None:
+        self.configure(state="normal")
+        self.replace(start, end, text)
+        self.configure(state="disabled")
+
     def _highlight_content(self, content: str) -> None:
-        """Minimap içeriğine sözdizimi vurgulaması uygular."""
-        if self.highlighter and self.current_lexer:
-            try:
+        """
+        Minimap içeriğine sözdizimi vurgulaması uygular.
+        Paylaşılan önbellek varsa editörün token'ları kullanılır ve sadece son yayınlarda
+        değişen aralık yeniden etiketlenir; önbellek yoksa içerik burada lexlenir.
+        """
+        if not (self.highlighter and self.current_lexer):
+            return
+        try:
+            if not (self._retag_all or self._retag_range):
+                return
+            if self.token_cache is None:
                 self.highlighter.highlight(content, self.current_lexer)
-            except Exception:
-                pass
+                self._retag_all = False
+                return
+            tokens = self.token_cache.lookup(content, self.current_lexer)
+            # Editör bu içeriği henüz lexlemediyse yayın geldiğinde uygulanır
+            if tokens is None:
+                return
+            if self._retag_all:
+                self.highlighter.highlight_tokens(content, tokens, self.current_lexer)
+            else:
+                starts = self.token_cache.token_starts()
+                begin, end = self._retag_range
+                first = max(bisect_right(starts, begin) - 1, 0)
+                last = min(max(bisect_left(starts, end), first + 1), len(tokens))
+                self.highlighter.highlight_tokens(content, tokens[first:last], self.current_lexer,
+                                                  starts[first], min(starts[last], len(content)))
+            self._retag_all = False
+            self._retag_range = None
+        except Exception:
+            pass
+
+    def _on_tokens_published(self) -> None:
+        """
+        Önbelleğe yeni token'lar yayınlandığında değişen aralığı biriktirir ve güncelleme planlar.
+        Aralıklar en son içeriğin konumlarına kaydırılarak birleştirilir; bir yayın kaçırıldıysa
+        (ör. önbellek geçersiz kılındıysa) tüm belge yeniden etiketlenir.
+        """
+        cache = self.token_cache
+        changed = cache.changed
+        if changed is None or cache.version != self._seen_token_version + 1:
+            self._retag_all = True
+        elif not self._retag_all:
+            if self._retag_range is None:
+                self._retag_range = changed
+            else:
+                begin, end = self._retag_range
+                delta = len(cache.content) - self._published_length
+                # Değişen aralıktan sonraki konumlar uzunluk farkı kadar kayar
+                self._retag_range = (min(begin, changed[0]),
+                                     max(changed[1], end + delta if end >= changed[0] else end))
+        self._seen_token_version = cache.version
+        self._published_length = len(cache.content)
+        self._schedule_update()
 
     def on_scroll(self, *args: Any) -> None:
         """
@@ -137,20 +349,31 @@ class Minimap(tk.Text):
     def _update_viewport_indicator(self) -> None:
         """Kodun şu anda görünen kısmını göstermek için görünüm alanı vurgulayıcısını günceller."""
         try:
-            self.tag_remove(VIEWPORT_TAG, "1.0", "end")
-            
             # Ana metinde görünen aralığı hesapla
             start_index = self.main_text.index("@0,0")
             height = self.main_text.winfo_height()
             end_index = self.main_text.index(f"@0,{height}")
             
-            # Vurgulamayı minimap'teki karşılık gelen aralığa uygula
-            self.tag_add(VIEWPORT_TAG, start_index, end_index)
-            self.tag_raise(VIEWPORT_TAG)
+            # Vurgulamayı minimap'teki karşılık gelen aralığa taşı
+            self._move_tag(VIEWPORT_TAG, start_index, end_index)
             
         except Exception:
             pass
 
+    def _move_tag(self, tag: str, start_index: str, end_index: str) -> None:
+        """
+        Etiketi sadece mevcut aralığından kaldırıp yeni aralığa ekler; 1.0..end üzerinde
+        tag_remove yapılmaz. Aralık değişmediyse hiçbir şey yapılmaz.
+        """
+        ranges = self.tag_ranges(tag)
+        if ranges:
+            old_start, old_end = str(ranges[0]), str(ranges[-1])
+            if (old_start, old_end) == (self.index(start_index), self.index(end_index)):
+                return
+            self.tag_remove(tag, old_start, old_end)
+        self.tag_add(tag, start_index, end_index)
+        self.tag_raise(tag)
+
     def _on_click(self, event: tk.Event) -> str:
         """Tıklanan konumu merkeze alacak şekilde kaydırır."""
         self._jump_to_position(event.y, center=True)
@@ -231,88 +454,38 @@ class Minimap(tk.Text):
 
     def _calculate_viewport_color(self, bg_color: str) -> str:
         """Arka plan rengine göre uygun bir viewport rengi hesaplar."""
-        try:
-            # winfo_rgb kullanarak rengi ayrıştır (isimleri ve hex kodlarını destekler)
-            # winfo_rgb 16-bit değerler döndürür (0-65535), 8-bite çeviriyoruz
-            rgb = self.winfo_rgb(bg_color)
-            r, g, b = rgb[0] // 256, rgb[1] // 256, rgb[2] // 256
-            
-            # Parlaklık hesapla (Luma)
-            brightness = (r * 0.299 + g * 0.587 + b * 0.114)
-            
-            # Eğer arka plan koyu ise, viewport daha açık olmalı (ama çok parlak değil)
-            # Eğer arka plan açık ise, viewport daha koyu olmalı
-            
-            if brightness < 128:  # Koyu Tema
-                # Rengi biraz aç (%20)
-                factor = 1.2
-                new_r = min(255, int(r * factor + 30))
-                new_g = min(255, int(g * factor + 30))
-                new_b = min(255, int(b * factor + 30))
-            else:  # Açık Tema
-                # Rengi koyulaştır (%20)
-                factor = 0.8
-                new_r = max(0, int(r * factor - 30))
-                new_g = max(0, int(g * factor - 30))
-                new_b = max(0, int(b * factor - 30))
-                
-            return f"#{new_r:02x}{new_g:02x}{new_b:02x}"
-        except Exception:
-            return "#3e3e42"
+        return calculate_viewport_color(self, bg_color)
 
     def _calculate_hover_color(self, bg_color: str) -> str:
         """Arka plan rengine göre uygun bir hover (üzerine gelme) rengi hesaplar."""
-        try:
-            rgb = self.winfo_rgb(bg_color)
-            r, g, b = rgb[0] // 256, rgb[1] // 256, rgb[2] // 256
-            
-            brightness = (r * 0.299 + g * 0.587 + b * 0.114)
-            
-            if brightness < 128:  # Koyu Tema
-                # Viewport'tan daha hafif bir aydınlatma
-                factor = 1.1
-                new_r = min(255, int(r * factor + 15))
-                new_g = min(255, int(g * factor + 15))
-                new_b = min(255, int(b * factor + 15))
-            else:  # Açık Tema
-                # Viewport'tan daha hafif bir koyulaştırma
-                factor = 0.95
-                new_r = max(0, int(r * factor - 10))
-                new_g = max(0, int(g * factor - 10))
-                new_b = max(0, int(b * factor - 10))
-                
-            return f"#{new_r:02x}{new_g:02x}{new_b:02x}"
-        except Exception:
-            return "#4e4e52"
+        return calculate_hover_color(self, bg_color)
 
     def _on_motion(self, event: tk.Event) -> None:
         """Fare hareketi sırasında altındaki satırı vurgular."""
         try:
-            # Önceki vurguyu temizle
-            self.tag_remove(HOVER_TAG, "1.0", "end")
-            
             # Fare konumundaki satırı bul
             index = self.index(f"@0,{event.y}")
             line = index.split('.')[0]
             
-            # Sadece fare altındaki satırı vurgula
-            self.tag_add(HOVER_TAG, f"{line}.0", f"{line}.end+1c")
+            # Vurguyu sadece fare altındaki satıra taşı
+            self._move_tag(HOVER_TAG, f"{line}.0", f"{line}.end+1c")
         except Exception:
             pass
 
     def _on_leave(self, event: tk.Event) -> None:
         """Fare minimap'ten ayrıldığında vurguyu temizler."""
-        self.tag_remove(HOVER_TAG, "1.0", "end")
+        ranges = self.tag_ranges(HOVER_TAG)
+        if ranges:
+            self.tag_remove(HOVER_TAG, ranges[0], ranges[-1])
 
     def set_lexer(self, lexer: Any) -> None:
         """Sözdizimi lexer'ını ayarlar ve içeriği yeniler."""
         self.current_lexer = lexer
-        self._last_content_hash = None # Zorla yenile
+        self._retag_all = True
         self.update_content()
 
     def update_style(self, style_name: str) -> None:
-        """Sözdizimi vurgulama stil şemasını günceller."""
+        """Sözdizimi vurgulama stil şemasını günceller (etiket renkleri yeniden yapılandırılır)."""
         if self.highlighter:
-            self.highlighter.update_style(style_name)
-            self._last_content_hash = None # Zorla yenile
-            self.update_content()
+            self.highlighter.style_name = style_name
+            self.highlighter.setup_tags()
@@ -194,8 +194,36 @@ class SearchDialog(ctk.CTkToplevel):
         
         return is_word_start and is_word_end
 
+    def _get_large_file_viewer(self):
+        """Aktif sekme büyük dosya görüntüleyicisiyse onu döndürür (arama eşleme üzerinde yapılır)."""
+        editor = self.tab_manager.get_current_editor()
+        return editor if editor is not None and hasattr(editor, "search_file") else None
+
+    def _find_in_viewer(self, viewer, search_str: str) -> bool:
+        """Aramayı görüntüleyicide arka planda başlatır; sonuç geldiğinde durum güncellenir."""
+        def on_result(found: bool, wrapped: bool):
+            if not self.winfo_exists():
+                return
+            if not found:
+                self._update_status(f"'{search_str}' bulunamadı.", True)
+            else:
+                self._update_status("Baştan devam ediliyor." if wrapped else f"'{search_str}' bulundu.")
+
+        self._update_status("Aranıyor...")
+        viewer.search_file(search_str, nocase=not self.match_case_var.get(),
+                    whole_word=self.whole_word_var.get(), on_result=on_result)
+        return True
+
     def find_next(self) -> bool:
         """Sıradaki eşleşmeyi bulur ve seçer."""
+        viewer = self._get_large_file_viewer()
+        if viewer is not None:
+            search_str = self.search_var.get()
+            if not search_str:
+                self._update_status("Lütfen aranacak metni girin.", True)
+                return False
+            return self._find_in_viewer(viewer, search_str)
+
         text_widget = self._get_active_text_widget()
         if not text_widget:
             return False
@@ -245,6 +273,9 @@ class SearchDialog(ctk.CTkToplevel):
 
     def replace_one(self):
         """Seçili metni değiştirir ve sonrakini bulur."""
+        if self._get_large_file_viewer() is not None:
+            self._update_status("Büyük dosyalar salt okunur açılır; değiştirme yapılamaz.", True)
+            return
         text_widget = self._get_active_text_widget()
         if not text_widget: return
         
@@ -272,8 +303,12 @@ class SearchDialog(ctk.CTkToplevel):
 
     def replace_all(self):
         """Tüm eşleşmeleri değiştirir."""
+        if self._get_large_file_viewer() is not None:
+            self._update_status("Büyük dosyalar salt okunur açılır; değiştirme yapılamaz.", True)
+            return
         text_widget = self._get_active_text_widget()
         if not text_widget: return
+        editor = self.tab_manager.get_current_editor()
         
         search_str = self.search_var.get()
         if not search_str: return
@@ -284,20 +319,22 @@ class SearchDialog(ctk.CTkToplevel):
         count = 0
         current_pos = "1.0"
         
-        while True:
-            # Arama yap
-            pos = text_widget.search(search_str, current_pos, stopindex="end", nocase=nocase)
-            if not pos:
-                break
+        # Tüm değiştirmeler tek adımda geri alınır
+        with editor.undo.transaction():
+            while True:
+                # Arama yap
+                pos = text_widget.search(search_str, current_pos, stopindex="end", nocase=nocase)
+                if not pos:
+                    break
+                    
+                end_pos = f"{pos}+{len(search_str)}c"
                 
-            end_pos = f"{pos}+{len(search_str)}c"
-            
-            if self._is_whole_word_match(text_widget, pos, end_pos):
-                text_widget.delete(pos, end_pos)
-                text_widget.insert(pos, replace_str)
-                count += 1
-                current_pos = f"{pos}+{len(replace_str)}c"
-            else:
-                current_pos = f"{pos}+1c"
+                if self._is_whole_word_match(text_widget, pos, end_pos):
+                    text_widget.delete(pos, end_pos)
+                    text_widget.insert(pos, replace_str)
+                    count += 1
+                    current_pos = f"{pos}+{len(replace_str)}c"
+                else:
+                    current_pos = f"{pos}+1c"
             
         self._update_status(f"Toplam {count} değişiklik yapıldı.")
@@ -12,18 +12,21 @@ from text_editor.utils.file_monitor import FileMonitor
 from text_editor.theme_config import DARK_THEME
 from text_editor.ui.context_menu import ModernContextMenu 
 from text_editor.utils.settings_manager import SettingsManager
+from text_editor.utils.event_bus import TIER_HIGHLIGHT
 try:
     from text_editor.utils.file_icons import FileIcons
 except ImportError:
     FileIcons = None
 
 from text_editor.utils.session_manager import SessionManager
+from text_editor.utils.save_service import SaveService
+from text_editor.utils.recovery_journal import RecoveryJournal
+from text_editor.utils.autosave_scheduler import AutoSaveScheduler
 
 # Günlüğe kaydetmeyi yapılandır
 logger = logging.getLogger(__name__)
 
 # Sabitler
-AUTO_SAVE_INTERVAL_MS = 30000  # 30 seconds
 DEFAULT_FONT = ("Segoe UI", 13)
 IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp'}
 KNOWN_TAB_PREFIXES = ["Adsız", "Untitled"]
@@ -60,6 +63,9 @@ class TabManager(ctk.CTkFrame):
         
         # Oturumu geri yükle
         self._restore_session()
+        
+        # Çökme sonrası kaydedilmemiş belgeleri kurtar
+        self._recover_unsaved_buffers()
 
     def _init_state(self):
         """Dahili durum değişkenlerini başlatır."""
@@ -105,7 +111,8 @@ class TabManager(ctk.CTkFrame):
     def _start_services(self):
         """Arka plan hizmetlerini başlatır (Dosya izleyici, Otomatik kaydetme)."""
         self.file_monitor = FileMonitor(self.on_file_changed)
-        self.after(AUTO_SAVE_INTERVAL_MS, self.auto_save_loop)
+        self.auto_saver = AutoSaveScheduler(self, lambda: self.editors, self._auto_save_tab)
+        self.auto_saver.start()
         self._process_message_queue()
 
     # === CTkTabview Uyumluluk Yöntemleri ===
@@ -273,20 +280,31 @@ class TabManager(ctk.CTkFrame):
 
     # === Çekirdek Mantık ===
 
-    def auto_save_loop(self):
-        """Periyodik otomatik kaydetme döngüsü."""
-        for name, editor in self.editors.items():
-            if editor.file_path and editor.content_modified:
-                try:
-                    current_path = editor.file_path
-                    editor.save_file()
-                    filename = os.path.basename(current_path)
-                    self._update_status(f"Otomatik kaydedildi: {filename}", "success", 2000)
-                    self._update_tab_visuals(name)
-                except Exception as e:
-                    logger.error(f"Auto-save failed for {name}: {e}")
-        
-        self.after(AUTO_SAVE_INTERVAL_MS, self.auto_save_loop)
+    def _auto_save_tab(self, name: str, editor: CodeEditor):
+        """Zamanlayıcının sıradaki otomatik kaydı: anlık görüntü alınır, yazma arka planda yapılır."""
+        def on_complete(result):
+            if result.ok:
+                self._on_save_finished(name, editor, result, "Otomatik kaydedildi")
+            else:
+                # Otomatik kayıt hatası iletişim kutusu açmaz; belge değiştirilmiş kalır
+                logger.error(f"Auto-save failed for {name}: {result.error}")
+                self._update_status(f"Otomatik kayıt başarısız: {os.path.basename(result.path)}", "error", 3000)
+        try:
+            editor.save_file(on_complete=on_complete)
+        except Exception as e:
+            logger.error(f"Auto-save failed for {name}: {e}")
+
+    def _on_save_finished(self, tab_name: str, editor: CodeEditor, result, message: str) -> bool:
+        """Arka plandaki kayıt bitince çağrılır: başarıyı durum çubuğunda, hatayı iletişim kutusunda bildirir."""
+        if not result.ok:
+            messagebox.showerror("Error", f"Could not save file: {result.error}")
+            if self.editors.get(tab_name) is editor:
+                self._update_tab_visuals(tab_name)
+            return False
+        if self.editors.get(tab_name) is editor:
+            self._update_tab_visuals(tab_name)
+        self._update_status(f"{message}: {os.path.basename(result.path)}", "success", 2000)
+        return True
 
     def add_new_tab(self, name: str = None) -> str:
         """Yeni sekme oluşturur ve editörü başlatır."""
@@ -366,8 +384,7 @@ class TabManager(ctk.CTkFrame):
         editor.grid(row=0, column=0, sticky="nsew")
         self.editors[tab_name] = editor
 
-        editor.text_area.bind("<KeyRelease>", lambda e: self._on_editor_content_changed(tab_name), add="+")
-        editor.text_area.bind("<<Change>>", lambda e: self._on_editor_content_changed(tab_name), add="+")
+        editor.events.subscribe(lambda changes: self._on_editor_content_changed(tab_name), TIER_HIGHLIGHT)
 
     def _on_editor_content_changed(self, tab_name: str):
         """Editör içeriği değiştiğinde çağrılır."""
@@ -439,19 +456,36 @@ class TabManager(ctk.CTkFrame):
             if response is None: 
                 return
             elif response is True: 
+                # Sekme ve kurtarma günlüğü ancak yazma başarıyla bittikten sonra kapatılır
+                on_complete = lambda result: self._close_after_save(name, editor, result)
                 if editor.file_path:
-                    editor.save_file()
+                    editor.save_file(on_complete=on_complete)
                 else:
                     self.set(name)
-                    self.save_current_file_as()
-                    if editor.content_modified:
-                        return
+                    self.save_current_file_as(on_complete=on_complete)
+                return
 
         self.close_tab(name)
 
+    def _close_after_save(self, name: str, editor: CodeEditor, result):
+        """Kapatma öncesi kaydın sonucu: başarılıysa sekme kapanır, hata varsa sekme açık kalır."""
+        if not self._on_save_finished(name, editor, result, "Kaydedildi"):
+            return
+        if self.editors.get(name) is not editor:
+            return
+        if editor.content_modified:
+            # Yazma sürerken yeni değişiklik yapıldı; kullanıcıya yeniden sorulur
+            self.check_and_close_tab(name)
+            return
+        self.close_tab(name)
+
     def close_tab(self, name: str):
         """Sekmeyi kapatır ve kaynakları temizler."""
         if name in self.editors:
+            # Kullanıcı kaydetme kararını verdi; kurtarma günlüğü silinir
+            journal = getattr(self.editors[name], 'journal', None)
+            if journal is not None:
+                journal.close(discard=True)
             del self.editors[name]
         
         # UI'dan sil
@@ -542,20 +576,25 @@ class TabManager(ctk.CTkFrame):
         return (is_untitled and 
                 current_editor and 
                 not current_editor.content_modified and 
-                len(current_editor.text_area.get("1.0", "end-1c")) == 0)
+                current_editor.document.char_count == 0)
 
     def _load_file_into_tab(self, tab_name: str, file_path: str) -> bool:
         """Dosyayı sekmeye yükler. Başarılı olursa True döner."""
         try:
             ext = os.path.splitext(file_path)[1].lower()
             is_image = ext in IMAGE_EXTENSIONS
+            is_large = not is_image and self._is_large_file(file_path)
             current_view = self.editors[tab_name]
             
             if is_image:
                 from text_editor.ui.image_viewer import ImageViewer
                 if not isinstance(current_view, ImageViewer):
                     self._replace_tab_content(tab_name, ImageViewer)
-            elif not is_image and not isinstance(current_view, CodeEditor):
+            elif is_large:
+                from text_editor.ui.large_file_viewer import LargeFileViewer
+                if not isinstance(current_view, LargeFileViewer):
+                    self._replace_tab_content(tab_name, LargeFileViewer)
+            elif not isinstance(current_view, CodeEditor):
                 self._replace_tab_content(tab_name, CodeEditor)
                 
             editor = self.editors[tab_name]
@@ -575,6 +614,20 @@ class TabManager(ctk.CTkFrame):
             self._update_status(f"Dosya açılamadı: {os.path.basename(file_path)}", "error", 3000)
             return False
 
+    def _is_large_file(self, file_path: str) -> bool:
+        """
+        Dosya `max_file_size` (MB) sınırını aşıyorsa ve kodlaması uygunsa salt okunur
+        sayfalı görüntüleyicide açılır (UTF-16/32 dosyalar editörde akışla yüklenir).
+        """
+        try:
+            limit_mb = float(SettingsManager.get_instance().get("max_file_size", 10))
+            if os.path.getsize(file_path) <= limit_mb * 1024 * 1024:
+                return False
+        except (OSError, TypeError, ValueError):
+            return False
+        from text_editor.ui.large_file_viewer import LargeFileViewer
+        return LargeFileViewer.can_open(file_path)
+
     def _replace_tab_content(self, tab_name: str, view_class):
         if tab_name in self.editors:
             self.editors[tab_name].destroy()
@@ -589,8 +642,7 @@ class TabManager(ctk.CTkFrame):
         self.editors[tab_name] = new_view
         
         if isinstance(new_view, CodeEditor):
-            new_view.text_area.bind("<KeyRelease>", lambda e: self._on_editor_content_changed(tab_name), add="+")
-            new_view.text_area.bind("<<Change>>", lambda e: self._on_editor_content_changed(tab_name), add="+")
+            new_view.events.subscribe(lambda changes: self._on_editor_content_changed(tab_name), TIER_HIGHLIGHT)
 
     def _load_file_into_new_tab(self, file_path: str):
         filename = os.path.basename(file_path)
@@ -630,6 +682,65 @@ class TabManager(ctk.CTkFrame):
                     self.set(name)
                     break
 
+    def _recover_unsaved_buffers(self):
+        """
+        Önceki oturum kapanmadan önce kaydedilmemiş belgeleri kurtarma günlüğünden geri
+        yükler. Dosyaya bağlı belgeler o dosyanın sekmesine (gerekirse açılarak), adsız
+        belgeler yeni sekmelere yerleştirilir ve değiştirilmiş olarak işaretlenir.
+
+        Dosyası hâlâ akışla yüklenen sekmelerde kurtarma yükleme bitince uygulanır. Günlük
+        kaydı sadece belge kurtarılan içerikle aynı olduktan sonra silinir.
+        """
+        journal = RecoveryJournal.get_instance()
+        recovered = journal.load_recoverable()
+        if not recovered:
+            return
+        
+        if not messagebox.askyesno(
+            "Kurtarma",
+            f"Önceki oturumdan kaydedilmemiş {len(recovered)} belge bulundu.\nGeri yüklensin mi?"
+        ):
+            for buffer in recovered:
+                journal.discard(buffer.journal_id)
+            return
+        
+        for buffer in recovered:
+            tab_name = None
+            if buffer.file_path and os.path.exists(buffer.file_path):
+                for name, editor in self.editors.items():
+                    if editor.file_path and os.path.abspath(editor.file_path) == os.path.abspath(buffer.file_path):
+                        tab_name = name
+                        break
+                else:
+                    tab_name = self.add_new_tab(os.path.basename(buffer.file_path))
+                    self._load_file_into_tab(tab_name, buffer.file_path)
+            
+            editor = self.editors.get(tab_name) if tab_name else None
+            if not isinstance(editor, CodeEditor):
+                tab_name = self.get_current_tab_name() if self._should_use_current_tab() else self.add_new_tab()
+                editor = self.editors[tab_name]
+            
+            editor.when_loaded(lambda t=tab_name, e=editor, b=buffer: self._apply_recovered_buffer(t, e, b))
+        
+        self._update_status(f"{len(recovered)} kaydedilmemiş belge kurtarılıyor.", "success", 3000)
+
+    def _apply_recovered_buffer(self, tab_name: str, editor: CodeEditor, buffer):
+        """Kurtarılan içeriği (yüklemesi bitmiş) editöre uygular; başarılıysa günlük kaydını siler."""
+        if self.editors.get(tab_name) is not editor:
+            return  # Sekme bu sırada kapatıldı; kayıt bir sonraki açılışta yeniden sunulur
+        if editor.document.text() != buffer.text:
+            # Tek bir düzenleme olarak uygulanır; Ctrl+Z diskteki sürüme döndürür
+            editor.text_area.replace("1.0", "end-1c", buffer.text)
+            editor.content_modified = True
+        if editor.document.text() != buffer.text:
+            logger.error(f"Kurtarma uygulanamadı ({buffer.file_path or tab_name}); günlük kaydı korunuyor.")
+            self._update_status(f"Kurtarma uygulanamadı: {self.get_display_name(tab_name)}", "error", 3000)
+            return
+        # Kaydedilirken kurtarılan belgenin kodlaması kullanılır
+        editor.encoding = buffer.encoding or editor.encoding
+        self._update_tab_visuals(tab_name)
+        RecoveryJournal.get_instance().discard(buffer.journal_id)
+
     def _save_session_state(self):
         """Mevcut durumu SessionManager ile kaydeder."""
         open_files = []
@@ -649,34 +760,42 @@ class TabManager(ctk.CTkFrame):
             return
 
         if editor.file_path:
-            editor.save_file()
-            self._update_tab_visuals(self.get_current_tab_name())
-            self._update_status(f"Kaydedildi: {os.path.basename(editor.file_path)}", "success", 2000)
+            tab_name = self.get_current_tab_name()
+            editor.save_file(on_complete=lambda result: self._on_save_finished(tab_name, editor, result, "Kaydedildi"))
+            self._update_tab_visuals(tab_name)
         else:
             self.save_current_file_as()
 
-    def save_current_file_as(self):
+    def save_current_file_as(self, on_complete: Callable = None) -> bool:
+        """
+        Geçerli belgeyi yeni bir yola kaydeder. Kayıt sıraya konduysa True döner; sonuç
+        `on_complete(result)` ile (verilmemişse durum çubuğunda) bildirilir.
+        """
         editor = self.get_current_editor()
         if not editor:
-            return
+            return False
 
         file_path = filedialog.asksaveasfilename(defaultextension=".txt")
         if not file_path:
-            return
+            return False
 
         old_path = editor.file_path
         editor.file_path = file_path
+        tab_name = self.get_current_tab_name()
+        if on_complete is None:
+            on_complete = lambda result: self._on_save_finished(tab_name, editor, result, "Farklı kaydedildi")
         
-        if editor.save_file():
-            editor.set_lexer_from_file(file_path)
-            
-            if old_path:
-                self.file_monitor.remove_file(old_path)
-            self.file_monitor.add_file(file_path)
-            
-            current_tab_name = self.get_current_tab_name()
-            self._update_tab_visuals(current_tab_name)
-            self._update_status(f"Farklı kaydedildi: {os.path.basename(file_path)}", "success")
+        if not editor.save_file(on_complete=on_complete):
+            editor.file_path = old_path  # Kayıt reddedildi (örn. yükleme sürüyor): eski yol kalır
+            return False
+        editor.set_lexer_from_file(file_path)
+        
+        if old_path:
+            self.file_monitor.remove_file(old_path)
+        self.file_monitor.add_file(file_path)
+        
+        self._update_tab_visuals(tab_name)
+        return True
 
     def on_file_changed(self, path: str):
         """Arka plan thread'inden gelen dosya değişikliğini kuyruğa ekler."""
@@ -704,6 +823,9 @@ class TabManager(ctk.CTkFrame):
 
         for name, editor in self.editors.items():
             if editor.file_path and os.path.abspath(editor.file_path) == os.path.abspath(path):
+                # Kendi (arka plan) kaydımızın ürettiği değişiklik olayları yok sayılır
+                if SaveService.get_instance().is_own_write(path):
+                    return
                 try:
                     current_mtime = os.path.getmtime(path)
                     if hasattr(editor, 'last_mtime') and abs(current_mtime - editor.last_mtime) < 2.0:
@@ -779,6 +901,12 @@ class TabManager(ctk.CTkFrame):
     def delete_line(self): self._proxy_editor_action('delete_line')
     def join_lines(self): self._proxy_editor_action('join_lines')
 
+    def transform_lines(self, operation: str, **options):
+        """Aktif editörün seçili satırlarına toplu satır dönüşümü uygular (sırala, tekrarları kaldır...)."""
+        editor = self.get_current_editor()
+        if editor and hasattr(editor, 'transform_lines'):
+            editor.transform_lines(operation, **options)
+
     def show_goto_line(self):
         editor = self.get_current_editor()
         if editor:
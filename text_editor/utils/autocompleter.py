@@ -2,6 +2,7 @@ import tkinter as tk
 import re
 import json
 import os
+from collections import Counter
 from typing import List, Dict, Set, Any, Optional, Callable
 from text_editor.theme_config import THEMES, DARK_THEME
 
@@ -14,6 +15,7 @@ class CompletionProvider:
         self.languages: Dict[str, List[Dict[str, str]]] = {}
         self.snippets: Dict[str, List[Dict[str, str]]] = {}
         self.cache: Set[str] = set()
+        self._word_counts: Counter = Counter()  # Belgedeki kelime -> geçiş sayısı
         self.load_data()
         
     def load_data(self) -> None:
@@ -38,9 +40,30 @@ class CompletionProvider:
         except Exception as e:
             print(f"AutoCompleter: Snippet'lar yüklenirken hata: {e}")
 
+    WORD_PATTERN = re.compile(r'\b[a-zA-Z_]\w+\b')
+
     def update_cache(self, text: str) -> None:
         """Belgedeki kelimeleri performans için önbelleğe alır."""
-        self.cache = set(re.findall(r'\b[a-zA-Z_]\w+\b', text))
+        self._word_counts = Counter(self.WORD_PATTERN.findall(text))
+        self.cache = set(self._word_counts)
+
+    def apply_change(self, old_text: str, new_text: str) -> None:
+        """
+        Önbelleği bir düzenlemeye göre artımlı olarak günceller.
+        `old_text` ve `new_text` düzenlemeden etkilenen satırların önceki ve sonraki hâlidir;
+        kelimeler geçiş sayısıyla tutulduğu için belgeden tamamen silinen kelimeler önbellekten düşer.
+        """
+        counts = self._word_counts
+        for word in self.WORD_PATTERN.findall(old_text):
+            remaining = counts[word] - 1
+            if remaining > 0:
+                counts[word] = remaining
+            else:
+                del counts[word]
+                self.cache.discard(word)
+        for word in self.WORD_PATTERN.findall(new_text):
+            counts[word] += 1
+            self.cache.add(word)
 
     def get_suggestions(self, word_start: str, language: str) -> List[Dict[str, str]]:
         """Verilen başlangıca göre akıllı (fuzzy-like) önerileri döndürür."""
@@ -327,8 +350,10 @@ class AutoCompleter:
     Düzenleyici için otomatik tamamlama servisi.
     Kullanıcı girişlerini dinler ve önerileri Popup üzerinden sunar.
     """
-    def __init__(self, editor_widget: tk.Text):
+    def __init__(self, editor_widget: tk.Text, change_tracker: Any = None, document: Any = None):
         self.editor = editor_widget
+        self.change_tracker = change_tracker
+        self.document = document  # Verilirse değişen satırlar widget yerine buradan okunur
         self.provider = CompletionProvider()
         self.popup = CompletionPopup(editor_widget, self.handle_selection)
         self.snippet_session: Optional[SnippetSession] = None
@@ -341,8 +366,12 @@ class AutoCompleter:
         self.editor.bind("<FocusOut>", self.on_focus_out, add="+")
         self.editor.bind("<Button-1>", self.on_click, add="+")
         
-        # Periyodik önbellek güncelleme
-        self.schedule_cache_update()
+        # Değişiklik akışı varsa kelime önbelleği düzenlemelerden artımlı güncellenir,
+        # yoksa belge periyodik olarak taranır
+        if change_tracker is not None:
+            change_tracker.add_listener(self.on_text_change)
+        else:
+            self.schedule_cache_update()
 
     def set_language(self, lexer_name: str) -> None:
         """Aktif dili ayarlar."""
@@ -388,6 +417,23 @@ class AutoCompleter:
             pass
         self.schedule_cache_update()
 
+    def on_text_change(self, change: Any) -> None:
+        """
+        ChangeTracker dinleyicisi: etkilenen satırların eski ve yeni hâlini önbelleğe uygular.
+        Yeni satırlar DocumentModel'den (yoksa widget'tan) okunur; eski hâl, eklenen metnin yerine silinen metin konarak
+        yeniden kurulur (değişikliğin önü ve arkası aynı satırlarda korunmuştur).
+        """
+        if self.document is not None:
+            new_text = self.document.get_lines(change.start_line, change.new_end_line)
+        else:
+            try:
+                new_text = self.editor.get(f"{change.start_line}.0", f"{change.new_end_line}.0 lineend")
+            except tk.TclError:
+                return
+        after = change.start_col + len(change.text)
+        old_text = new_text[:change.start_col] + change.deleted + new_text[after:]
+        self.provider.apply_change(old_text, new_text)
+
     def on_key_release(self, event: tk.Event) -> None:
         """Tuş bırakıldığında tamamlama mantığını tetikler."""
         if self._after_id:
@@ -448,7 +494,8 @@ class AutoCompleter:
             self.insert_text(item["word"])
         
         self.popup.hide()
-        self.provider.update_cache(self.editor.get("1.0", "end"))
+        if self.change_tracker is None:
+            self.provider.update_cache(self.editor.get("1.0", "end"))
         self.editor.focus_set()
 
     def insert_text(self, text: str) -> None:
@@ -0,0 +1,112 @@
+import time
+import tkinter as tk
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from text_editor.utils.settings_manager import SettingsManager
+
+
+class AutoSaveScheduler:
+    """
+    Değiştirilmiş sekmeleri `auto_save_interval` saniyede bir, aralığa yayarak kaydeder.
+
+    Her turun başında değiştirilmiş ve dosyası olan editörler sıraya alınır; kayıtlar tek
+    bir Tk geri çağrısında değil, aralığa eşit dağıtılmış ayrı geri çağrılarda yapılır.
+    Her kayıt Tk iş parçacığında sadece içeriğin anlık görüntüsünü alır, yazma
+    SaveService'in iş parçacığında yapılır. Kullanıcı son TYPING_IDLE_MS içinde yazdıysa
+    o editörün kaydı ertelenir (en fazla bir aralık boyunca).
+
+    `auto_save` ve `auto_save_interval` ayarları her turda yeniden okunur.
+    """
+    TYPING_IDLE_MS = 1500
+    MIN_SPACING_MS = 200      # İki kayıt arasındaki en kısa süre
+    DISABLED_POLL_MS = 5000   # Otomatik kayıt kapalıyken ayarın yeniden denetlenme aralığı
+
+    def __init__(self, widget: tk.Misc, get_editors: Callable[[], Dict[str, Any]],
+                 save_editor: Callable[[str, Any], None]):
+        self.widget = widget
+        self.get_editors = get_editors
+        self.save_editor = save_editor
+        # (sekme adı, ilk denemenin zamanı) sırası
+        self._queue: Deque[Tuple[str, float]] = deque()
+        self._cycle_job = None
+        self._save_job = None
+        self._spacing_ms = self.MIN_SPACING_MS
+
+    @staticmethod
+    def interval_ms() -> int:
+        try:
+            seconds = float(SettingsManager.get_instance().get("auto_save_interval", 30))
+        except (TypeError, ValueError):
+            seconds = 30
+        return int(max(seconds, 1) * 1000)
+
+    @staticmethod
+    def enabled() -> bool:
+        return bool(SettingsManager.get_instance().get("auto_save", True))
+
+    def start(self) -> None:
+        self._cycle_job = self.widget.after(self.interval_ms(), self._run_cycle)
+
+    def stop(self) -> None:
+        for job in (self._cycle_job, self._save_job):
+            if job is not None:
+                try:
+                    self.widget.after_cancel(job)
+                except tk.TclError:
+                    pass
+        self._cycle_job = self._save_job = None
+        self._queue.clear()
+
+    def _run_cycle(self) -> None:
+        """Bir tur başlatır: kaydedilecek sekmeleri sıraya alır ve kayıtları aralığa yayar."""
+        self._cycle_job = None
+        if not self.enabled():
+            self._queue.clear()
+            self._cycle_job = self.widget.after(self.DISABLED_POLL_MS, self._run_cycle)
+            return
+        interval = self.interval_ms()
+        now = time.monotonic()
+        queued = {name for name, _ in self._queue}
+        for name, editor in self.get_editors().items():
+            if name not in queued and self._needs_save(editor):
+                self._queue.append((name, now))
+        if self._queue:
+            # Kayıtlar turun ilk yarısına dağıtılır; ertelenenler için ikinci yarı kalır
+            self._spacing_ms = max(self.MIN_SPACING_MS, interval // (2 * len(self._queue)))
+            if self._save_job is None:
+                self._save_job = self.widget.after(self._spacing_ms, self._save_next)
+        self._cycle_job = self.widget.after(interval, self._run_cycle)
+
+    @staticmethod
+    def _needs_save(editor: Any) -> bool:
+        # Akışla yüklenen dosya yükleme bitene kadar kaydedilmez
+        return bool(getattr(editor, "file_path", None) and getattr(editor, "content_modified", False)
+                    and not getattr(editor, "is_loading", False))
+
+    def _save_next(self) -> None:
+        """Sıradaki sekmeyi kaydeder; kullanıcı yazıyorsa sıranın sonuna erteler."""
+        self._save_job = None
+        editors = self.get_editors()
+        for _ in range(len(self._queue)):
+            name, first_try = self._queue.popleft()
+            editor = editors.get(name)
+            if editor is None or not self._needs_save(editor):
+                continue
+            if self._is_typing(editor) and time.monotonic() - first_try < self.interval_ms() / 1000:
+                self._queue.append((name, first_try))  # Kullanıcı yazıyor: sıranın sonuna
+                continue
+            self.save_editor(name, editor)
+            break
+        else:
+            # Kaydedilecek sekme kalmadı ya da hepsinde yazma sürüyor
+            if self._queue:
+                self._save_job = self.widget.after(self.TYPING_IDLE_MS, self._save_next)
+            return
+        if self._queue:
+            self._save_job = self.widget.after(self._spacing_ms, self._save_next)
+
+    def _is_typing(self, editor: Any) -> bool:
+        events = getattr(editor, "events", None)
+        last = getattr(events, "last_keystroke", 0.0)
+        return (time.monotonic() - last) * 1000 < self.TYPING_IDLE_MS
@@ -0,0 +1,175 @@
+import tkinter as tk
+from typing import Any, Callable, List, Optional, Tuple
+
+
+def _parse_index(index: str) -> Tuple[int, int]:
+    line, col = index.split(".")
+    return int(line), int(col)
+
+
+class TextChange:
+    """
+    Metin widget'ında yapılmış tek bir düzenleme.
+
+    Düzenlemeden önceki belgede [start, end) aralığı silinmiş (`deleted`) ve yerine `text`
+    eklenmiştir; saf eklemede start == end, saf silmede text boştur. İndeksler normalize
+    edilmiş 'satır.sütun' dizgileridir. `version`, düzenlemeden sonraki belge sürümüdür.
+    Satır alanları 1'den başlar: eski belgedeki [start_line, old_end_line] satırları yeni
+    belgede [start_line, new_end_line] satırları olmuştur.
+    """
+    __slots__ = ("start", "end", "text", "deleted", "version", "start_line", "start_col",
+                 "old_end_line", "new_end_line")
+
+    def __init__(self, start: str, end: str, text: str, deleted: str, version: int):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.deleted = deleted
+        self.version = version
+        self.start_line, self.start_col = _parse_index(start)
+        self.old_end_line = _parse_index(end)[0]
+        self.new_end_line = self.start_line + text.count("\n")
+
+    def __repr__(self) -> str:
+        return (f"TextChange({self.start!r}, {self.end!r}, text={self.text!r}, "
+                f"deleted={self.deleted!r}, version={self.version})")
+
+
+class ChangeTracker:
+    """
+    Bir Text widget'ının Tcl komutunu vekil (proxy) bir komutla değiştirerek tüm içerik
+    değişikliklerini yakalar.
+
+    Widget'ın komutu `<ad>_orig` olarak yeniden adlandırılır ve yerine bu nesneye yönlendiren
+    bir Python komutu kaydedilir (IDLE'ın WidgetRedirector yöntemi). `insert`, `delete` ve
+    `replace` çağrıları konumları normalize edilerek bir TextChange olarak yayınlanır; diğer
+    tüm alt komutlar doğrudan asıl komuta iletilir. Klavye, yapıştırma, sürükle-bırak ve
+    programatik düzenlemeler aynı yoldan geçer. Geri alma (UndoManager) da düzenlemeleri
+    widget komutuyla uyguladığı için ayrı değişiklikler olarak yayınlanır.
+
+    Dinleyiciler her değişiklikte eşzamanlı çağrılır. Ayrıca aynı olay döngüsündeki
+    değişiklikler için widget'ta tek bir `<<Change>>` sanal olayı üretilir.
+    """
+
+    def __init__(self, text_widget: tk.Text):
+        self.widget = text_widget
+        self.version = 0
+        self._listeners: List[Callable[[TextChange], None]] = []
+        self._event_job: Optional[str] = None
+
+        self._name = str(text_widget)
+        self._orig = f"{self._name}_orig"
+        self._tk = text_widget.tk
+        self._tk.call("rename", self._name, self._orig)
+        self._tk.createcommand(self._name, self._dispatch)
+        text_widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def add_listener(self, callback: Callable[[TextChange], None]) -> None:
+        """Her değişiklikten hemen sonra TextChange ile çağrılacak bir geri çağırma ekler."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[TextChange], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def close(self) -> None:
+        """Vekil komutu kaldırır ve widget'ın asıl komutunu geri yükler."""
+        if self._orig is None:
+            return
+        try:
+            self._tk.deletecommand(self._name)
+            self._tk.call("rename", self._orig, self._name)
+        except tk.TclError:
+            pass
+        self._orig = None
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self.widget:
+            try:
+                self._tk.deletecommand(self._name)
+            except tk.TclError:
+                pass
+            self._orig = None
+
+    def _call(self, *args: Any) -> Any:
+        return self._tk.call(self._orig, *args)
+
+    def _dispatch(self, *args: Any) -> Any:
+        """Widget komutunun yerine çağrılır; içerik değiştiren alt komutları yakalar."""
+        operation = str(args[0]) if args else ""
+        if operation in ("insert", "delete", "replace") and str(self._call("cget", "-state")) == "disabled":
+            return self._call(*args)  # Devre dışı widget düzenlemeleri sessizce yok sayar
+        if operation == "insert" and len(args) >= 3:
+            return self._insert(args)
+        if operation == "delete" and len(args) >= 2:
+            return self._delete(args)
+        if operation == "replace" and len(args) >= 4:
+            return self._replace(args)
+        return self._call(*args)
+
+    def _index(self, index: Any) -> str:
+        """İndeksi 'satır.sütun' biçimine çevirir; son satır sonunu (end) aşmaz."""
+        position = str(self._call("index", index))
+        last = str(self._call("index", "end-1c"))
+        return last if _parse_index(position) > _parse_index(last) else position
+
+    def _insert(self, args: Tuple[Any, ...]) -> Any:
+        # insert index chars ?tagList chars tagList ...?
+        text = "".join(str(chars) for chars in args[2::2])
+        if not text:
+            return self._call(*args)
+        index = self._index(args[1])
+        result = self._call("insert", index, *args[2:])
+        self._publish(index, index, text, "")
+        return result
+
+    def _delete(self, args: Tuple[Any, ...]) -> Any:
+        # delete index1 ?index2 ...?; birden çok aralık sondan başa tek tek silinir
+        if len(args) > 3:
+            ranges = [(self._index(args[i]), self._index(args[i + 1]) if i + 1 < len(args) else None)
+                      for i in range(1, len(args), 2)]
+            for start, end in sorted(ranges, key=lambda r: _parse_index(r[0]), reverse=True):
+                self._delete(("delete", start) if end is None else ("delete", start, end))
+            return ""
+        start = self._index(args[1])
+        end = self._index(args[2] if len(args) == 3 else f"{start}+1c")
+        if _parse_index(start) >= _parse_index(end):
+            return self._call(*args)
+        deleted = str(self._call("get", start, end))
+        result = self._call("delete", start, end)
+        self._publish(start, end, "", deleted)
+        return result
+
+    def _replace(self, args: Tuple[Any, ...]) -> Any:
+        # replace index1 index2 chars ?tagList chars tagList ...?
+        start = self._index(args[1])
+        end = self._index(args[2])
+        if _parse_index(start) > _parse_index(end):
+            return self._call(*args)  # Tk hatasını olduğu gibi iletir
+        text = "".join(str(chars) for chars in args[3::2])
+        deleted = str(self._call("get", start, end))
+        result = self._call("replace", start, end, *args[3:])
+        if text or deleted:
+            self._publish(start, end, text, deleted)
+        return result
+
+    def _publish(self, start: str, end: str, text: str, deleted: str) -> None:
+        self.version += 1
+        change = TextChange(start, end, text, deleted, self.version)
+        for listener in list(self._listeners):
+            try:
+                listener(change)
+            except Exception as e:
+                print(f"ChangeTracker: Dinleyici hatası: {e}")
+        if self._event_job is None:
+            try:
+                self._event_job = self.widget.after_idle(self._generate_event)
+            except tk.TclError:
+                pass
+
+    def _generate_event(self) -> None:
+        self._event_job = None
+        try:
+            self.widget.event_generate("<<Change>>")
+        except tk.TclError:
+            pass
@@ -0,0 +1,134 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain, islice
+from typing import Any, List, Optional, Tuple
+
+
+class DocumentModel:
+    """
+    Bir Text widget'ının içeriğinin Python tarafındaki aynası.
+
+    Belge satır listesi olarak tutulur ve ChangeTracker'dan gelen her TextChange ile sadece
+    etkilenen satırlar değiştirilir; widget'tan içerik kopyalanmaz. Satır ve karakter sayısı
+    O(1), satır/konum çevirileri satır başı dizini üzerinde ikili arama ile O(log n)'dir.
+    Satır başı dizini düzenlemeden sonra sadece değişen satırdan itibaren, ilk sorguda
+    yeniden hesaplanır. Tam metin (`text()`) sürüm başına bir kez birleştirilip saklanır;
+    aynı sürümü okuyan tüm bileşenler aynı dizgiyi paylaşır.
+
+    Satır numaraları Tkinter gibi 1'den, sütunlar ve mutlak konumlar 0'dan başlar.
+    `version`, uygulanan son değişikliğin ChangeTracker sürümüdür.
+    """
+
+    def __init__(self, change_tracker: Any = None, content: str = ""):
+        self.version = 0
+        self._lines: List[str] = [""]
+        self._length = 0
+        self._text: Optional[str] = ""
+        # _starts[i]: (i + 1). satırın ilk karakterinin konumu; ilk _valid kayıt geçerlidir
+        self._starts = array("q", [0])
+        self._valid = 1
+        self.change_tracker = change_tracker
+        if change_tracker is not None:
+            content = change_tracker.widget.get("1.0", "end-1c")
+            self.version = change_tracker.version
+            change_tracker.add_listener(self.apply_change)
+        self.reset(content)
+
+    def reset(self, content: str) -> None:
+        """Modeli verilen içerikle baştan kurar."""
+        self._lines = content.split("\n")
+        self._length = len(content)
+        self._text = content
+        self._starts = array("q", [0])
+        self._valid = 1
+
+    def close(self) -> None:
+        if self.change_tracker is not None:
+            self.change_tracker.remove_listener(self.apply_change)
+            self.change_tracker = None
+
+    def apply_change(self, change: Any) -> None:
+        """Bir TextChange'i uygular: [start, end) aralığı `change.text` ile değiştirilir."""
+        first = change.start_line - 1
+        last = change.old_end_line - 1
+        end_col = int(change.end.split(".")[1])
+        lines = self._lines
+        head = lines[first][:change.start_col]
+        tail = lines[last][end_col:]
+        lines[first:last + 1] = (head + change.text + tail).split("\n")
+
+        self._length += len(change.text) - len(change.deleted)
+        self._text = None
+        # Değişen satırın başı ve öncesi değişmez; sonrası bir sonraki sorguda yeniden hesaplanır
+        self._valid = min(self._valid, first + 1)
+        self.version = change.version
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    @property
+    def char_count(self) -> int:
+        return self._length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def text(self) -> str:
+        """Belgenin tamamı (Text.get('1.0', 'end-1c') karşılığı)."""
+        if self._text is None:
+            self._text = "\n".join(self._lines)
+        return self._text
+
+    def is_text(self, content: Optional[str]) -> bool:
+        """`content`, bu sürümün `text()` dizgisinin kendisi mi? (O(1) kimlik karşılaştırması)"""
+        return content is not None and content is self._text
+
+    def line(self, line: int) -> str:
+        """Verilen satırın içeriği (satır sonu karakteri olmadan)."""
+        return self._lines[line - 1]
+
+    def get_lines(self, first: int, last: int) -> str:
+        """[first, last] satırlarını (dahil) tek dizgi olarak döndürür."""
+        return "\n".join(self._lines[first - 1:last])
+
+    def slice(self, start: int, end: int) -> str:
+        """[start, end) mutlak konum aralığındaki metni döndürür."""
+        if self._text is not None:
+            return self._text[start:end]
+        if end <= start:
+            return ""
+        first, start_col = self.line_col(start)
+        last, end_col = self.line_col(end)
+        if first == last:
+            return self._lines[first - 1][start_col:end_col]
+        return "\n".join(chain((self._lines[first - 1][start_col:],),
+                               islice(self._lines, first, last - 1),
+                               (self._lines[last - 1][:end_col],)))
+
+    def _ensure_starts(self) -> array:
+        """Satır başı dizininin geçersiz kısmını yeniden hesaplar."""
+        valid = self._valid
+        count = len(self._lines)
+        if valid < count or len(self._starts) != count:
+            starts = self._starts
+            del starts[valid:]
+            lengths = (len(line) + 1 for line in islice(self._lines, valid - 1, count - 1))
+            starts.extend(islice(accumulate(lengths, initial=starts[valid - 1]), 1, None))
+            self._valid = count
+        return self._starts
+
+    def offset(self, line: int, col: int = 0) -> int:
+        """'satır.sütun' konumunu mutlak karakter konumuna çevirir."""
+        return self._ensure_starts()[line - 1] + col
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """Mutlak konumu (satır, sütun) ikilisine çevirir."""
+        starts = self._ensure_starts()
+        line = bisect_right(starts, offset) - 1
+        return line + 1, offset - starts[line]
+
+    def index(self, offset: int) -> str:
+        """Mutlak konumu Tkinter 'satır.sütun' indeksine çevirir."""
+        line, col = self.line_col(offset)
+        return f"{line}.{col}"
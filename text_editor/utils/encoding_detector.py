@@ -0,0 +1,100 @@
+import codecs
+from typing import List, NamedTuple, Optional, Sequence
+
+SAMPLE_SIZE = 256 * 1024  # Kodlama tespiti için okunan en fazla bayt
+DEFAULT_FALLBACKS = ("cp1254", "cp1252", "latin-1")
+
+# (BOM baytları, codec); UTF-32 LE BOM'u UTF-16 LE BOM'uyla başladığı için önce denenir
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+_LABELS = {
+    "utf-8": "UTF-8",
+    "utf-16-le": "UTF-16 LE",
+    "utf-16-be": "UTF-16 BE",
+    "utf-32-le": "UTF-32 LE",
+    "utf-32-be": "UTF-32 BE",
+    "cp1254": "Windows-1254",
+    "cp1252": "Windows-1252",
+    "latin-1": "ISO-8859-1",
+}
+
+
+class DetectedEncoding(NamedTuple):
+    """Tespit edilen codec ve dosyanın başındaki BOM uzunluğu (BOM yoksa 0)."""
+    encoding: str
+    bom_length: int = 0
+
+    @property
+    def label(self) -> str:
+        return encoding_label(self.encoding, self.bom_length > 0)
+
+
+def encoding_label(encoding: str, bom: bool = False) -> str:
+    """Durum çubuğunda gösterilecek kodlama adı (ör. 'UTF-8 BOM', 'Windows-1254')."""
+    label = _LABELS.get(encoding, encoding.upper())
+    return f"{label} BOM" if bom and encoding == "utf-8" else label
+
+
+def detect_encoding(sample: bytes, fallbacks: Sequence[str] = DEFAULT_FALLBACKS,
+                    complete: bool = True) -> DetectedEncoding:
+    """
+    Bir bayt örneğinin kodlamasını tespit eder.
+
+    Önce BOM aranır. BOM yoksa örnek artımlı UTF-8 çözücüden geçirilir; `complete` False ise
+    (örnek dosyanın sadece başıysa) sonda yarım kalan çok baytlı karakter hata sayılmaz.
+    UTF-8 geçersizse aynı örnek üzerinde `fallbacks` kod sayfaları sırayla denenir.
+    Hiçbiri uymazsa latin-1 (her baytı çözer) döner.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return DetectedEncoding(encoding, len(bom))
+    for encoding in ("utf-8", *fallbacks):
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=complete)
+        except (UnicodeDecodeError, LookupError):
+            continue
+        return DetectedEncoding(encoding)
+    return DetectedEncoding("latin-1")
+
+
+def detect_file_encoding(path: str, fallbacks: Sequence[str] = DEFAULT_FALLBACKS,
+                         sample_size: int = SAMPLE_SIZE) -> DetectedEncoding:
+    """Dosyanın ilk `sample_size` baytını okuyarak kodlamasını tespit eder."""
+    with open(path, "rb") as f:
+        sample = f.read(sample_size + 1)
+    complete = len(sample) <= sample_size
+    return detect_encoding(sample[:sample_size], fallbacks, complete)
+
+
+def candidate_encodings(detected: DetectedEncoding,
+                        fallbacks: Sequence[str] = DEFAULT_FALLBACKS) -> List[str]:
+    """
+    Tam çözme için denenecek kodlamalar: tespit edilen kodlama ve (BOM yoksa) listede ondan
+    sonra gelen kod sayfaları. Örnekten sonra geçersiz bir bayt çıkarsa bir sonrakine geçilir.
+    """
+    if detected.bom_length:
+        return [detected.encoding]
+    order = ["utf-8", *fallbacks]
+    if detected.encoding not in order:
+        return [detected.encoding, *order]
+    tail = order[order.index(detected.encoding):]
+    return tail if "latin-1" in tail else [*tail, "latin-1"]
+
+
+def normalize_fallbacks(value: Optional[Sequence[str]]) -> List[str]:
+    """Ayarlardaki kod sayfası listesini doğrular; bilinmeyen codec'ler atlanır."""
+    result = []
+    for name in value or DEFAULT_FALLBACKS:
+        try:
+            codecs.lookup(name)
+        except (LookupError, TypeError):
+            continue
+        if name not in result and name != "utf-8":
+            result.append(name)
+    return result
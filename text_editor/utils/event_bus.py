@@ -0,0 +1,117 @@
+import time
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional
+
+
+TIER_IMMEDIATE = 0    # İmleç, durum çubuğu: olay döngüsü boşaldığında
+TIER_FRAME = 16       # Satır numaraları (gutter): kare başına en fazla bir kez
+TIER_HIGHLIGHT = 150  # Vurgulama, sekme başlığı: yazma duraksayınca
+TIER_PREVIEW = 300    # Markdown önizlemesi gibi pahalı yenilemeler
+
+# Bu süreye kadar olan katmanlar sabit aralıkla (kısma), daha uzunları son değişiklikten
+# itibaren (geciktirme) tetiklenir; kısma sürekli yazarken de düzenli güncelleme sağlar.
+FRAME_MS = TIER_FRAME
+
+
+class EditorEventBus:
+    """
+    Editör başına birleştirilmiş (coalesced) değişiklik bildirim yolu.
+
+    Her içerik değişikliği `publish` ile bildirilir; aboneler bir gecikme katmanına kaydolur
+    ve bir değişiklik patlamasından sonra katman başına tek bir çağrı alır. Çağrıya son
+    bildirimden bu yana birikmiş değişikliklerin listesi geçirilir. Katmanlar bağımsızdır:
+    hızlı katmanların tetiklenmesi yavaş katmanların zamanlayıcısını etkilemez.
+
+    Sayaçlar her tuş vuruşunun kaç geri çağırma ürettiğini gösterir (`get_stats`).
+    """
+
+    def __init__(self, widget: tk.Misc):
+        self.widget = widget
+        self._subscribers: Dict[int, List[Callable[[List[Any]], None]]] = {}
+        self._pending: Dict[int, List[Any]] = {}
+        self._jobs: Dict[int, Optional[str]] = {}
+
+        # Sayaçlar
+        self.keystrokes = 0
+        self.last_keystroke = 0.0  # Son tuş vuruşunun time.monotonic() zamanı
+        self.changes = 0
+        self.dispatches: Dict[int, int] = {}
+        self.callbacks = 0
+
+    def subscribe(self, callback: Callable[[List[Any]], None], tier: int = TIER_IMMEDIATE) -> None:
+        """`tier` ms gecikme katmanına bir abone ekler."""
+        self._subscribers.setdefault(tier, []).append(callback)
+        self._pending.setdefault(tier, [])
+        self._jobs.setdefault(tier, None)
+        self.dispatches.setdefault(tier, 0)
+
+    def unsubscribe(self, callback: Callable[[List[Any]], None]) -> None:
+        for callbacks in self._subscribers.values():
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish(self, change: Any = None) -> None:
+        """Bir değişikliği bildirir; abonesi olan her katman için bildirim planlanır."""
+        self.changes += 1
+        for tier, callbacks in self._subscribers.items():
+            if not callbacks:
+                continue
+            self._pending[tier].append(change)
+            job = self._jobs[tier]
+            if job is not None:
+                if tier <= FRAME_MS:
+                    continue  # Kısma: planlanmış bildirim bu değişikliği de kapsar
+                self.widget.after_cancel(job)
+            try:
+                if tier == TIER_IMMEDIATE:
+                    self._jobs[tier] = self.widget.after_idle(self._dispatch, tier)
+                else:
+                    self._jobs[tier] = self.widget.after(tier, self._dispatch, tier)
+            except tk.TclError:
+                self._jobs[tier] = None
+
+    def flush(self, tier: Optional[int] = None) -> None:
+        """Bekleyen bildirimleri (veya sadece bir katmanınkileri) hemen gönderir."""
+        for pending_tier in list(self._jobs):
+            if tier is not None and pending_tier != tier:
+                continue
+            job = self._jobs[pending_tier]
+            if job is not None:
+                self.widget.after_cancel(job)
+                self._dispatch(pending_tier)
+
+    def close(self) -> None:
+        """Planlanmış tüm bildirimleri iptal eder."""
+        for tier, job in self._jobs.items():
+            if job is not None:
+                try:
+                    self.widget.after_cancel(job)
+                except tk.TclError:
+                    pass
+                self._jobs[tier] = None
+
+    def record_keystroke(self) -> None:
+        """Bir tuş vuruşunu sayar (geri çağırma/tuş vuruşu oranı ve yazma algılama için)."""
+        self.keystrokes += 1
+        self.last_keystroke = time.monotonic()
+
+    def _dispatch(self, tier: int) -> None:
+        self._jobs[tier] = None
+        changes, self._pending[tier] = self._pending[tier], []
+        self.dispatches[tier] += 1
+        for callback in list(self._subscribers.get(tier, ())):
+            self.callbacks += 1
+            try:
+                callback(changes)
+            except Exception as e:
+                print(f"EditorEventBus: Abone hatası: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Sayaçları döndürür: tuş vuruşu, değişiklik, katman başına bildirim ve geri çağırma sayıları."""
+        return {
+            "keystrokes": self.keystrokes,
+            "changes": self.changes,
+            "dispatches": dict(self.dispatches),
+            "callbacks": self.callbacks,
+            "callbacks_per_keystroke": self.callbacks / self.keystrokes if self.keystrokes else 0.0,
+        }
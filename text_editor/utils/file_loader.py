@@ -0,0 +1,111 @@
+import codecs
+import io
+import os
+import queue
+import threading
+from typing import Any, List, Sequence, Tuple
+
+
+class StreamingFileLoader:
+    """
+    Bir dosyayı arka plan iş parçacığında sabit boyutlu parçalar halinde okuyup çözer.
+
+    Her parça artımlı bir çözücüden (codecs incremental decoder) ve satır sonlarını '\\n'e
+    çeviren `io.IncrementalNewlineDecoder`'dan geçirilir; böylece parça sınırına düşen çok
+    baytlı karakterler ve '\\r\\n' çiftleri bölünmez. Çözülen metin sınırlı bir kuyruğa
+    yazılır ve UI iş parçacığı `poll` ile mesajları alır:
+
+        ("reset", kodlama)      Önceki kodlama başarısız oldu; o ana kadar eklenen metin atılmalı
+        ("data", metin)         Eklenecek metin parçası
+        ("progress", okunan, toplam)
+        ("done", kodlama)       Dosya tamamen okundu
+        ("error", istisna)
+
+    Kodlamalar sırayla denenir; dosya sadece bir kodlama başarısız olursa baştan okunur.
+    `offset` baytı (ör. BOM) atlanarak okunur. `cancel` okumayı bir sonraki parçada durdurur.
+    """
+    CHUNK_SIZE = 64 * 1024
+    QUEUE_SIZE = 32  # Bellekte bekleyebilecek en fazla parça sayısı
+
+    def __init__(self, path: str, encodings: Sequence[str], limit: int = -1, offset: int = 0):
+        self.path = path
+        self.encodings = list(encodings)
+        self.limit = limit
+        self.offset = offset
+        self._queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue(self.QUEUE_SIZE)
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="file-loader", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def poll(self, max_messages: int = 1) -> List[Tuple[Any, ...]]:
+        """Kuyruktaki en fazla `max_messages` mesajı beklemeden döndürür."""
+        messages = []
+        for _ in range(max_messages):
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def _put(self, message: Tuple[Any, ...]) -> bool:
+        """Mesajı kuyruğa yazar; kuyruk doluysa iptal edilene kadar bekler."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        try:
+            total = max(os.path.getsize(self.path) - self.offset, 0)
+            if self.limit >= 0:
+                total = min(total, self.limit)
+            for attempt, encoding in enumerate(self.encodings):
+                if attempt and not self._put(("reset", encoding)):
+                    return
+                if self._decode(encoding, total):
+                    self._put(("done", encoding))
+                    return
+                if self._cancelled.is_set():
+                    return
+            self._put(("error", UnicodeError("Desteklenmeyen dosya formatı veya kodlaması.")))
+        except Exception as e:
+            self._put(("error", e))
+
+    def _decode(self, encoding: str, total: int) -> bool:
+        """Dosyayı verilen kodlamayla baştan okur; çözme hatasında False döner."""
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+        read = 0
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while not self._cancelled.is_set():
+                size = min(self.CHUNK_SIZE, total - read)
+                chunk = f.read(size) if size > 0 else b""
+                read += len(chunk)
+                final = not chunk
+                try:
+                    text = decoder.decode(chunk, final=final)
+                except UnicodeDecodeError:
+                    # Sınıra denk gelen yarım karakter, dosya sınırla kesildiyse hata sayılmaz
+                    if final and 0 <= self.limit < os.path.getsize(self.path) - self.offset:
+                        text = ""
+                    else:
+                        return False
+                if text and not self._put(("data", text)):
+                    return False
+                if final:
+                    return True
+                if not self._put(("progress", read, total)):
+                    return False
+        return False
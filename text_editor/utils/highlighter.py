@@ -1,12 +1,200 @@
+import fnmatch
+import importlib
+import json
+import os
 import pygments
+import queue
 import re
-from pygments import lex
-from pygments.lexers import get_lexer_for_filename, get_lexer_by_name, PythonLexer, MarkdownLexer
+import time
+from collections import OrderedDict
+from pygments.lexers import (
+    LEXERS, find_lexer_class_by_name, find_lexer_class_for_filename, PythonLexer, MarkdownLexer,
+)
 from pygments.styles import get_style_by_name
 from pygments.token import Token
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, List, Dict, Pattern, Tuple
 import tkinter as tk
 
+from text_editor.utils.document_model import DocumentModel
+from text_editor.utils.line_index import LineIndex
+from text_editor.utils.tokenizer import (
+    NO_EDIT, BackgroundTokenizer, EditHint, LexState, TokenCache, TokenizeResult, lex_document,
+    merge_edits, relex_document, offset_to_index,
+)
+
+
+def build_tag_ranges(tokens: Any, line: int, col: int,
+                     prefix: str = "syntax_") -> Tuple[Dict[str, List[str]], int, int]:
+    """
+    Token dizisini etiket başına 'satır.sütun' aralık listelerine çevirir.
+
+    İndeksler Tkinter'a sorulmadan, token metinlerindeki satır sonları sayılarak Python'da
+    hesaplanır. Bitişik aynı tipteki token'lar tek aralıkta birleştirilir. Etiket -> [başlangıç,
+    bitiş, başlangıç, bitiş, ...] sözlüğü ve son (satır, sütun) konumu döndürülür.
+    """
+    ranges: Dict[str, List[str]] = {}
+    current_tag = None
+    run_start = ""
+    for token, text in tokens:
+        if not text:
+            continue
+        tag = f"{prefix}{token}"
+        if tag != current_tag:
+            if current_tag is not None:
+                ranges.setdefault(current_tag, []).extend((run_start, f"{line}.{col}"))
+            current_tag = tag
+            run_start = f"{line}.{col}"
+        newlines = text.count("\n")
+        if newlines:
+            line += newlines
+            col = len(text) - text.rfind("\n") - 1
+        else:
+            col += len(text)
+    if current_tag is not None:
+        ranges.setdefault(current_tag, []).extend((run_start, f"{line}.{col}"))
+    return ranges, line, col
+
+
+class LexerRegistry:
+    """
+    Dosya adı / dil adı -> lexer sınıfı çözümlemelerini önbelleğe alan kayıt.
+
+    pygments'ın get_lexer_for_filename çağrısı her seferinde tüm lexer eşlemesini ve eklenti
+    giriş noktalarını tarar. Kayıt, çözümlenen sınıfı (modül, sınıf adı) olarak uzantı veya
+    dosya adı anahtarıyla saklar, sınıfı sadece gerektiğinde içe aktarır ve eşlemeyi
+    ~/.memati_editor/lexer_cache.json dosyasında oturumlar arası korur.
+    Singleton tasarım desenini kullanır.
+    """
+    _instance: Optional['LexerRegistry'] = None
+
+    def __init__(self):
+        if LexerRegistry._instance is not None:
+            raise Exception("LexerRegistry is a singleton class!")
+
+        self.config_dir = os.path.join(os.path.expanduser("~"), ".memati_editor")
+        self.cache_file = os.path.join(self.config_dir, "lexer_cache.json")
+        # Anahtar -> [modül, sınıf adı]; None bu anahtar için lexer bulunmadığını belirtir
+        self._filenames: Dict[str, Optional[List[str]]] = {}
+        self._names: Dict[str, Optional[List[str]]] = {}
+        self._classes: Dict[Tuple[str, str], type] = {}
+        self._special_filenames: Optional[Pattern[str]] = None
+        self.load_cache()
+
+    @classmethod
+    def get_instance(cls) -> 'LexerRegistry':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def load_cache(self) -> None:
+        """Kayıtlı eşlemeyi dosyadan yükler; farklı bir pygments sürümüne aitse yok sayar."""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("pygments") == pygments.__version__:
+                self._filenames = data.get("filenames", {})
+                self._names = data.get("names", {})
+        except Exception as e:
+            print(f"LexerRegistry: Lexer önbelleği yüklenemedi: {e}")
+
+    def save_cache(self) -> bool:
+        """Eşlemeyi dosyaya kaydeder."""
+        try:
+            os.makedirs(self.config_dir, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({"pygments": pygments.__version__, "filenames": self._filenames,
+                           "names": self._names}, f, indent=4, ensure_ascii=False)
+            return True
+        except Exception as e:
+            print(f"LexerRegistry: Lexer önbelleği kaydedilemedi: {e}")
+            return False
+
+    def get_lexer_for_filename(self, filename: str) -> Optional[Any]:
+        """Dosya adına uygun yeni bir lexer örneği döndürür; bulunamazsa None."""
+        lexer_class = self.get_class_for_filename(filename)
+        return lexer_class() if lexer_class is not None else None
+
+    def get_lexer_by_name(self, name: str) -> Optional[Any]:
+        """Dil adına (alias) uygun yeni bir lexer örneği döndürür; bulunamazsa None."""
+        lexer_class = self.get_class_by_name(name)
+        return lexer_class() if lexer_class is not None else None
+
+    def get_class_for_filename(self, filename: str) -> Optional[type]:
+        """
+        Dosya adına uygun lexer sınıfını döndürür.
+
+        Sınıf '*.py' gibi düz bir uzantı deseni bildiriyorsa sonuç uzantı anahtarıyla,
+        aksi halde (ör. 'Makefile', 'CMakeLists.txt') tam dosya adıyla saklanır. Özel bir
+        dosya adı desenine uyan adlar uzantı anahtarını kullanmaz.
+        """
+        basename = os.path.basename(filename)
+        ext = os.path.splitext(basename)[1]
+        ext_key = f"*{ext}" if ext and not self._is_special_filename(basename) else None
+
+        for key in (basename, ext_key):
+            if key is not None and key in self._filenames:
+                lexer_class = self._load_class(self._filenames[key])
+                if lexer_class is not None or self._filenames[key] is None:
+                    return lexer_class
+
+        lexer_class = find_lexer_class_for_filename(basename)
+        if lexer_class is not None and ext_key in getattr(lexer_class, "filenames", ()):
+            key = ext_key
+        else:
+            key = basename
+        self._filenames[key] = self._spec(lexer_class)
+        self.save_cache()
+        return lexer_class
+
+    def get_class_by_name(self, name: str) -> Optional[type]:
+        """Dil adına (alias) uygun lexer sınıfını döndürür."""
+        key = name.lower()
+        if key in self._names:
+            lexer_class = self._load_class(self._names[key])
+            if lexer_class is not None or self._names[key] is None:
+                return lexer_class
+
+        try:
+            lexer_class = find_lexer_class_by_name(key)
+        except pygments.util.ClassNotFound:
+            lexer_class = None
+        self._names[key] = self._spec(lexer_class)
+        self.save_cache()
+        return lexer_class
+
+    @staticmethod
+    def _spec(lexer_class: Optional[type]) -> Optional[List[str]]:
+        if lexer_class is None:
+            return None
+        return [lexer_class.__module__, lexer_class.__name__]
+
+    def _load_class(self, spec: Optional[List[str]]) -> Optional[type]:
+        """[modül, sınıf adı] kaydındaki sınıfı içe aktarır (ilk kullanımda)."""
+        if spec is None:
+            return None
+        key = (spec[0], spec[1])
+        lexer_class = self._classes.get(key)
+        if lexer_class is None:
+            try:
+                lexer_class = getattr(importlib.import_module(spec[0]), spec[1])
+            except (ImportError, AttributeError):
+                return None
+            self._classes[key] = lexer_class
+        return lexer_class
+
+    def _is_special_filename(self, basename: str) -> bool:
+        """Dosya adı, pygments'taki '*.uzantı' dışındaki bir desene (ör. 'Makefile.*') uyuyor mu?"""
+        if self._special_filenames is None:
+            simple = re.compile(r"\*\.[^*?\[\]]+")
+            patterns = {pattern for info in LEXERS.values() for pattern in info[3]
+                        if not simple.fullmatch(pattern)}
+            self._special_filenames = re.compile(
+                "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in sorted(patterns)))
+        return self._special_filenames.match(basename) is not None
+
+
 class SyntaxHighlighter:
     """
     Sözdizimi vurgulama işlemlerini yöneten sınıf.
@@ -26,11 +214,66 @@ class SyntaxHighlighter:
         "list": r'^\s*[\*\-\+]\s.*$|^\s*\d+\.\s.*$',
         "blockquote": r'^\s*>.*$'
     }
+    _MARKDOWN_REGEXES = {tag: re.compile(pattern, re.MULTILINE) for tag, pattern in MARKDOWN_PATTERNS.items()}
 
-    def __init__(self, text_widget: tk.Text, style_name: str = "monokai"):
+    # Artımlı vurgulamada kaç satırda bir lexer durumunun saklanacağı
+    CHECKPOINT_INTERVAL = 50
+    # Görünüm alanı modunda görünür satırların üstüne/altına eklenen satır sayısı
+    VIEWPORT_MARGIN = 100
+    # Arka plan sonuçlarının kontrol aralığı ve her boşta (idle) diliminde harcanacak süre
+    POLL_INTERVAL_MS = 15
+    APPLY_SLICE_MS = 8
+    # Arka plana gönderilip henüz uygulanmamış sürümler için saklanan en fazla düzenleme ipucu
+    MAX_SUBMITTED_EDITS = 256
+
+    def __init__(self, text_widget: tk.Text, style_name: str = "monokai",
+                 checkpoint_interval: int = CHECKPOINT_INTERVAL,
+                 viewport_margin: int = VIEWPORT_MARGIN, background: bool = False,
+                 token_cache: Optional[TokenCache] = None, document: Optional[DocumentModel] = None):
         self.text_widget = text_widget
+        # Verilirse belge içeriği ve satır sayısı widget yerine bu modelden okunur
+        self.document = document
         self.style_name = style_name
         self.current_lexer = PythonLexer()
+        self.checkpoint_interval = max(1, checkpoint_interval)
+
+        # Görünüm alanı (viewport) modu: büyük dosyalarda sadece görünen satırlar vurgulanır
+        self.viewport_mode = False
+        self.viewport_margin = max(0, viewport_margin)
+        self._viewport_range: Optional[Tuple[int, int]] = None
+
+        # Artımlı vurgulama durumu (son vurgulanan içerik, lexer ve kontrol noktaları)
+        self._lex_state: Optional[LexState] = None
+
+        # Tüm belge token'larının yayınlandığı paylaşılan önbellek (ör. Minimap tarafından okunur)
+        self.token_cache = token_cache
+
+        # Son içerik sürümünün satır başı dizini (konum -> 'satır.sütun' çevirileri için)
+        self._line_index: Optional[LineIndex] = None
+
+        # Arka plan lexing: belge sürümü, etiketleri widget'ta tam uygulanmış sürüm ve uygulama kuyruğu
+        self.background = background
+        self._tokenizer: Optional[BackgroundTokenizer] = (
+            BackgroundTokenizer(self.checkpoint_interval) if background else None)
+        self._version = 0
+        self._applied_version: Optional[int] = None
+        self._awaiting_result = False
+        self._poll_job: Optional[str] = None
+        self._apply_job: Optional[str] = None
+        self._apply_result: Optional[TokenizeResult] = None
+        self._apply_pos = 0
+        self._apply_line = 1
+        self._apply_col = 0
+
+        # ChangeTracker değişikliklerinden hesaplanan düzenleme ipuçları (değişmeyen önek/sonek):
+        # son lexing'den beri biriken düzenleme ve arka plana gönderilen her sürümün kendinden
+        # önceki sürüme göre düzenlemesi. Böylece düzenlenen aralık metinler karşılaştırılmadan bulunur.
+        self._pending_edit: Optional[EditHint] = None
+        self._submitted_edits: "OrderedDict[int, EditHint]" = OrderedDict()
+        self._tracks_edits = document is not None and document.change_tracker is not None
+        if self._tracks_edits:
+            document.change_tracker.add_listener(self._on_change)
+
         self.setup_tags()
 
     def setup_tags(self) -> None:
@@ -111,8 +354,18 @@ class SyntaxHighlighter:
         """
         Metni analiz eder ve ilgili etiketleri uygulayarak renklendirir.
         """
+        self._pending_edit = None
+        # Görünüm alanı modunda tüm belge yerine sadece görünen bölge vurgulanır
+        if self.viewport_mode and content is None:
+            self._clear_tags()
+            self._viewport_range = None
+            if self.token_cache is not None:
+                self.token_cache.invalidate()
+            self.highlight_visible()
+            return
+
         if content is None:
-            content = self.text_widget.get("1.0", "end-1c")
+            content = self._get_content()
         
         if lexer is None:
             lexer = self.current_lexer
@@ -126,21 +379,385 @@ class SyntaxHighlighter:
             # Pygments ile detaylı vurgulama devam etsin mi? 
             # Evet, çünkü kod blokları vb. Pygments ile daha iyi olur.
 
-        self.text_widget.mark_set("range_start", "1.0")
-        for token, text in lex(content, lexer):
-            tag_name = f"{self.TAG_PREFIX}{str(token)}"
-            self.text_widget.mark_set("range_end", f"range_start + {len(text)}c")
-            self.text_widget.tag_add(tag_name, "range_start", "range_end")
-            self.text_widget.mark_set("range_start", "range_end")
-
-    def _highlight_markdown(self, content: str) -> None:
-        """Markdown için regex tabanlı hızlı vurgulama yapar."""
-        for tag, pattern in self.MARKDOWN_PATTERNS.items():
-            tag_name = f"md_{tag}"
-            for match in re.finditer(pattern, content, re.MULTILINE):
-                start = f"1.0 + {match.start()}c"
-                end = f"1.0 + {match.end()}c"
-                self.text_widget.tag_add(tag_name, start, end)
+        # Lexer destekliyorsa durum kaydedilir; sonraki düzenlemeler artımlı vurgulanabilsin
+        self._lex_state, tokens = lex_document(content, lexer, self.checkpoint_interval)
+        self._apply_tokens("1.0", tokens)
+        # Widget artık arka plan işçisinin bilmediği bir duruma sahip
+        self._applied_version = None
+        if self.token_cache is not None:
+            self.token_cache.publish(content, lexer, tokens)
+
+    def highlight_tokens(self, content: str, tokens: Any, lexer: Any = None,
+                         start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        Önceden üretilmiş token'ları (ör. TokenCache'ten) lexlemeden uygular.
+        `stop` verilmezse `tokens` tüm belgenin token'larıdır ve eski etiketler tüm metinden
+        kaldırılır; verilirse `tokens` [start, stop) aralığını kapsar ve sadece o aralık
+        yeniden etiketlenir. Aralıklar tek bir Tcl betiğiyle eklenir.
+        """
+        if lexer is None:
+            lexer = self.current_lexer
+        if stop is not None:
+            line, col = offset_to_index(content, start).split(".")
+            ranges, _, _ = build_tag_ranges(tokens, int(line), int(col), self.TAG_PREFIX)
+            self._replace_tag_ranges(f"{line}.{col}", offset_to_index(content, stop), ranges)
+            if isinstance(lexer, MarkdownLexer):
+                self._highlight_markdown_lines(content, start, stop)
+            return
+        for tag in self.MARKDOWN_PATTERNS:
+            self.text_widget.tag_remove(f"md_{tag}", "1.0", "end")
+        if isinstance(lexer, MarkdownLexer):
+            self._highlight_markdown(content)
+        ranges, _, _ = build_tag_ranges(tokens, 1, 0, self.TAG_PREFIX)
+        self._replace_tag_ranges("1.0", "end", ranges)
+
+    def refresh(self) -> None:
+        """Belgeyi geçerli moda uygun yöntemle (görünüm alanı, arka plan veya senkron) yeniden vurgular."""
+        if self.background and not self.viewport_mode:
+            self.highlight_async(full=True)
+        else:
+            self.highlight()
+
+    def highlight_incremental(self) -> None:
+        """
+        Sadece değişen bölgeyi yeniden vurgular.
+
+        Lexing ilk kirli satırdan önceki kontrol noktasından başlar ve token akışı eski
+        çalıştırmayla tekrar örtüştüğünde durur (bkz. relex_document). Etiketler sadece bu
+        aralıkta değiştirilir; maliyet dosya boyutuna değil düzenlemenin boyutuna bağlıdır.
+        Durum yoksa veya lexer desteklemiyorsa tam vurgulama yapılır. Arka plan modunda iş
+        işçi iş parçacığına devredilir.
+        """
+        if self.viewport_mode:
+            self.highlight_visible(force=True)
+            return
+
+        if self.background:
+            self.highlight_async()
+            return
+
+        state = self._lex_state
+        if state is None or state.lexer is not self.current_lexer:
+            self.highlight()
+            return
+
+        content = self._get_content()
+        # Durum sadece bu (Tk) iş parçacığında kullanılır; token dizisi yerinde güncellenir
+        update = relex_document(state, content, self.checkpoint_interval, self._take_edit(), in_place=True)
+        if update is None:
+            return
+        self._lex_state, start, stop, tokens = update
+        self._retag_range(content, start, stop, tokens)
+        if self.token_cache is not None:
+            self.token_cache.publish(content, state.lexer, self._lex_state.tokens, (start, stop))
+
+    def highlight_async(self, full: bool = False) -> None:
+        """
+        Belgenin anlık görüntüsünü arka plan işçisine gönderir; tuş vuruşu lexer'ı beklemez.
+
+        Sonuçlar POLL_INTERVAL_MS aralıkla kontrol edilir ve APPLY_SLICE_MS'lik after_idle
+        dilimleri halinde uygulanır. Eski sürümlere ait sonuçlar atılır. `full` True ise
+        işçinin sakladığı durum kullanılmadan tüm belge yeniden lexlenir.
+        """
+        if self._tokenizer is None:
+            self.highlight()
+            return
+        content = self._get_content()
+        self._version += 1
+        edit = self._take_edit()
+        if full:
+            self._submitted_edits.clear()
+            base_version = None
+        else:
+            base_version = self._applied_version
+            if edit is not None:
+                self._submitted_edits[self._version] = edit
+                while len(self._submitted_edits) > self.MAX_SUBMITTED_EDITS:
+                    self._submitted_edits.popitem(last=False)
+            edit = self._edit_since(base_version)
+        self._tokenizer.submit(self._version, content, self.current_lexer, base_version, edit)
+        self._awaiting_result = True
+        if self._poll_job is None:
+            self._poll_job = self.text_widget.after(self.POLL_INTERVAL_MS, self._poll_results)
+
+    def _poll_results(self) -> None:
+        """Arka plan sonuç kuyruğunu boşaltır; sadece güncel sürümün sonucunu uygular."""
+        self._poll_job = None
+        latest: Optional[TokenizeResult] = None
+        while True:
+            try:
+                result = self._tokenizer.results.get_nowait()
+            except queue.Empty:
+                break
+            if result.version == self._version:
+                latest = result
+
+        if latest is not None:
+            self._awaiting_result = False
+            if latest.full or latest.base_version == self._applied_version:
+                self._begin_apply(latest)
+            else:
+                # Sonucun dayandığı sürüm widget'ta tam uygulanmamış; tam lexing iste
+                self.highlight_async(full=True)
+                return
+
+        if self._awaiting_result:
+            self._poll_job = self.text_widget.after(self.POLL_INTERVAL_MS, self._poll_results)
+
+    def _begin_apply(self, result: TokenizeResult) -> None:
+        """Bir sonucu zaman dilimli uygulamaya başlar."""
+        if self._apply_job is not None:
+            self.text_widget.after_cancel(self._apply_job)
+            self._apply_job = None
+        # Uygulama bitene kadar widget hiçbir sürümle tam örtüşmüyor
+        self._applied_version = None
+        self._apply_result = result
+        self._apply_pos = 0
+        line, col = offset_to_index(result.content, result.start).split(".")
+        self._apply_line, self._apply_col = int(line), int(col)
+        self._apply_step()
+
+    def _apply_step(self) -> None:
+        """Bir zaman dilimi boyunca token uygular, kalanı bir sonraki boşta (idle) anına bırakır."""
+        self._apply_job = None
+        result = self._apply_result
+        if result is None:
+            return
+        if result.version != self._version:
+            # Belge bu arada değişti; eski sonucu bırak
+            self._apply_result = None
+            return
+
+        tokens = result.tokens
+        deadline = time.perf_counter() + self.APPLY_SLICE_MS / 1000.0
+        while self._apply_pos < len(tokens):
+            batch = tokens[self._apply_pos:self._apply_pos + 2048]
+            self._apply_pos += len(batch)
+            batch_start = f"{self._apply_line}.{self._apply_col}"
+            ranges, self._apply_line, self._apply_col = build_tag_ranges(
+                batch, self._apply_line, self._apply_col, self.TAG_PREFIX)
+            self._replace_tag_ranges(batch_start, f"{self._apply_line}.{self._apply_col}", ranges)
+            if time.perf_counter() >= deadline:
+                break
+
+        if self._apply_pos < len(tokens):
+            self._apply_job = self.text_widget.after_idle(self._apply_step)
+            return
+
+        # Son dilim: tam sonuçta kalan eski etiketleri temizle, Markdown desenlerini uygula
+        if result.full:
+            self._remove_syntax_tags(f"{self._apply_line}.{self._apply_col}", "end")
+        if isinstance(self.current_lexer, MarkdownLexer):
+            if result.full:
+                self._highlight_markdown(result.content)
+            elif result.stop > result.start:
+                self._highlight_markdown_lines(result.content, result.start, result.stop)
+        self._apply_result = None
+        self._applied_version = result.version
+        # Bu sürüme kadarki düzenleme ipuçları artık gerekmez
+        while self._submitted_edits and next(iter(self._submitted_edits)) <= result.version:
+            self._submitted_edits.popitem(last=False)
+        if self.token_cache is not None:
+            changed = None if result.full else (result.start, result.stop)
+            self.token_cache.publish(result.content, result.lexer, result.document_tokens, changed)
+
+    def _retag_range(self, content: str, start: int, stop: int, tokens: Any) -> None:
+        """[start, stop) aralığındaki sözdizimi etiketlerini yeni token'larla değiştirir."""
+        self.highlight_tokens(content, tokens, self.current_lexer, start, stop)
+
+    def _highlight_markdown_lines(self, content: str, start: int, stop: int) -> None:
+        """Markdown desenleri satır içinde kaldığı için [start, stop) aralığını içeren satırları yeniden tarar."""
+        block_start = content.rfind("\n", 0, start) + 1
+        block_end = content.find("\n", stop)
+        if block_end < 0:
+            block_end = len(content)
+        self._highlight_markdown(content, block_start, block_end)
+
+    def set_viewport_mode(self, enabled: bool) -> None:
+        """Görünüm alanı tabanlı tembel vurgulama modunu açar/kapatır."""
+        self.viewport_mode = enabled
+        self._viewport_range = None
+        self._reset_state()
+        if enabled and self.token_cache is not None:
+            self.token_cache.invalidate()
+
+    def highlight_visible(self, force: bool = False) -> None:
+        """Metin alanında şu an görünen satırları (kenar payıyla) vurgular."""
+        try:
+            first_line = int(self.text_widget.index("@0,0").split(".")[0])
+            height = self.text_widget.winfo_height()
+            last_line = int(self.text_widget.index(f"@0,{height}").split(".")[0])
+        except tk.TclError:
+            return
+        self.highlight_viewport(first_line, last_line, force)
+
+    def highlight_viewport(self, first_line: int, last_line: int, force: bool = False) -> None:
+        """
+        Sadece [first_line, last_line] aralığını ve `viewport_margin` kadar kenar payını vurgular.
+
+        Kapsanan aralık tembel olarak genişletilir: görünür alan zaten kapsanıyorsa hiçbir şey
+        yapılmaz, kaydırıldıkça sadece yeni satırlara etiket uygulanır ve görünür alandan
+        uzakta kalan etiketler kaldırılır. Pencere her zaman bir satır başından "root"
+        durumuyla lexlenir; bu yüzden kenar payından daha uzun çok satırlı yapılar yaklaşık
+        renklendirilebilir. `force` düzenleme sonrası pencereyi yeniden lexlemek içindir.
+        """
+        margin = self.viewport_margin
+        total_lines = (self.document.line_count if self.document is not None
+                       else int(self.text_widget.index("end-1c").split(".")[0]))
+        start = max(1, first_line - margin)
+        end = min(total_lines, last_line + margin)
+        covered = self._viewport_range
+
+        if covered and not force:
+            # Görünür alan yarım kenar payıyla zaten kapsanıyorsa yeniden vurgulama gerekmez
+            if (covered[0] <= max(1, first_line - margin // 2)
+                    and covered[1] >= min(total_lines, last_line + margin // 2)):
+                return
+
+        if covered and not force and covered[0] <= end and covered[1] >= start:
+            # Mevcut kapsamı genişlet, sadece eksik kısımları etiketle
+            segments = []
+            if start < covered[0]:
+                segments.append((start, covered[0] - 1))
+            if end > covered[1]:
+                segments.append((covered[1] + 1, end))
+            covered = (min(start, covered[0]), max(end, covered[1]))
+        else:
+            if covered:
+                self._remove_syntax_tags(f"{covered[0]}.0", f"{covered[1]}.end")
+            segments = [(start, end)]
+            covered = (start, end)
+
+        # Görünür alandan uzakta kalan etiketleri bırak
+        keep_start, keep_end = start - margin, end + margin
+        if covered[0] < keep_start:
+            self._remove_syntax_tags(f"{covered[0]}.0", f"{keep_start}.0")
+            covered = (keep_start, covered[1])
+        if covered[1] > keep_end:
+            self._remove_syntax_tags(f"{keep_end}.end", f"{covered[1]}.end")
+            covered = (covered[0], keep_end)
+        self._viewport_range = covered
+
+        if not segments:
+            return
+
+        if self.document is not None:
+            text = self.document.get_lines(start, end)
+        else:
+            text = self.text_widget.get(f"{start}.0", f"{end}.end")
+        line_offsets = LineIndex(text).starts + [len(text) + 1]
+
+        runs = list(self.current_lexer.get_tokens_unprocessed(text))
+        for seg_start, seg_end in segments:
+            lo = line_offsets[seg_start - start]
+            hi = line_offsets[seg_end - start + 1] - 1
+            tokens = []
+            for pos, token, value in runs:
+                value_end = pos + len(value)
+                if value_end <= lo or pos >= hi:
+                    continue
+                tokens.append((token, value[max(0, lo - pos):hi - pos]))
+            self._apply_tokens(f"{seg_start}.0", tokens)
+
+    def _remove_syntax_tags(self, start_index: str, end_index: str) -> None:
+        """Verilen aralıktaki sözdizimi etiketlerini kaldırır."""
+        self._replace_tag_ranges(start_index, end_index, {})
+
+    def _replace_tag_ranges(self, start_index: Optional[str], end_index: Optional[str],
+                            ranges: Dict[str, List[str]]) -> None:
+        """
+        [start_index, end_index) aralığındaki sözdizimi etiketlerini kaldırır (aralık None ise
+        kaldırmaz) ve `ranges` içindeki aralıkları ekler. Tüm işlem tek bir Tcl betiği olarak tek
+        seferde çalıştırılır: etiket başına bir 'tag remove' ve çok aralıklı bir 'tag add' komutu.
+        """
+        widget = self.text_widget
+        commands = []
+        if start_index is not None:
+            commands.extend(f"{widget._w} tag remove {{{tag}}} {start_index} {end_index}"
+                            for tag in widget.tag_names() if tag.startswith(self.TAG_PREFIX))
+        commands.extend(f"{widget._w} tag add {{{tag}}} {' '.join(indices)}"
+                        for tag, indices in ranges.items())
+        if commands:
+            widget.tk.eval("\n".join(commands))
+
+    def _apply_tokens(self, start_index: str, tokens: Any) -> None:
+        """Token dizisini verilen indeksten başlayarak etiket olarak uygular (toplu Tcl çağrısıyla)."""
+        line, col = self.text_widget.index(start_index).split(".")
+        ranges, _, _ = build_tag_ranges(tokens, int(line), int(col), self.TAG_PREFIX)
+        self._replace_tag_ranges(None, None, ranges)
+
+    def _on_change(self, change: Any) -> None:
+        """
+        ChangeTracker dinleyicisi (DocumentModel güncellendikten sonra çağrılır): düzenlemenin
+        değiştirmediği önek ve sonek uzunluğunu son lexing'den beri biriken ipucuyla birleştirir.
+        """
+        start = self.document.offset(change.start_line, change.start_col)
+        hint = (start, len(self.document) - start - len(change.text))
+        self._pending_edit = hint if self._pending_edit is None else merge_edits(self._pending_edit, hint)
+
+    def _take_edit(self) -> Optional[EditHint]:
+        """Biriken düzenleme ipucunu alır ve sıfırlar; değişiklikler izlenmiyorsa None (metinler karşılaştırılır)."""
+        if not self._tracks_edits:
+            return None
+        edit, self._pending_edit = self._pending_edit, None
+        return edit if edit is not None else NO_EDIT
+
+    def _edit_since(self, base_version: Optional[int]) -> Optional[EditHint]:
+        """`base_version`'dan son gönderilen sürüme kadarki düzenlemelerin birleşik ipucu; bilinmiyorsa None."""
+        if base_version is None or not self._tracks_edits:
+            return None
+        if self._version - base_version > len(self._submitted_edits):
+            return None
+        edit = NO_EDIT
+        for version in range(base_version + 1, self._version + 1):
+            step = self._submitted_edits.get(version)
+            if step is None:
+                return None
+            edit = merge_edits(edit, step)
+        return edit
+
+    def _reset_state(self) -> None:
+        """Artımlı vurgulama durumunu sıfırlar (bir sonraki çağrı tam vurgulama yapar)."""
+        self._lex_state = None
+        self._applied_version = None
+
+    def _get_content(self) -> str:
+        """Belgenin tamamı; DocumentModel varsa Tk tamponu kopyalanmaz."""
+        if self.document is not None:
+            return self.document.text()
+        return self.text_widget.get("1.0", "end-1c")
+
+    def _get_line_index(self, content: str) -> LineIndex:
+        """İçeriğin satır başı dizinini döndürür; aynı içerik nesnesi için bir kez oluşturulur."""
+        if self._line_index is None or self._line_index.content is not content:
+            self._line_index = LineIndex(content)
+        return self._line_index
+
+    def _highlight_markdown(self, content: str, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Markdown için regex tabanlı hızlı vurgulama yapar (isteğe bağlı olarak bir aralıkta).
+        Eşleşme konumları LineIndex ile Python'da 'satır.sütun' indekslerine çevrilir ve
+        etiketler tek bir Tcl betiğiyle uygulanır.
+        """
+        if end is None:
+            end = len(content)
+        widget = self.text_widget
+        line_index = self._get_line_index(content)
+        commands = []
+        if start > 0 or end < len(content):
+            # Sadece verilen satır aralığındaki md_ etiketlerini yenile
+            range_start, range_end = line_index.index(start), line_index.index(end)
+            commands.extend(f"{widget._w} tag remove md_{tag} {range_start} {range_end}"
+                            for tag in self.MARKDOWN_PATTERNS)
+        for tag, regex in self._MARKDOWN_REGEXES.items():
+            indices = []
+            for match in regex.finditer(content, start, end):
+                indices.append(line_index.index(match.start()))
+                indices.append(line_index.index(match.end()))
+            if indices:
+                commands.append(f"{widget._w} tag add md_{tag} {' '.join(indices)}")
+        if commands:
+            widget.tk.eval("\n".join(commands))
 
     def _clear_tags(self) -> None:
         """Tüm sözdizimi etiketlerini metinden kaldırır."""
@@ -155,30 +772,43 @@ class SyntaxHighlighter:
 
     def set_lexer_from_filename(self, filename: str) -> Any:
         """Dosya uzantısına göre uygun lexer'ı seçer ve vurgular."""
-        try:
-            lexer = get_lexer_for_filename(filename)
-        except pygments.util.ClassNotFound:
-            lexer = PythonLexer()
+        lexer = LexerRegistry.get_instance().get_lexer_for_filename(filename) or PythonLexer()
         self.current_lexer = lexer
-        self.highlight()
+        self._reset_state()
+        self.refresh()
         return lexer
 
     def set_lexer_by_name(self, name: str) -> Any:
         """Dil adına göre lexer'ı seçer ve vurgular."""
-        try:
-            lexer = get_lexer_by_name(name)
-        except pygments.util.ClassNotFound:
-            lexer = PythonLexer()
+        lexer = LexerRegistry.get_instance().get_lexer_by_name(name) or PythonLexer()
         self.current_lexer = lexer
-        self.highlight()
+        self._reset_state()
+        self.refresh()
         return lexer
 
     def set_lexer(self, lexer: Any) -> None:
         self.current_lexer = lexer
+        self._reset_state()
 
     def update_style(self, style_name: str) -> None:
         """Vurgulama stilini günceller ve metni yeniden renklendirir."""
         self.style_name = style_name
         self.setup_tags()
-        self.highlight()
+        self.refresh()
+
+    def close(self) -> None:
+        """Bekleyen işleri iptal eder ve arka plan işçisini durdurur."""
+        for job in (self._poll_job, self._apply_job):
+            if job is not None:
+                try:
+                    self.text_widget.after_cancel(job)
+                except tk.TclError:
+                    pass
+        self._poll_job = self._apply_job = None
+        self._apply_result = None
+        if self._tracks_edits and self.document.change_tracker is not None:
+            self.document.change_tracker.remove_listener(self._on_change)
+            self._tracks_edits = False
+        if self._tokenizer is not None:
+            self._tokenizer.close()
 
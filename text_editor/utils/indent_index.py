@@ -0,0 +1,171 @@
+from array import array
+from typing import Any, Iterator, Optional, Tuple
+
+
+class IndentIndex:
+    """
+    Bir belgenin girinti ve katlama aralığı dizini.
+
+    Her satır için girinti düzeyi (boş satırlar için BLANK_LEVEL) bir `bytearray`'de, o
+    satırda başlayan katlanabilir bloğun uzunluğu (katlanamıyorsa 0) bir `array`'de tutulur.
+    Bir satır, kendisinden sonraki ilk dolu satırın girintisi daha fazlaysa katlanabilirdir;
+    blok, girintisi aynı veya daha az olan ilk dolu satırda biter. İçerik kopyalanmaz;
+    satırlar gerektiğinde DocumentModel'den okunur.
+
+    ChangeTracker'dan gelen her değişiklikte (`apply_change`) sadece düzenlenen satırların
+    girintisi yeniden hesaplanır ve dizilere eklenir/çıkarılır; girintiyi ve satır sayısını
+    değiştirmeyen düzenlemeler katlamaya dokunmaz. Blok uzunlukları göreli
+    saklandığı için düzenlemeden sonraki kayıtlar kaydırma gerektirmez; düzenlemeyi içine
+    alan üst blokların uzunluğu ise satır sayısı farkı kadar düzeltilir. Katlama tablosu
+    sorgudan önce (`refresh`) yığınla, sadece düzenlenen satırları içeren en yakın blok için
+    yeniden kurulur. Üst satırlar girinti düzeyi baytlarında C hızında (`rfind`/`find`)
+    aranır. Sorgular O(1)'dir. Satır numaraları Tkinter gibi 1'den başlar.
+    """
+    BLANK = -1
+    BLANK_LEVEL = 255
+    MAX_LEVEL = 254  # Daha geniş girintiler bu düzeyde sayılır
+
+    def __init__(self, document: Any):
+        self.document = document
+        self.levels = bytearray()
+        self.fold_lengths = array("i")
+        self.version = 0
+        # Katlaması yeniden kurulacak (ilk, son, en düşük düzey); 0 tabanlı, geçerli satırlarla
+        self._dirty: Optional[Tuple[int, int, int]] = None
+        self.reset()
+
+    @property
+    def line_count(self) -> int:
+        return len(self.levels)
+
+    @classmethod
+    def _level(cls, line: str) -> int:
+        stripped = line.lstrip()
+        return min(len(line) - len(stripped), cls.MAX_LEVEL) if stripped else cls.BLANK_LEVEL
+
+    def reset(self) -> None:
+        """Dizini belgenin tamamından baştan kurar."""
+        count = self.document.line_count
+        self.levels = bytearray(map(self._level, self.document.get_lines(1, count).split("\n")))
+        self.fold_lengths = array("i", bytes(4 * count))
+        self._dirty = None
+        self.version += 1
+        self._rebuild_folds(0, count)
+
+    def apply_change(self, start_line: int, old_end_line: int, new_end_line: int) -> None:
+        """
+        Eski belgedeki [start_line, old_end_line] satırlarının yeni belgede [start_line,
+        new_end_line] olduğunu bildirir (TextChange alanları). Belge zaten güncellenmiş olmalıdır.
+        """
+        first, old_last, new_last = start_line - 1, old_end_line - 1, new_end_line - 1
+        levels, folds = self.levels, self.fold_lengths
+        new = bytearray(map(self._level, self.document.get_lines(start_line, new_end_line).split("\n")))
+        if new == levels[first:old_last + 1]:
+            return  # Satır sayısı ve girintiler aynı (satır içi yazma): katlamalar değişmez
+        lowest = min(min(levels[first:old_last + 1], default=self.BLANK_LEVEL), min(new))
+        added = new_last - old_last
+        if added:
+            # Düzenlemeyi içine alan üst blokların (göreli) uzunluğu satır farkı kadar değişir
+            line = self._previous_below(first, lowest)
+            while line >= 0:
+                if folds[line] and line + folds[line] > old_last:
+                    folds[line] += added
+                line = self._previous_below(line, levels[line])
+        levels[first:old_last + 1] = new
+        folds[first:old_last + 1] = array("i", bytes(4 * len(new)))
+        self.version += 1
+
+        if self._dirty is None:
+            self._dirty = (first, new_last, lowest)
+        else:
+            low, high, level = self._dirty
+            if high > old_last:
+                high += added
+            elif high >= first:
+                high = new_last
+            self._dirty = (min(low, first), max(high, new_last), min(level, lowest))
+
+    def refresh(self) -> None:
+        """Bekleyen düzenlemeleri içeren en yakın bloğun katlama tablosunu yeniden kurar."""
+        if self._dirty is None:
+            return
+        if len(self.levels) != self.document.line_count:
+            self.reset()
+            return
+        low, high, level = self._dirty
+        self._dirty = None
+        # Bölge, düzenlemeden önceki girintisi en fazla `level` olan satırdan (düzenlenmemiş
+        # blok başı), bölgede açılan tüm blokları kapatan ilk satıra kadardır
+        start = max(self._previous_below(low, level + 1), 0)
+        self._rebuild_folds(start, self._next_at_most(high + 1, min(self.levels[start:high + 1])))
+
+    def _previous_below(self, position: int, limit: int) -> int:
+        """`position`'dan önceki, düzeyi `limit`'ten küçük son dolu satır; yoksa -1."""
+        levels = self.levels
+        best = -1
+        for level in range(min(limit, self.BLANK_LEVEL)):
+            found = levels.rfind(level, best + 1, position)
+            if found > best:
+                best = found
+        return best
+
+    def _next_at_most(self, position: int, limit: int) -> int:
+        """`position` veya sonrasındaki, düzeyi en fazla `limit` olan ilk dolu satır; yoksa satır sayısı."""
+        levels = self.levels
+        best = len(levels)
+        for level in range(min(limit + 1, self.BLANK_LEVEL)):
+            found = levels.find(level, position, best)
+            if found >= 0:
+                best = found
+        return best
+
+    def _rebuild_folds(self, start: int, stop: int) -> None:
+        """[start, stop) satırlarının katlama tablosunu kurar; `stop` satırı açık blokları kapatır."""
+        levels = self.levels
+        folds = self.fold_lengths
+        blank = self.BLANK_LEVEL
+        stack = []  # (satır, girinti)
+        previous = -1
+        for line in range(start, stop):
+            indent = levels[line]
+            if indent == blank:
+                continue
+            # Bir önceki dolu satır, bu satır daha içerideyse katlanabilir (uzunluk blok kapanınca yazılır)
+            if previous >= 0:
+                folds[previous] = 1 if indent > levels[previous] else 0
+            while stack and stack[-1][1] >= indent:
+                opened = stack.pop()[0]
+                if folds[opened]:
+                    folds[opened] = line - opened
+            stack.append((line, indent))
+            previous = line
+        if previous >= 0:
+            folds[previous] = 0
+        # Bölgenin sonundaki satır (bloğu kapatan satır veya dosya sonu) açık blokları kapatır
+        for opened, _ in stack:
+            if folds[opened]:
+                folds[opened] = stop - opened
+
+    def is_foldable(self, line: int) -> bool:
+        """Satırda katlanabilir bir blok başlıyor mu?"""
+        return 0 < line <= len(self.fold_lengths) and self.fold_lengths[line - 1] > 0
+
+    def fold_end(self, line: int) -> int:
+        """
+        Satırda başlayan bloğu sonlandıran satırı döndürür (dahil değil).
+        Katlanan aralık (line + 1).0 ile fold_end(line).0 arasıdır; dosya sonunda line_count + 1 olur.
+        """
+        if not self.is_foldable(line):
+            return line + 1
+        return line + self.fold_lengths[line - 1]
+
+    def indent(self, line: int) -> int:
+        """Satırın girinti genişliği (MAX_LEVEL ile sınırlı; boşsa BLANK)."""
+        level = self.levels[line - 1]
+        return self.BLANK if level == self.BLANK_LEVEL else level
+
+    def foldable_lines(self) -> Iterator[int]:
+        """Katlanabilir tüm satırları sırayla üretir."""
+        for index, length in enumerate(self.fold_lengths):
+            if length:
+                yield index + 1
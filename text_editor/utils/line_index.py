@@ -0,0 +1,43 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Tuple
+
+
+class LineIndex:
+    """
+    Bir metnin satır başı konumlarının dizini.
+
+    Mutlak karakter konumlarını Tkinter 'satır.sütun' indekslerine Python'da, ikili arama ile
+    O(log n) sürede çevirir. "1.0 + Nc" gibi ifadeler Tk tarafından tamponun başından itibaren
+    yürünerek çözüldüğü için çok sayıda konum çeviren kodlar (regex tabanlı etiketleyiciler)
+    bu dizini kullanmalıdır. İçeriğin her sürümü için bir kez oluşturulur ve değiştirilmez.
+    """
+    __slots__ = ("content", "starts")
+
+    def __init__(self, content: str):
+        self.content = content
+        # starts[i]: (i + 1). satırın ilk karakterinin konumu
+        self.starts: List[int] = [0]
+        self.starts.extend(accumulate(len(line) + 1 for line in content.split("\n")[:-1]))
+
+    @property
+    def line_count(self) -> int:
+        return len(self.starts)
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """Mutlak konumu (satır, sütun) ikilisine çevirir; satırlar 1'den başlar."""
+        line = bisect_right(self.starts, offset) - 1
+        return line + 1, offset - self.starts[line]
+
+    def index(self, offset: int) -> str:
+        """Mutlak konumu Tkinter 'satır.sütun' indeksine çevirir."""
+        line = bisect_right(self.starts, offset) - 1
+        return f"{line + 1}.{offset - self.starts[line]}"
+
+    def offset(self, line: int, col: int = 0) -> int:
+        """'satır.sütun' konumunu mutlak karakter konumuna çevirir (satırlar 1'den başlar)."""
+        return self.starts[line - 1] + col
+
+    def line_start(self, line: int) -> int:
+        """Verilen satırın (1'den başlar) ilk karakterinin mutlak konumu."""
+        return self.starts[line - 1]
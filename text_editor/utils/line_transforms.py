@@ -0,0 +1,111 @@
+import random
+import re
+from typing import Callable, Dict, List, Optional
+
+# Satır listesini yeni bir satır listesine çeviren dönüşüm
+LineTransform = Callable[..., List[str]]
+
+_NUMBER = re.compile(r"\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)")
+_DIGITS = re.compile(r"(\d+)")
+
+
+def _numeric_key(line: str):
+    """Satır başındaki sayıya göre; sayı içermeyen satırlar sona (kendi sıralarıyla) kalır."""
+    match = _NUMBER.match(line)
+    if match is None:
+        return (1, 0.0)
+    return (0, float(match.group(1)))
+
+
+def _natural_key(line: str):
+    """"dosya2" < "dosya10": rakam grupları sayı olarak karşılaştırılır."""
+    # split her zaman metin, sayı, metin, ... sırasıyla döner; aynı konumdaki öğeler aynı türdedir
+    parts = _DIGITS.split(line.casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return parts
+
+
+def sort_lines(lines: List[str], mode: str = "lexical", reverse: bool = False,
+               nocase: bool = False) -> List[str]:
+    """Satırları sıralar. `mode`: "lexical", "numeric" veya "natural" (kararlı sıralama)."""
+    if mode == "numeric":
+        key = _numeric_key
+    elif mode == "natural":
+        key = _natural_key
+    elif nocase:
+        key = str.casefold
+    else:
+        key = None
+    return sorted(lines, key=key, reverse=reverse)
+
+
+def unique_lines(lines: List[str]) -> List[str]:
+    """Tekrarlanan satırları atar; her satırın ilk geçtiği yer korunur."""
+    return list(dict.fromkeys(lines))
+
+
+def reverse_lines(lines: List[str]) -> List[str]:
+    return lines[::-1]
+
+
+def shuffle_lines(lines: List[str], seed: Optional[int] = None) -> List[str]:
+    shuffled = list(lines)
+    random.Random(seed).shuffle(shuffled)
+    return shuffled
+
+
+def indent_lines(lines: List[str], unit: str = "    ") -> List[str]:
+    """Boş olmayan satırların başına bir girinti birimi ekler."""
+    return [unit + line if line.strip() else line for line in lines]
+
+
+def outdent_lines(lines: List[str], tab_size: int = 4) -> List[str]:
+    """Her satırın başından bir sekme veya en fazla `tab_size` boşluk kaldırır."""
+    result = []
+    for line in lines:
+        if line.startswith("\t"):
+            result.append(line[1:])
+        else:
+            spaces = len(line) - len(line.lstrip(" "))
+            result.append(line[min(spaces, tab_size):])
+    return result
+
+
+def trim_trailing(lines: List[str]) -> List[str]:
+    """Satır sonlarındaki boşlukları siler."""
+    return [line.rstrip() for line in lines]
+
+
+TRANSFORMS: Dict[str, LineTransform] = {
+    "sort": sort_lines,
+    "unique": unique_lines,
+    "reverse": reverse_lines,
+    "shuffle": shuffle_lines,
+    "indent": indent_lines,
+    "outdent": outdent_lines,
+    "trim": trim_trailing,
+}
+
+
+def apply_transform(name: str, lines: List[str], **options) -> List[str]:
+    """Adı verilen dönüşümü uygular; bilinmeyen adlarda KeyError fırlatır."""
+    return TRANSFORMS[name](lines, **options)
+
+
+def changed_span(old: List[str], new: List[str]):
+    """
+    İki satır listesinin farklı olan bölümü: (ortak baş satır sayısı, eski listede ve yeni
+    listede farklı bölümün sonu). Değişiklik yoksa None. Düzenleme ve yeniden vurgulama
+    sadece bu bölümle sınırlanır.
+    """
+    head = 0
+    limit = min(len(old), len(new))
+    while head < limit and old[head] == new[head]:
+        head += 1
+    if head == len(old) == len(new):
+        return None
+    old_end, new_end = len(old), len(new)
+    while old_end > head and new_end > head and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return head, old_end, new_end
@@ -0,0 +1,224 @@
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Callable, List, Optional, Tuple
+
+from text_editor.utils.encoding_detector import SAMPLE_SIZE, DetectedEncoding, detect_encoding
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Satır sonlarının bayt düzeyinde b'\\n' ile aranabileceği (tek baytlı/UTF-8) kodlamalar."""
+    try:
+        return "\n\r".encode(encoding) == b"\n\r"
+    except (LookupError, UnicodeError):
+        return False
+
+
+class MappedFile:
+    """
+    Bir dosyanın salt okunur bellek eşlemesi (mmap) ve satır sonu dizini.
+
+    Dosya belleğe kopyalanmaz; işletim sistemi sadece okunan sayfaları yükler. Dizin arka
+    plan iş parçacığında BLOCK_SIZE baytlık bloklar halinde oluşturulur ve her bloğun
+    başına kadar olan satır sonu sayısını tutar (çok GB'lık bir dosya için birkaç yüz KB).
+    Bir satırın konumu bu sayılar üzerinde ikili arama ve tek bir blok içinde tarama ile
+    bulunur. Dizin tamamlanmadan önce sadece dizinlenmiş kısımdaki satırlar sorgulanabilir;
+    satır sonuna göre gezinme (`line_start`, `next_line`, `prev_line`) dizinden bağımsızdır.
+
+    Satır numaraları 1'den, konumlar bayt cinsinden 0'dan başlar. BOM varsa ilk satır
+    `bom_length` baytından başlar.
+    """
+    BLOCK_SIZE = 64 * 1024
+    SEARCH_CHUNK = 8 * 1024 * 1024  # Aramada iptal denetimleri arasındaki bayt sayısı
+
+    def __init__(self, path: str, detected: Optional[DetectedEncoding] = None):
+        self.path = path
+        # _counts[b]: b. bloğun başına kadar olan satır sonu sayısı; dizinlenen blok sayısı len - 1
+        self._counts = array("q", [0])
+        self._closing = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._file = open(path, "rb")
+        try:
+            # Boş dosyalar eşlenemez; boş bayt dizisi aynı arayüzü (find/rfind/dilim) sağlar
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) \
+                if os.fstat(self._file.fileno()).st_size else b""
+        except Exception:
+            self._file.close()
+            raise
+        self.size = len(self._map)
+        if detected is None:
+            sample = self._map[:SAMPLE_SIZE]
+            detected = detect_encoding(sample, complete=self.size <= SAMPLE_SIZE)
+        if not is_ascii_compatible(detected.encoding):
+            self.close()
+            raise UnicodeError(f"{detected.encoding} kodlaması bellek eşlemeli görünümde desteklenmiyor.")
+        self.encoding = detected.encoding
+        self.bom_length = detected.bom_length
+
+    def start(self) -> None:
+        """Satır sonu dizinini arka planda oluşturmaya başlar."""
+        self._spawn(self._build_index, "mmap-index")
+
+    def close(self) -> None:
+        """Arka plan işlerini durdurur ve eşlemeyi kapatır."""
+        self._closing.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(1.0)
+        self._threads.clear()
+        if isinstance(self._map, mmap.mmap):
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # Süresi içinde bitmeyen bir arama eşlemeyi hâlâ kullanıyor; çöp toplayıcı kapatır
+        self._file.close()
+
+    def _spawn(self, target: Callable[..., None], name: str, *args) -> None:
+        self._threads = [t for t in self._threads if t.is_alive()]
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    # --- Dizin ---
+
+    def _build_index(self) -> None:
+        counts, block, data = self._counts, self.BLOCK_SIZE, self._map
+        for start in range(0, self.size, block):
+            if self._closing.is_set():
+                return
+            counts.append(counts[-1] + data[start:start + block].count(b"\n"))
+
+    @property
+    def indexed_bytes(self) -> int:
+        return min((len(self._counts) - 1) * self.BLOCK_SIZE, self.size)
+
+    @property
+    def index_complete(self) -> bool:
+        return self.indexed_bytes >= self.size
+
+    @property
+    def progress(self) -> float:
+        return self.indexed_bytes / self.size if self.size else 1.0
+
+    @property
+    def indexed_lines(self) -> int:
+        """Dizinlenmiş kısımdaki satır sayısı (dizin tamamsa dosyanın satır sayısı)."""
+        return self._counts[-1] + 1
+
+    @property
+    def line_count(self) -> Optional[int]:
+        """Toplam satır sayısı; dizin tamamlanmadıysa None."""
+        return self.indexed_lines if self.index_complete else None
+
+    def line_offset(self, line: int) -> Optional[int]:
+        """Satırın ilk baytının konumu; satır henüz dizinlenmediyse veya yoksa None."""
+        target = line - 1  # Satırdan önceki satır sonu sayısı
+        if target <= 0:
+            return self.bom_length if target == 0 else None
+        counts = self._counts
+        block = bisect_left(counts, target) - 1
+        if block + 1 >= len(counts):
+            return None
+        pos = block * self.BLOCK_SIZE
+        for _ in range(target - counts[block]):
+            pos = self._map.find(b"\n", pos) + 1
+        return pos
+
+    def line_of_offset(self, offset: int) -> Optional[int]:
+        """Konumun bulunduğu satırın numarası; konum henüz dizinlenmediyse None."""
+        block = offset // self.BLOCK_SIZE
+        if block >= len(self._counts):
+            return None
+        start = block * self.BLOCK_SIZE
+        return self._counts[block] + self._map[start:offset].count(b"\n") + 1
+
+    # --- Satırlar ---
+
+    def line_start(self, offset: int) -> int:
+        """Konumun bulunduğu satırın başlangıcı."""
+        offset = min(max(offset, self.bom_length), self.size)
+        return max(self._map.rfind(b"\n", 0, offset) + 1, self.bom_length)
+
+    def next_line(self, offset: int) -> Optional[int]:
+        """Konumdan sonraki satırın başlangıcı; son satırdaysa None."""
+        pos = self._map.find(b"\n", offset)
+        return pos + 1 if pos >= 0 else None
+
+    def prev_line(self, offset: int) -> Optional[int]:
+        """`offset` bir satır başıysa önceki satırın başlangıcı; ilk satırdaysa None."""
+        if offset <= self.bom_length:
+            return None
+        return self.line_start(offset - 1)
+
+    def read_line(self, start: int, limit: int) -> Tuple[str, Optional[int]]:
+        """
+        `start` ile başlayan satırı (en fazla `limit` bayt) çözer ve sonraki satırın
+        başlangıcıyla birlikte döndürür. Çözülemeyen baytlar yerine '\\ufffd' konur.
+        """
+        end = self._map.find(b"\n", start)
+        stop = self.size if end < 0 else end
+        raw = self._map[start:min(stop, start + limit)]
+        if raw.endswith(b"\r") and stop - start <= limit:
+            raw = raw[:-1]
+        text = raw.decode(self.encoding, errors="replace")
+        if stop - start > limit:
+            text += " …"
+        return text, (end + 1 if end >= 0 else None)
+
+    def decode(self, start: int, end: int) -> str:
+        """[start, end) bayt aralığını çözer."""
+        return self._map[start:end].decode(self.encoding, errors="replace")
+
+    # --- Arama ---
+
+    def compile(self, pattern: str, nocase: bool = False, whole_word: bool = False,
+                regex: bool = False) -> "re.Pattern[bytes]":
+        """Aranacak metni dosyanın kodlamasında bir bayt düzenli ifadesine çevirir."""
+        source = pattern.encode(self.encoding, errors="strict")
+        if not regex:
+            source = re.escape(source)
+        if whole_word:
+            source = rb"\b" + source + rb"\b"
+        # Büyük/küçük harf duyarsızlığı bayt düzeyinde sadece ASCII harfler için geçerlidir
+        return re.compile(source, re.IGNORECASE if nocase else 0)
+
+    def search(self, compiled: "re.Pattern[bytes]", start: int,
+               cancelled: Optional[threading.Event] = None) -> Optional[Tuple[int, int]]:
+        """
+        `start` konumundan sonraki ilk eşleşmeyi (başlangıç, bitiş) olarak döndürür.
+        Eşlemenin tamamı tek seferde taranmaz; SEARCH_CHUNK bayt arayla iptal denetlenir.
+        Parçalar, bir satırın içinden geçen eşleşmeler bölünmesin diye satır sınırında kesilir.
+        """
+        pos = max(start, self.bom_length)
+        while pos < self.size:
+            if self._closing.is_set() or (cancelled is not None and cancelled.is_set()):
+                return None
+            stop = self.size
+            if pos + self.SEARCH_CHUNK < self.size:
+                cut = self._map.find(b"\n", pos + self.SEARCH_CHUNK)
+                stop = cut + 1 if cut >= 0 else self.size
+            match = compiled.search(self._map, pos, stop)
+            if match:
+                return match.start(), match.end()
+            pos = stop
+        return None
+
+    def search_async(self, compiled: "re.Pattern[bytes]", start: int, wrap: bool,
+                     callback: Callable[[Optional[Tuple[int, int]], bool], None],
+                     cancelled: Optional[threading.Event] = None) -> None:
+        """
+        Aramayı arka planda yürütür; `callback(eşleşme, başa_dönüldü)` arama iş parçacığından
+        çağrılır (UI güncellemesi için sonucu kuyruğa yazmalıdır).
+        """
+        def run():
+            match = self.search(compiled, start, cancelled)
+            wrapped = False
+            if match is None and wrap and start > self.bom_length:
+                match = self.search(compiled, 0, cancelled)
+                wrapped = match is not None
+            if not self._closing.is_set():
+                callback(match, wrapped)
+        self._spawn(run, "mmap-search")
@@ -0,0 +1,62 @@
+import re
+import threading
+from typing import Callable, List, Optional, Tuple
+
+# (başlangıç satırı, başlangıç sütunu, bitiş satırı, bitiş sütunu); satırlar 1'den başlar
+Occurrence = Tuple[int, int, int, int]
+
+MAX_OCCURRENCES = 100_000  # Bundan fazla eşleşme Tk'ya tek seferde yerleştirilmez
+
+
+def compile_pattern(pattern: str, regex: bool = False, nocase: bool = False,
+                    whole_word: bool = False) -> "re.Pattern[str]":
+    """Aranacak metni düzenli ifadeye çevirir; geçersiz düzenli ifadede re.error fırlatır."""
+    source = pattern if regex else re.escape(pattern)
+    if whole_word:
+        # \b yerine: metin sözcük karakteriyle başlamasa/bitmese de doğru çalışır
+        source = rf"(?<!\w)(?:{source})(?!\w)"
+    return re.compile(source, re.IGNORECASE if nocase else 0)
+
+
+def find_occurrences(text: str, compiled: "re.Pattern[str]", limit: int = MAX_OCCURRENCES,
+                     cancelled: Optional[threading.Event] = None) -> List[Occurrence]:
+    """
+    Metindeki tüm (boş olmayan) eşleşmeleri satır/sütun olarak döndürür. Satır numaraları
+    eşleşmeler arasındaki satır sonları sayılarak tek geçişte hesaplanır.
+    """
+    occurrences: List[Occurrence] = []
+    line, line_start, pos = 1, 0, 0
+
+    def locate(offset: int) -> Tuple[int, int]:
+        nonlocal line, line_start, pos
+        newlines = text.count("\n", pos, offset)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", pos, offset) + 1
+        pos = offset
+        return line, offset - line_start
+
+    for match in compiled.finditer(text):
+        start, end = match.span()
+        if start == end:
+            continue
+        if len(occurrences) >= limit or (cancelled is not None and cancelled.is_set()):
+            break
+        occurrences.append(locate(start) + locate(end))
+    return occurrences
+
+
+def find_occurrences_async(text: str, compiled: "re.Pattern[str]",
+                           callback: Callable[[List[Occurrence]], None],
+                           cancelled: Optional[threading.Event] = None) -> threading.Thread:
+    """
+    Aramayı arka plan iş parçacığında yürütür. `callback` o iş parçacığından çağrılır; UI
+    güncellemesi için sonucu bir kuyruğa yazmalıdır. `text` belgenin anlık görüntüsüdür.
+    """
+    def run():
+        result = find_occurrences(text, compiled, cancelled=cancelled)
+        if cancelled is None or not cancelled.is_set():
+            callback(result)
+    thread = threading.Thread(target=run, name="occurrence-finder", daemon=True)
+    thread.start()
+    return thread
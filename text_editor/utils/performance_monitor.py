@@ -18,17 +18,31 @@ class PerformanceMonitor:
         total_lines = 0
         total_chars = 0
         file_types = Counter()
+        keystrokes = 0
+        callbacks = 0
         
         for name, editor in app_instance.tab_manager.editors.items():
             try:
                 # Satır ve karakter sayıları
-                # Text widget'tan index alma
-                index = editor.text_area.index("end-1c")
-                if index:
-                    lines = int(index.split('.')[0])
-                    total_lines += lines
-                    total_chars += len(editor.text_area.get("1.0", "end-1c"))
+                document = getattr(editor, "document", None)
+                if document is not None:
+                    # DocumentModel sayıları O(1) tutar; tampon kopyalanmaz
+                    total_lines += document.line_count
+                    total_chars += document.char_count
+                else:
+                    # Text widget'tan index alma
+                    index = editor.text_area.index("end-1c")
+                    if index:
+                        lines = int(index.split('.')[0])
+                        total_lines += lines
+                        total_chars += len(editor.text_area.get("1.0", "end-1c"))
                 
+                # Olay yolu sayaçları (tuş vuruşu başına geri çağırma)
+                events = getattr(editor, "events", None)
+                if events is not None:
+                    keystrokes += events.keystrokes
+                    callbacks += events.callbacks
+
                 # Dosya türü analizi
                 ext = name.split('.')[-1] if '.' in name else 'txt'
                 file_types[ext] += 1
@@ -43,6 +57,7 @@ class PerformanceMonitor:
             "total_lines": total_lines,
             "total_chars": total_chars,
             "languages_str": languages_str,
+            "callbacks_per_keystroke": callbacks / keystrokes if keystrokes else 0.0,
             "file_types": file_types # Raw counter if needed
         }
 
@@ -0,0 +1,252 @@
+import json
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, NamedTuple, Optional, Set
+
+
+class RecoveredBuffer(NamedTuple):
+    """Önceki oturumdan kurtarılan, kaydedilmemiş bir belge."""
+    journal_id: str
+    file_path: Optional[str]
+    encoding: str
+    text: str
+    timestamp: float
+
+
+class BufferJournal:
+    """
+    Tek bir editörün kurtarma günlüğü.
+
+    ChangeTracker dinleyicisi olarak her değişikliği bellekteki listeye küçük bir kayıt
+    (sürüm, başlangıç satır/sütun, eski bitiş satır/sütun, yeni metin) olarak ekler; tuş
+    vuruşu başına maliyet belge boyutundan bağımsızdır. Kayıtlar FLUSH_MS'de bir toplu
+    halde yazıcı iş parçacığına verilir ve `<id>.log` dosyasına eklenir.
+
+    Belge ilk kez değiştiğinde ve günlük COMPACT_RECORDS kaydı / COMPACT_BYTES baytı
+    aşınca belgenin tamamı `<id>.snap` anlık görüntüsüne yazılır ve günlük sıfırlanır.
+    Belge kaydedilince (veya yeniden yüklenince) dosyalar silinir.
+    """
+    FLUSH_MS = 1000
+    COMPACT_RECORDS = 5000
+    COMPACT_BYTES = 1024 * 1024
+
+    def __init__(self, manager: "RecoveryJournal", editor: Any, enabled: bool = True):
+        self.manager = manager
+        self.editor = editor
+        self.enabled = enabled
+        self.journal_id = uuid.uuid4().hex
+        self._pending: List[tuple] = []
+        self._needs_snapshot = True
+        self._on_disk = False
+        self._records = 0
+        self._bytes = 0
+        self._suspended = False
+        self._closed = False
+        self._flush_job = None
+        if enabled:
+            editor.change_tracker.add_listener(self.on_change)
+
+    def on_change(self, change: Any) -> None:
+        if self._suspended or self._closed:
+            return
+        end_col = int(change.end.split(".")[1])
+        self._pending.append((change.version, change.start_line, change.start_col,
+                              change.old_end_line, end_col, change.text))
+        self._bytes += len(change.text) + 16
+        if self._flush_job is None:
+            self._flush_job = self.editor.after(self.FLUSH_MS, self.flush)
+
+    def flush(self) -> None:
+        """Bekleyen kayıtları yazıcıya verir; gerekirse anlık görüntü alır."""
+        self._cancel_flush()
+        if self._closed or not self._pending:
+            return
+        document = self.editor.document
+        if (self._needs_snapshot or self._records + len(self._pending) > self.COMPACT_RECORDS
+                or self._bytes > self.COMPACT_BYTES):
+            # Anlık görüntü bekleyen tüm kayıtları kapsar
+            header = {
+                "id": self.journal_id,
+                "file_path": self.editor.file_path,
+                "encoding": getattr(self.editor, "encoding", "utf-8"),
+                "version": document.version,
+                "time": time.time(),
+            }
+            self.manager.submit_snapshot(self.journal_id, header, document.text())
+            self._records = self._bytes = 0
+            self._needs_snapshot = False
+        else:
+            self.manager.submit_append(self.journal_id, self._pending)
+            self._records += len(self._pending)
+        self._pending = []
+        self._on_disk = True
+
+    def mark_clean(self) -> None:
+        """Belge diskteki dosyayla aynı: günlük silinir, sonraki değişiklik yeni anlık görüntü başlatır."""
+        self._cancel_flush()
+        self._pending = []
+        self._records = self._bytes = 0
+        self._needs_snapshot = True
+        self._suspended = False
+        if self._on_disk:
+            self.manager.submit_discard(self.journal_id)
+            self._on_disk = False
+
+    def suspend(self) -> None:
+        """Dosya yüklenirken değişiklikler kaydedilmez (yükleme sonunda `mark_clean` çağrılır)."""
+        self._cancel_flush()
+        self._pending = []
+        self._suspended = True
+
+    def close(self, discard: bool = False) -> None:
+        """
+        Günlüğü kapatır. `discard` True ise (sekme kaydedilmeden kapatıldı) dosyalar silinir;
+        aksi halde (uygulama kapanıyor) bekleyen kayıtlar yazılır ve belge sonraki açılışta
+        kurtarılabilir.
+        """
+        if self._closed:
+            return
+        if discard:
+            self.mark_clean()
+        else:
+            self.flush()
+        self._closed = True
+        if self.enabled:
+            self.editor.change_tracker.remove_listener(self.on_change)
+
+    def _cancel_flush(self) -> None:
+        if self._flush_job is not None:
+            try:
+                self.editor.after_cancel(self._flush_job)
+            except Exception:
+                pass
+            self._flush_job = None
+
+
+class RecoveryJournal:
+    """
+    Kaydedilmemiş belgeler (adsız sekmeler dahil) için çökme kurtarma günlüğü.
+
+    `auto_backup` ayarı açıksa her editör bir BufferJournal alır. Dosyalar
+    `~/.memati_editor/backup/` altında tutulur ve tek iş parçacıklı bir havuzda sırayla
+    yazılır; UI iş parçacığı diske dokunmaz. Uygulama bir sonraki açılışta kalan günlükleri
+    `load_recoverable` ile anlık görüntü + değişiklik kayıtlarını uygulayarak geri kurar.
+    """
+    _instance: Optional['RecoveryJournal'] = None
+
+    def __init__(self):
+        if RecoveryJournal._instance is not None:
+            raise Exception("RecoveryJournal is a singleton class!")
+        self.backup_dir = os.path.join(os.path.expanduser("~"), ".memati_editor", "backup")
+        # Tek çalışan: işlemler gönderildiği sırayla yürür; bekleyenler çıkışta tamamlanır
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recovery-journal")
+        self._own_ids: Set[str] = set()
+
+    @classmethod
+    def get_instance(cls) -> 'RecoveryJournal':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def open_buffer(self, editor: Any) -> BufferJournal:
+        """Editör için bir günlük oluşturur (`auto_backup` kapalıysa günlük hiçbir şey yazmaz)."""
+        from text_editor.utils.settings_manager import SettingsManager
+        enabled = bool(SettingsManager.get_instance().get("auto_backup", True))
+        journal = BufferJournal(self, editor, enabled)
+        self._own_ids.add(journal.journal_id)
+        return journal
+
+    # --- Yazıcı işlemleri (havuz iş parçacığında) ---
+
+    def _path(self, journal_id: str, ext: str) -> str:
+        return os.path.join(self.backup_dir, f"{journal_id}.{ext}")
+
+    def submit_snapshot(self, journal_id: str, header: dict, text: str) -> None:
+        self._executor.submit(self._guard, self._write_snapshot, journal_id, header, text)
+
+    def submit_append(self, journal_id: str, records: List[tuple]) -> None:
+        self._executor.submit(self._guard, self._append, journal_id, records)
+
+    def submit_discard(self, journal_id: str) -> None:
+        self._executor.submit(self._guard, self._discard, journal_id)
+
+    @staticmethod
+    def _guard(func, *args) -> None:
+        try:
+            func(*args)
+        except Exception as e:
+            print(f"RecoveryJournal: Yedek yazılamadı: {e}")
+
+    def _write_snapshot(self, journal_id: str, header: dict, text: str) -> None:
+        os.makedirs(self.backup_dir, exist_ok=True)
+        snap_path = self._path(journal_id, "snap")
+        tmp_path = snap_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(json.dumps(header, ensure_ascii=False))
+            f.write("\n")
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, snap_path)
+        # Eski kayıtlar anlık görüntüye dahil; sürüm denetimi yine de onları atlar
+        open(self._path(journal_id, "log"), "w").close()
+
+    def _append(self, journal_id: str, records: List[tuple]) -> None:
+        with open(self._path(journal_id, "log"), "a", encoding="utf-8", newline="") as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+    def _discard(self, journal_id: str) -> None:
+        for ext in ("snap", "log", "snap.tmp"):
+            try:
+                os.remove(self._path(journal_id, ext))
+            except FileNotFoundError:
+                pass
+
+    # --- Kurtarma ---
+
+    def load_recoverable(self) -> List[RecoveredBuffer]:
+        """Önceki oturumlardan kalan günlükleri geri kurar (en eskiden en yeniye)."""
+        try:
+            names = os.listdir(self.backup_dir)
+        except OSError:
+            return []
+        buffers = []
+        for name in names:
+            journal_id, ext = os.path.splitext(name)
+            if ext != ".snap" or journal_id in self._own_ids:
+                continue
+            try:
+                buffers.append(self._replay(journal_id))
+            except (OSError, ValueError) as e:
+                print(f"RecoveryJournal: {name} okunamadı: {e}")
+        return sorted(buffers, key=lambda b: b.timestamp)
+
+    def _replay(self, journal_id: str) -> RecoveredBuffer:
+        with open(self._path(journal_id, "snap"), "r", encoding="utf-8", newline="") as f:
+            header = json.loads(f.readline())
+            lines = f.read().split("\n")
+        version = header.get("version", 0)
+        try:
+            with open(self._path(journal_id, "log"), "r", encoding="utf-8", newline="") as f:
+                for raw in f:
+                    try:
+                        record_version, start_line, start_col, end_line, end_col, text = json.loads(raw)
+                    except ValueError:
+                        break  # Çökme anında yarım kalmış son kayıt
+                    if record_version <= version:
+                        continue
+                    # DocumentModel.apply_change ile aynı: [start, end) aralığı metinle değiştirilir
+                    head = lines[start_line - 1][:start_col]
+                    tail = lines[end_line - 1][end_col:]
+                    lines[start_line - 1:end_line] = (head + text + tail).split("\n")
+                    version = record_version
+        except FileNotFoundError:
+            pass
+        return RecoveredBuffer(journal_id, header.get("file_path"), header.get("encoding", "utf-8"),
+                               "\n".join(lines), header.get("time", 0.0))
+
+    def discard(self, journal_id: str) -> None:
+        """Kurtarılmış (veya reddedilmiş) bir günlüğü siler."""
+        self.submit_discard(journal_id)
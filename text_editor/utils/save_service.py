@@ -0,0 +1,213 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class SaveResult(NamedTuple):
+    """Bir kaydetme işinin sonucu."""
+    path: str
+    skipped: bool = False          # İçerik diskteki son kayıtla aynıydı; yazılmadı
+    encoding: str = "utf-8"        # Kullanılan kodlama (karakterler desteklenmezse UTF-8'e düşülür)
+    bom: bool = False
+    mtime: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _SaveJob:
+    __slots__ = ("path", "content", "encoding", "bom", "newline", "future")
+
+    def __init__(self, path: str, content: str, encoding: str, bom: bool, newline: str):
+        self.path = path
+        self.content = content
+        self.encoding = encoding
+        self.bom = bom
+        self.newline = newline
+        self.future: "Future[SaveResult]" = Future()
+
+
+class SaveService:
+    """
+    Dosyaları arka planda ve atomik olarak kaydeden servis.
+
+    İçerik geçici bir dosyaya (hedefle aynı dizinde) yazılır, fsync ile diske indirilir ve
+    `os.replace` ile hedefin yerine konur; yazma yarıda kalırsa eski dosya bozulmaz. İşler
+    iş parçacığı havuzunda yürür; aynı dosyanın kayıtları sırayla yazılır ve sırada bekleyen
+    eski bir kayıt yerini en yenisine bırakır (ikisi de aynı Future'ı paylaşır). İçeriğin
+    özeti son yazılan özetle aynıysa ve dosya o zamandan beri değişmediyse yazma atlanır.
+
+    Bekleyen yazmalar uygulama kapanırken tamamlanır (havuz iş parçacıkları çıkışta beklenir).
+    """
+    _instance: Optional['SaveService'] = None
+    MAX_WORKERS = 2
+
+    def __init__(self):
+        if SaveService._instance is not None:
+            raise Exception("SaveService is a singleton class!")
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="save")
+        self._lock = threading.Lock()
+        self._queued: Dict[str, _SaveJob] = {}   # Yol -> sırada bekleyen en yeni iş
+        self._running: set = set()               # Yazılmakta olan yollar
+        # Yol -> (içerik özeti, mtime_ns, boyut): son yazılan içerik ve o anki disk imzası
+        self._saved: Dict[str, Tuple[bytes, int, int]] = {}
+        # mkstemp dosyaları 0600 izniyle oluşturur; yeni dosyalar için normal izinler (umask)
+        umask = os.umask(0)
+        os.umask(umask)
+        self._new_file_mode = 0o666 & ~umask
+
+    @classmethod
+    def get_instance(cls) -> 'SaveService':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def save(self, path: str, content: str, encoding: str = "utf-8", bom: bool = False,
+             newline: str = os.linesep) -> "Future[SaveResult]":
+        """
+        `content` anlık görüntüsünü kaydetmek üzere sıraya koyar. Satır sonları `newline`
+        ile yazılır (metin modunda `open` ile aynı davranış). Dönen Future'ın sonucu bir
+        SaveResult'tır; hata durumunda da istisna fırlatmaz, `error` alanı doldurulur.
+        """
+        key = os.path.realpath(path)
+        job = _SaveJob(path, content, encoding, bom, newline)
+        with self._lock:
+            previous = self._queued.get(key)
+            if previous is not None:
+                # Henüz başlamamış eski kayıt gereksiz; bekleyenler yeni kaydın sonucunu alır
+                job.future = previous.future
+            self._queued[key] = job
+            if key not in self._running:
+                self._running.add(key)
+                self._executor.submit(self._drain, key)
+        return job.future
+
+    def is_pending(self, path: str) -> bool:
+        key = os.path.realpath(path)
+        with self._lock:
+            return key in self._queued or key in self._running
+
+    def is_own_write(self, path: str) -> bool:
+        """
+        Dosyadaki değişiklik bu servisin yazmasından mı kaynaklanıyor? Dosya izleyicisinin
+        kendi kayıtlarımız için "harici olarak değiştirildi" uyarısı vermemesi için kullanılır.
+        """
+        key = os.path.realpath(path)
+        with self._lock:
+            if key in self._queued or key in self._running:
+                return True
+            saved = self._saved.get(key)
+        return saved is not None and self._disk_signature(key) == saved[1:]
+
+    def remember(self, path: str, data: bytes) -> None:
+        """
+        Diskten okunan içeriği son kayıt olarak hatırlar; aynı baytlar kaydedilmek
+        istenirse (dosya değiştirilmeden kaydedilirse) yazma atlanır.
+        """
+        key = os.path.realpath(path)
+        signature = self._disk_signature(key)
+        if signature is None:
+            return
+        with self._lock:
+            if key not in self._queued and key not in self._running:
+                self._saved[key] = (self._digest(data), *signature)
+
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _drain(self, key: str) -> None:
+        """Bir dosyanın sıradaki kayıtlarını bitene kadar sırayla yazar."""
+        while True:
+            with self._lock:
+                job = self._queued.pop(key, None)
+                if job is None:
+                    self._running.discard(key)
+                    return
+            try:
+                result = self._write(key, job)
+            except Exception as e:
+                result = SaveResult(job.path, encoding=job.encoding, bom=job.bom, error=e)
+            job.future.set_result(result)
+
+    @staticmethod
+    def _disk_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _write(self, key: str, job: _SaveJob) -> SaveResult:
+        encoding, bom = job.encoding, job.bom
+        text = job.content if job.newline == "\n" else job.content.replace("\n", job.newline)
+        if bom:
+            text = '\ufeff' + text
+        try:
+            data = text.encode(encoding)
+        except UnicodeEncodeError:
+            # Yeni eklenen karakterler dosyanın kod sayfasında yoksa UTF-8'e geçilir
+            data = (text[1:] if bom else text).encode("utf-8")
+            encoding, bom = "utf-8", False
+        except LookupError as e:
+            return SaveResult(job.path, encoding=encoding, bom=bom, error=e)
+
+        digest = self._digest(data)
+        with self._lock:
+            saved = self._saved.get(key)
+        signature = self._disk_signature(key)
+        if saved is not None and saved[0] == digest and signature == saved[1:]:
+            return SaveResult(job.path, skipped=True, encoding=encoding, bom=bom,
+                              mtime=signature[0] / 1e9)
+
+        directory = os.path.dirname(key) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(key)}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                if signature is not None:
+                    shutil.copymode(key, tmp_path)  # Çalıştırma izni vb. korunur
+                else:
+                    os.chmod(tmp_path, self._new_file_mode)
+            except OSError:
+                pass
+            os.replace(tmp_path, key)
+        except Exception as e:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return SaveResult(job.path, encoding=encoding, bom=bom, error=e)
+        self._fsync_directory(directory)
+
+        signature = self._disk_signature(key)
+        with self._lock:
+            if signature is not None:
+                self._saved[key] = (digest, *signature)
+        return SaveResult(job.path, encoding=encoding, bom=bom,
+                          mtime=signature[0] / 1e9 if signature else 0.0)
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        """Yeniden adlandırmanın kalıcı olması için dizini diske indirir (POSIX)."""
+        if os.name != "posix":
+            return
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
@@ -17,6 +17,7 @@ class SettingsManager:
         "show_line_numbers": True,
         "word_wrap": False,
         "show_minimap": True,
+        "minimap_mode": "bitmap",
         "tab_size": 4,
         "auto_save": True,
         "auto_save_interval": 30,
@@ -33,6 +34,8 @@ class SettingsManager:
         "performance_mode": False,
         "auto_backup": True,
         "max_file_size": 10,
+        "undo_memory_limit": 16,
+        "fallback_encodings": ["cp1254", "cp1252", "latin-1"],
         "error_reporting": True,
         "recent_files": []
     }
@@ -0,0 +1,331 @@
+import re
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+OPENERS = "([{"
+CLOSERS = ")]}"
+MATCHING = {")": "(", "]": "[", "}": "{"}
+
+
+class IndentRules:
+    """Bir dil ailesinin girinti kuralları."""
+    __slots__ = ("brackets", "comment", "colon_opens", "dedent_keywords", "exit_keywords",
+                 "pattern", "skip")
+
+    def __init__(self, brackets: bool = True, comment: Optional[str] = None, colon_opens: bool = False,
+                 dedent_keywords: Tuple[str, ...] = (), exit_keywords: Tuple[str, ...] = ()):
+        self.brackets = brackets
+        self.comment = comment
+        self.colon_opens = colon_opens              # ":" ile biten satırdan sonra girinti artar
+        self.dedent_keywords = dedent_keywords      # ":" yazılınca bir düzey geri çekilen satırlar
+        self.exit_keywords = exit_keywords          # Sonraki satırın girintisini azaltan deyimler
+        # Dizgiler ve yorumlar atlanır; sadece bunların dışındaki parantezler sayılır. Desenler
+        # satır sonunu geçmez, böylece birleştirilmiş satır grupları da tek seferde sayılabilir.
+        parts = [r'"(?:\\.|[^"\\\n])*"?', r"'(?:\\.|[^'\\\n])*'?"]
+        if comment:
+            parts.append(re.escape(comment) + ".*")
+        self.skip = re.compile("|".join(parts))
+        self.pattern = re.compile("|".join(parts + [r"[()\[\]{}]"]))
+
+
+PYTHON_RULES = IndentRules(
+    comment="#", colon_opens=True,
+    dedent_keywords=("else", "elif", "except", "finally", "case"),
+    exit_keywords=("return", "pass", "break", "continue", "raise"),
+)
+BRACE_RULES = IndentRules(comment="//")
+HASH_RULES = IndentRules(comment="#")
+YAML_RULES = IndentRules(comment="#", colon_opens=True)
+TEXT_RULES = IndentRules(brackets=False)
+
+# Lexer adında geçen anahtar -> kurallar (ilk eşleşen kullanılır)
+LANGUAGE_RULES: Dict[str, IndentRules] = {
+    "python": PYTHON_RULES,
+    "cython": PYTHON_RULES,
+    "yaml": YAML_RULES,
+    "bash": HASH_RULES,
+    "shell": HASH_RULES,
+    "ruby": HASH_RULES,
+    "perl": HASH_RULES,
+    "toml": HASH_RULES,
+    "markdown": TEXT_RULES,
+    "restructuredtext": TEXT_RULES,
+    "text": TEXT_RULES,
+}
+
+
+def rules_for(lexer_name: str) -> IndentRules:
+    """Lexer adına uygun kurallar; tanınmayan diller C ailesi (süslü parantez) kurallarını alır."""
+    name = (lexer_name or "text").lower()
+    for key, rules in LANGUAGE_RULES.items():
+        if key in name:
+            return rules
+    return BRACE_RULES
+
+
+def leading_whitespace(line: str) -> str:
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+class SmartIndenter:
+    """
+    Dile duyarlı otomatik girinti.
+
+    Enter ve kapanış karakterleri için sadece imleçteki satıra (ve gerektiğinde önceki satıra)
+    bakılır; tüm belge hiçbir zaman okunmaz. Önceki satırlardan kalan parantez derinliği
+    satır bloklarının (yaklaşık BLOCK_LINES satır) net derinlik toplamlarından alınır: bir
+    sorgu, önceki blokların toplamlarını ve imlecin bloğundaki satırları sayar. ChangeTracker
+    dinleyicisi sadece değişen satırların bloğunu "bilinmiyor" yapar (satır ekleme/silme yalnız
+    o bloğun boyunu değiştirir); bilinmeyen bloklar ilk sorguda DocumentModel'den birleştirilmiş
+    metin olarak tek seferde sayılır. Açılış satırını geriye doğru aramak için ayrıca satır
+    başına net değişimler tembel olarak saklanır. Dizgi ve satır yorumlarındaki parantezler
+    sayılmaz; çok satırlı dizgi/yorumlar izlenmez (derinlik 0'ın altına inmez).
+    """
+    UNKNOWN = -(2 ** 31)
+    MAX_LOOKBACK = 2000  # Açılış satırı aranırken geriye bakılacak en fazla satır
+    BLOCK_LINES = 1024   # Derinlik bloklarının hedef boyu; 2 katını aşan bloklar bölünür
+
+    def __init__(self, document: Any, change_tracker: Any = None):
+        self.document = document
+        self.rules = TEXT_RULES
+        self._deltas = array("i")
+        self._block_lines: List[int] = []          # Her bloktaki satır sayısı
+        self._block_sums: List[Optional[int]] = []  # Bloğun net derinlik değişimi; None: bilinmiyor
+        self._invalidate_all()
+        if change_tracker is not None:
+            change_tracker.add_listener(self.on_change)
+
+    def set_language(self, lexer_name: str) -> None:
+        rules = rules_for(lexer_name)
+        if rules is not self.rules:
+            self.rules = rules
+            self._invalidate_all()
+
+    def _invalidate_all(self) -> None:
+        count = self.document.line_count
+        self._deltas = array("i", [self.UNKNOWN]) * count
+        self._block_lines = self._split(count)
+        self._block_sums = [None] * len(self._block_lines)
+
+    def _split(self, count: int) -> List[int]:
+        """`count` satırı BLOCK_LINES boyunda bloklara böler (son blok kalan satırlar)."""
+        size = self.BLOCK_LINES
+        full, rest = divmod(count, size)
+        return [size] * full + ([rest] if rest or not full else [])
+
+    def on_change(self, change: Any) -> None:
+        """Değişen satırların ve bloklarının önbellek kayıtlarını "bilinmiyor" yapar."""
+        first = change.start_line - 1
+        self._deltas[first:change.old_end_line] = (
+            array("i", [self.UNKNOWN]) * (change.new_end_line - change.start_line + 1))
+        # Eski [start_line, old_end_line] aralığını kapsayan bloklar tek blokta birleşir
+        sizes = self._block_lines
+        block, top = self._locate(change.start_line)
+        last = block
+        bottom = top + sizes[block] - 1
+        while bottom < change.old_end_line and last + 1 < len(sizes):
+            last += 1
+            bottom += sizes[last]
+        count = bottom - top + 1 + change.new_end_line - change.old_end_line
+        pieces = [count] if count <= 2 * self.BLOCK_LINES else self._split(count)
+        sizes[block:last + 1] = pieces
+        self._block_sums[block:last + 1] = [None] * len(pieces)
+
+    def _locate(self, line: int) -> Tuple[int, int]:
+        """`line` satırını içeren blok ve bu bloğun ilk satırı."""
+        ends = list(accumulate(self._block_lines))
+        block = min(bisect_left(ends, line), len(ends) - 1)
+        return block, ends[block] - self._block_lines[block] + 1
+
+    # --- Parantez derinliği ---
+
+    def _scan(self, text: str) -> Tuple[int, int, int]:
+        """
+        Metindeki parantezleri sayar: (net değişim, ulaşılan en düşük derinlik, satırda açılıp
+        kapanmamış son açılış parantezinin sütunu ya da -1).
+        """
+        if not self.rules.brackets:
+            return 0, 0, -1
+        depth = lowest = 0
+        opened = []
+        for match in self.rules.pattern.finditer(text):
+            char = match.group()
+            if char in OPENERS:
+                depth += 1
+                opened.append(match.start())
+            elif char in CLOSERS:
+                depth -= 1
+                lowest = min(lowest, depth)
+                if opened:
+                    opened.pop()
+        return depth, lowest, opened[-1] if opened else -1
+
+    def _net(self, text: str) -> int:
+        """Satırın net derinlik değişimi; dizgi/yorumlar atılıp parantezler C hızında sayılır."""
+        if not self.rules.brackets:
+            return 0
+        text = self.rules.skip.sub("", text)
+        return (text.count("(") + text.count("[") + text.count("{")
+                - text.count(")") - text.count("]") - text.count("}"))
+
+    def _delta(self, line: int) -> int:
+        deltas = self._deltas
+        value = deltas[line - 1]
+        if value == self.UNKNOWN:
+            value = deltas[line - 1] = self._net(self.document.line(line))
+        return value
+
+    def depth_before(self, line: int) -> int:
+        """
+        `line` satırının başındaki parantez derinliği: önceki blokların toplamları artı imlecin
+        bloğunda `line` satırından önceki satırlar.
+        """
+        if len(self._deltas) != self.document.line_count:
+            self._invalidate_all()
+        if not self.rules.brackets:
+            return 0
+        block, top = self._locate(line)
+        sums = self._block_sums
+        if None in sums[:block]:
+            self._count_blocks(block)
+        depth = sum(sums[:block])
+        if line > top:
+            depth += self._net(self.document.get_lines(top, line - 1))
+        return max(0, depth)
+
+    def prime(self, max_blocks: int = 32) -> bool:
+        """
+        Bilinmeyen blok toplamlarından en fazla `max_blocks` tanesini sayar; hepsi biliniyorsa
+        True. Editör bunu boşta parça parça çağırır, böylece büyük belgede ilk Enter da sadece
+        imlecin bloğunu sayar.
+        """
+        if len(self._deltas) != self.document.line_count:
+            self._invalidate_all()
+        if not self.rules.brackets:
+            return True
+        return self._count_blocks(len(self._block_sums), max_blocks)
+
+    def _count_blocks(self, stop: int, limit: Optional[int] = None) -> bool:
+        """İlk `stop` bloktan bilinmeyenleri sayar (en fazla `limit` tane); hepsi biliniyorsa True."""
+        sums = self._block_sums
+        start = 1
+        for index in range(stop):
+            size = self._block_lines[index]
+            if sums[index] is None:
+                if limit is not None:
+                    if limit == 0:
+                        return False
+                    limit -= 1
+                sums[index] = self._net(self.document.get_lines(start, start + size - 1))
+            start += size
+        return True
+
+    def opener_line(self, line: int, depth: int) -> Optional[int]:
+        """
+        `line` satırından geriye doğru, başındaki derinlik `depth` veya daha az olan ilk satır:
+        `depth` düzeyindeki parantezi açan satır. MAX_LOOKBACK içinde bulunamazsa None.
+        """
+        current = self.depth_before(line)
+        for candidate in range(line - 1, max(0, line - 1 - self.MAX_LOOKBACK), -1):
+            current -= self._delta(candidate)
+            if current <= depth:
+                return candidate
+        return None
+
+    # --- Girinti ---
+
+    def _starts_with_keyword(self, stripped: str, keywords: Tuple[str, ...]) -> bool:
+        word = re.match(r"\w+", stripped)
+        return word is not None and word.group() in keywords
+
+    def newline(self, line: int, before: str, after: str, unit: str) -> Tuple[str, int, int]:
+        """
+        Enter için tek seferde eklenecek metni hesaplar. `before`/`after`: satırın imleçten
+        önceki ve sonraki kısmı. Dönüş: (eklenecek metin, imlecin bu metindeki konumu,
+        `after` başında yerine geçilecek boşluk sayısı).
+        """
+        rules = self.rules
+        indent = leading_whitespace(before)
+        stripped = before.strip()
+        net, lowest, open_col = self._scan(before)
+        start_depth = self.depth_before(line) if rules.brackets else 0
+        consumed = len(after) - len(after.lstrip(" \t"))
+        rest = after[consumed:]
+
+        if open_col >= 0:
+            # Satırda açılan parantez kapanmadı
+            indent += unit
+            if rest and rest[0] in CLOSERS and MATCHING[rest[0]] == before[open_col]:
+                # {|} arasında Enter: kapanış parantezi kendi satırına, imleç arada
+                base = leading_whitespace(before)
+                text = "\n" + indent + "\n" + base
+                return text, 1 + len(indent), consumed
+        elif lowest < 0 and start_depth > 0:
+            # Önceki satırlarda açılan parantez bu satırda kapandı: girinti açan satırdan alınır
+            anchor = self.opener_line(line, max(0, start_depth + lowest))
+            if anchor is not None:
+                indent = leading_whitespace(self.document.line(anchor))
+            if rules.colon_opens and stripped.endswith(":"):
+                indent += unit
+        elif start_depth + net == 0:
+            is_comment = bool(rules.comment) and stripped.startswith(rules.comment)
+            if rules.colon_opens and stripped.endswith(":") and not is_comment:
+                indent += unit
+            elif self._starts_with_keyword(stripped, rules.exit_keywords):
+                indent = self._dedent(indent, unit)
+        return "\n" + indent, 1 + len(indent), consumed
+
+    def closing_indent(self, line: int, before: str, char: str, unit: str) -> Optional[str]:
+        """
+        `char` yazılmadan önce satırın alması gereken girinti; değişmesi gerekmiyorsa None.
+        Satırın ilk karakteri olan kapanış parantezi açan satırın girintisine, blok anahtar
+        kelimesinden (else, except...) sonra yazılan ":" bir düzey geriye çeker. `before`:
+        satırın imleçten önceki kısmı.
+        """
+        rules = self.rules
+        if before.strip():
+            if char != ":" or not rules.dedent_keywords:
+                return None
+            return self._keyword_indent(line, before, unit)
+        if char not in CLOSERS or not rules.brackets:
+            return None
+        depth = self.depth_before(line)
+        if depth == 0:
+            return None
+        anchor = self.opener_line(line, depth - 1)
+        indent = (leading_whitespace(self.document.line(anchor)) if anchor is not None
+                  else self._dedent(before, unit))
+        return indent if indent != before else None
+
+    def _keyword_indent(self, line: int, before: str, unit: str) -> Optional[str]:
+        """
+        else/elif/except/finally/case satırı, hâlâ önceki bloğun girintisindeyse bir düzey geri
+        alınır. Önceki dolu satır bir blok açıyorsa (":" ile bitiyorsa, örn. `match x:` altındaki
+        ilk `case`) satır zaten doğru girintidedir.
+        """
+        stripped = before.strip()
+        if not self._starts_with_keyword(stripped, self.rules.dedent_keywords) or stripped.endswith(":"):
+            return None
+        indent = leading_whitespace(before)
+        previous = line - 1
+        while previous > 0 and not self.document.line(previous).strip():
+            previous -= 1
+        if previous == 0:
+            return None
+        previous_line = self.document.line(previous)
+        if len(indent) < len(leading_whitespace(previous_line)) or self._opens_block(previous_line):
+            return None
+        return self._dedent(indent, unit) if indent else None
+
+    def _opens_block(self, line: str) -> bool:
+        """Satır (dizgi ve yorumlar hariç) ":" ile bitip yeni bir blok açıyor mu?"""
+        return self.rules.skip.sub("", line).rstrip().endswith(":")
+
+    @staticmethod
+    def _dedent(indent: str, unit: str) -> str:
+        if indent.endswith("\t"):
+            return indent[:-1]
+        spaces = len(indent) - len(indent.rstrip(" "))
+        return indent[:len(indent) - min(spaces, len(unit))]
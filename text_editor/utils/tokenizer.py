@@ -0,0 +1,503 @@
+import queue
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Optional, Any, Callable, List, Dict, Iterator, Tuple
+
+from pygments import lex
+from pygments.lexer import RegexLexer, ExtendedRegexLexer
+from pygments.lexers.c_cpp import CFamilyLexer
+from pygments.token import Error, Keyword, Name, Whitespace, _TokenType
+
+# Lexer durum yığını (örn. ('root', 'dqs')) ve kontrol noktası (konum, yığın, token indeksi)
+LexerStack = Tuple[str, ...]
+Checkpoint = Tuple[int, LexerStack, int]
+TokenList = List[Tuple[Any, str]]
+# Düzenleme ipucu: (değişmeyen önek uzunluğu, değişmeyen sonek uzunluğu)
+EditHint = Tuple[int, int]
+NO_EDIT: EditHint = (sys.maxsize, sys.maxsize)
+
+
+def merge_edits(first: EditHint, second: EditHint) -> EditHint:
+    """
+    Art arda iki düzenlemenin ipuçlarını birleştirir. Her düzenleme kendi başlangıcından
+    önceki ve kendi sonundan sonraki metne dokunmadığından, ikisinin ardından da değişmeyen
+    önek/sonek en küçükleridir.
+    """
+    return min(first[0], second[0]), min(first[1], second[1])
+
+
+def common_prefix_length(a: str, b: str) -> int:
+    """İki metnin ortak önek uzunluğunu dilim karşılaştırmalarıyla (ikili arama) bulur."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix_length(a: str, b: str, limit: int) -> int:
+    """İki metnin en fazla `limit` uzunluğundaki ortak sonek uzunluğunu bulur."""
+    len_a, len_b = len(a), len(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len_a - mid:len_a - lo] == b[len_b - mid:len_b - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def offset_to_index(content: str, offset: int) -> str:
+    """Mutlak karakter konumunu Tkinter 'satır.sütun' indeksine çevirir."""
+    line = content.count("\n", 0, offset) + 1
+    col = offset - (content.rfind("\n", 0, offset) + 1)
+    return f"{line}.{col}"
+
+
+def _c_family_token(lexer: CFamilyLexer, token: Any, value: str) -> Any:
+    """CFamilyLexer.get_tokens_unprocessed'in son işlemesi: bilinen tip adları Keyword.Type olur."""
+    if token is Name:
+        if lexer.stdlibhighlighting and value in lexer.stdlib_types:
+            return Keyword.Type
+        if lexer.c99highlighting and value in lexer.c99_types:
+            return Keyword.Type
+        if lexer.c11highlighting and value in lexer.c11_atomic_types:
+            return Keyword.Type
+        if lexer.platformhighlighting and value in lexer.linux_types:
+            return Keyword.Type
+    return token
+
+
+# get_tokens_unprocessed'i sadece RegexLexer token'larını tek tek yeniden tiplemek için ezen
+# lexer'lar: ezilen fonksiyon -> aynı dönüşümü yapan (lexer, token_tipi, metin) -> token_tipi
+TOKEN_REMAPS: Dict[Any, Callable[[Any, Any, str], Any]] = {
+    CFamilyLexer.get_tokens_unprocessed: _c_family_token,
+}
+
+
+def supports_resume(lexer: Any) -> bool:
+    """
+    Lexer'ın herhangi bir konumdan kayıtlı durum yığınıyla devam ettirilebilir olup olmadığını döndürür.
+    Filtre kullanmayan ve get_tokens_unprocessed'i ezmeyen (veya sadece TOKEN_REMAPS'teki
+    gibi token tiplerini yeniden eşlemek için ezen) RegexLexer'lar desteklenir. JSON gibi
+    RegexLexer olmayan lexer'larda durum yığını yoktur.
+    """
+    if not isinstance(lexer, RegexLexer) or isinstance(lexer, ExtendedRegexLexer) or lexer.filters:
+        return False
+    method = type(lexer).get_tokens_unprocessed
+    return method is RegexLexer.get_tokens_unprocessed or method in TOKEN_REMAPS
+
+
+def iter_tokens_with_state(lexer: RegexLexer, text: str, pos: int = 0,
+                           stack: LexerStack = ("root",)) -> Iterator[Tuple[int, Any, Any]]:
+    """
+    RegexLexer.get_tokens_unprocessed'in durum yığınını dışarı veren kopyası.
+
+    Normal token'lar için (konum, token_tipi, metin) üretir. Bir eşleşme bir satır
+    sonunu geçtiğinde ek olarak (konum, None, yığın) sınır kaydı üretir; bu kayıtlar
+    o konumdan itibaren lexing'e aynı durumla devam edilebileceğini gösterir.
+    """
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    next_newline = text.find("\n", pos)
+    if next_newline < 0:
+        next_newline = len(text)
+    while 1:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group()
+                    else:
+                        yield from action(lexer, m)
+                pos = m.end()
+                if new_state is not None:
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == "#push":
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == "#push":
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                if pos > next_newline:
+                    yield pos, None, tuple(statestack)
+                    next_newline = text.find("\n", pos)
+                    if next_newline < 0:
+                        next_newline = len(text)
+                break
+        else:
+            if pos >= len(text):
+                break
+            if text[pos] == "\n":
+                # Satır sonunda durum "root"a sıfırlanır (pygments ile aynı davranış)
+                statestack = ["root"]
+                statetokens = tokendefs["root"]
+                yield pos, Whitespace, "\n"
+                pos += 1
+                yield pos, None, ("root",)
+                next_newline = text.find("\n", pos)
+                if next_newline < 0:
+                    next_newline = len(text)
+                continue
+            yield pos, Error, text[pos]
+            pos += 1
+
+
+class LexState:
+    """
+    Artımlı lexing durumu: lexlenen içerik, lexer, kontrol noktaları, Error token konumları ve
+    tüm belgenin token dizisi. Varsayılan olarak oluşturulduktan sonra değiştirilmez; bu sayede
+    arka plan iş parçacığıyla ve token önbelleğinin tüketicileriyle güvenle paylaşılır. Sadece
+    tek iş parçacığında kullanılan durumlar `relex_document(..., in_place=True)` ile yerinde
+    güncellenebilir.
+    """
+    __slots__ = ("content", "lexer", "checkpoints", "errors", "tokens")
+
+    def __init__(self, content: str, lexer: Any, checkpoints: List[Checkpoint], errors: List[int],
+                 tokens: TokenList):
+        self.content = content
+        self.lexer = lexer
+        self.checkpoints = checkpoints
+        self.errors = errors
+        self.tokens = tokens
+
+
+def _lex_from(content: str, lexer: RegexLexer, pos: int, stack: LexerStack, interval: int,
+              resync: Optional[Dict[int, Tuple[LexerStack, int]]] = None, min_stop: int = 0,
+              token_base: int = 0) -> Tuple[TokenList, List[Checkpoint], List[int], int, Optional[int]]:
+    """
+    Metni `pos` konumundan verilen durum yığınıyla lexler.
+
+    Her `interval` satırda bir kontrol noktası kaydeder; kontrol noktasının token indeksi
+    `token_base`'den itibaren sayılır. `resync` (konum -> (yığın, eski token indeksi)) verilirse,
+    `min_stop` sonrasında eski bir kontrol noktasıyla aynı konum ve yığına ulaşıldığında durur.
+    (token'lar, yeni kontrol noktaları, Error konumları, durma konumu, durulan eski kontrol
+    noktasının token indeksi veya None) döndürür.
+    """
+    tokens: TokenList = []
+    checkpoints: List[Checkpoint] = []
+    errors: List[int] = []
+    last_pos = pos
+    lines_since = 0
+    remap = TOKEN_REMAPS.get(type(lexer).get_tokens_unprocessed)
+
+    for index, token, value in iter_tokens_with_state(lexer, content, pos, stack):
+        if token is not None:
+            if remap is not None:
+                token = remap(lexer, token, value)
+            tokens.append((token, value))
+            if token is Error:
+                errors.append(index)
+            continue
+
+        # Sınır kaydı: value burada durum yığınıdır
+        if resync and index >= min_stop:
+            old = resync.get(index)
+            if old is not None and old[0] == value:
+                return tokens, checkpoints, errors, index, old[1]
+        lines_since += content.count("\n", last_pos, index)
+        last_pos = index
+        if lines_since >= interval:
+            checkpoints.append((index, value, token_base + len(tokens)))
+            lines_since = 0
+
+    return tokens, checkpoints, errors, len(content), None
+
+
+def lex_document(content: str, lexer: Any, interval: int) -> Tuple[Optional[LexState], TokenList]:
+    """
+    Tüm belgeyi lexler. Lexer destekliyorsa artımlı güncellemeler için bir LexState de döndürür,
+    desteklemiyorsa durum None olur ve token'lar pygments.lex ile üretilir.
+    """
+    if not supports_resume(lexer):
+        return None, list(lex(content, lexer))
+    tokens, checkpoints, errors, _, _ = _lex_from(content, lexer, 0, ("root",), interval)
+    return LexState(content, lexer, [(0, ("root",), 0)] + checkpoints, errors, tokens), tokens
+
+
+def _root_checkpoint_before(checkpoints: List[Checkpoint], positions: List[int], pos: int) -> int:
+    """`pos` konumundan en az bir kontrol noktası geride, yığını "root" olan kontrol noktasının indeksi."""
+    index = max(0, bisect_left(positions, pos) - 2)
+    # Açık kalmış çok satırlı bir yapının (örn. kapanmamış üçlü tırnak) nasıl lexlendiği sonraki
+    # metne bağlı olabilir; bu yüzden yığının "root" olduğu son kontrol noktasından başlanır
+    while index > 0 and checkpoints[index][1] != ("root",):
+        index -= 1
+    return index
+
+
+def relex_document(state: LexState, content: str, interval: int, edit: Optional[EditHint] = None,
+                   in_place: bool = False) -> Optional[Tuple[LexState, int, int, TokenList]]:
+    """
+    `state` içeriğinden `content`'e yapılan düzenlemeyi artımlı olarak yeniden lexler.
+
+    Düzenlenen aralık `edit` ipucundan (değişmeyen önek ve sonek uzunlukları, ChangeTracker
+    değişikliklerinden hesaplanır) alınır; ipucu yoksa eski ve yeni içerik karşılaştırılır.
+    Lexing, ilk kirli satırdan önceki kontrol noktasından kayıtlı durum yığınıyla
+    yeniden başlar ve token akışı eski çalıştırmayla tekrar örtüştüğü anda durur.
+    Belge token dizisinde sadece yeniden lexlenen dilim değiştirilir: `in_place` ise `state`
+    yerinde güncellenir (dilim ataması), değilse yeni bir durum oluşturulur. (yeni durum,
+    başlangıç, bitiş, token'lar) döndürür; içerik değişmemişse None döner.
+
+    Not: Satırlar arası tek bir regex ile eşleşen yapılarda (örn. kapanmamış tırnak)
+    eşleşmenin başarısı sonraki metne bağlıdır. Bu yüzden başlangıç noktasından bir önceki
+    "root" kontrol noktasına kadar olan bölgede bir Error token'ı varsa, o token'dan önceki
+    "root" kontrol noktasından başlanır. Daha gerideki Error token'ları yok sayılır; geri
+    gidiş en fazla bir kontrol noktası bölgesiyle sınırlıdır.
+    """
+    old = state.content
+    if edit is None:
+        if content == old:
+            return None
+        # Düzenlenen aralığı bul (yeni metin koordinatlarında [prefix, edit_end))
+        prefix = common_prefix_length(old, content)
+        suffix = common_suffix_length(old, content, min(len(old), len(content)) - prefix)
+    else:
+        prefix = min(edit[0], len(old), len(content))
+        suffix = min(edit[1], min(len(old), len(content)) - prefix)
+        if prefix == len(old) == len(content):
+            return None
+    delta = len(content) - len(old)
+    edit_end = len(content) - suffix
+    old_edit_end = len(old) - suffix
+
+    # İlk kirli satırdan önceki "root" kontrol noktasından devam et
+    checkpoints = state.checkpoints
+    positions = [cp[0] for cp in checkpoints]
+    dirty_pos = content.rfind("\n", 0, prefix) + 1
+    resume_idx = _root_checkpoint_before(checkpoints, positions, dirty_pos)
+    if resume_idx > 0 and state.errors:
+        # Sadece bir önceki "root" bölgesindeki Error token'ları başlangıcı geri çekebilir
+        window_start = positions[_root_checkpoint_before(checkpoints, positions, positions[resume_idx])]
+        error_idx = bisect_left(state.errors, window_start)
+        if error_idx < len(state.errors) and state.errors[error_idx] < positions[resume_idx]:
+            resume_idx = _root_checkpoint_before(checkpoints, positions, state.errors[error_idx])
+    resume_pos, resume_stack, resume_token = checkpoints[resume_idx]
+
+    # Düzenlemeden sonra kalan eski kontrol noktaları (yeni koordinatlarda, eski token indeksleriyle)
+    tail_start = bisect_left(positions, old_edit_end, resume_idx + 1)
+    tail = [(pos + delta, stack, index) for pos, stack, index in checkpoints[tail_start:]]
+
+    tokens, new_checkpoints, errors, stop_pos, stop_token = _lex_from(
+        content, state.lexer, resume_pos, resume_stack, interval,
+        resync={pos: (stack, index) for pos, stack, index in tail}, min_stop=edit_end,
+        token_base=resume_token)
+    if stop_token is None:
+        stop_token = len(state.tokens)
+    shift = resume_token + len(tokens) - stop_token
+
+    checkpoint_tail = new_checkpoints + [(pos, stack, index + shift) for pos, stack, index in tail
+                                         if pos >= stop_pos]
+    error_head = bisect_left(state.errors, resume_pos)
+    error_tail = errors + [pos + delta for pos in state.errors[bisect_left(state.errors, old_edit_end):]
+                           if pos + delta >= stop_pos]
+    if in_place:
+        state.content = content
+        del checkpoints[resume_idx + 1:]
+        checkpoints.extend(checkpoint_tail)
+        state.errors[error_head:] = error_tail
+        state.tokens[resume_token:stop_token] = tokens
+        return state, resume_pos, stop_pos, tokens
+
+    new_state = LexState(
+        content,
+        state.lexer,
+        checkpoints[:resume_idx + 1] + checkpoint_tail,
+        state.errors[:error_head] + error_tail,
+        state.tokens[:resume_token] + tokens + state.tokens[stop_token:],
+    )
+    return new_state, resume_pos, stop_pos, tokens
+
+
+class TokenizeResult:
+    """
+    Arka plan lexing sonucu: [start, stop) aralığı için token'lar ve token önbelleğine
+    yayınlanacak tüm belgenin token dizisi (`document_tokens`).
+    """
+    __slots__ = ("version", "base_version", "full", "content", "lexer", "start", "stop", "tokens",
+                 "document_tokens")
+
+    def __init__(self, version: int, base_version: Optional[int], full: bool, content: str, lexer: Any,
+                 start: int, stop: int, tokens: TokenList, document_tokens: TokenList):
+        self.version = version
+        self.base_version = base_version
+        self.full = full
+        self.content = content
+        self.lexer = lexer
+        self.start = start
+        self.stop = stop
+        self.tokens = tokens
+        self.document_tokens = document_tokens
+
+
+class BackgroundTokenizer:
+    """
+    Belge anlık görüntülerini ayrı bir iş parçacığında lexleyen motor.
+
+    Her iş bir belge sürümüyle etiketlenir. İşçi kuyruktaki sadece en yeni işi işler ve
+    sonucu iş parçacığı güvenli `results` kuyruğuna koyar. `base_version` verilen işler,
+    işçinin o sürüm için sakladığı LexState'ten artımlı olarak lexlenir; durum yoksa
+    tam lexing yapılır. Tkinter'a hiç dokunmaz, sonuçları uygulamak çağıranın işidir.
+
+    Saklanan durumlar ve sonuçların belge token dizileri Tk iş parçacığıyla paylaşıldığı için
+    yerinde değiştirilmez; yeni dizi işçi iş parçacığında oluşturulur.
+    """
+
+    # Artımlı lexing için saklanan en fazla sürüm durumu
+    MAX_STATES = 4
+
+    def __init__(self, checkpoint_interval: int):
+        self.checkpoint_interval = checkpoint_interval
+        self.results: "queue.Queue[TokenizeResult]" = queue.Queue()
+        self._jobs: "queue.Queue[Optional[Tuple[int, Optional[int], str, Any, Optional[EditHint]]]]" = queue.Queue()
+        self._states: "OrderedDict[int, LexState]" = OrderedDict()  # Sadece işçi iş parçacığı kullanır
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, version: int, content: str, lexer: Any, base_version: Optional[int] = None,
+               edit: Optional[EditHint] = None) -> None:
+        """
+        Bir belge anlık görüntüsünü lexlenmek üzere kuyruğa ekler. `edit`, `base_version`
+        içeriğinden bu içeriğe yapılan düzenlemelerin ipucudur (yoksa metinler karşılaştırılır).
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="BackgroundTokenizer", daemon=True)
+            self._thread.start()
+        self._jobs.put((version, base_version, content, lexer, edit))
+
+    def close(self) -> None:
+        """İşçi iş parçacığını durdurur."""
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            # Sadece en yeni işi işle; aradaki sürümler zaten eskimiştir
+            try:
+                while job is not None:
+                    job = self._jobs.get_nowait()
+            except queue.Empty:
+                pass
+            if job is None:
+                return
+            try:
+                self.results.put(self._process(*job))
+            except Exception as e:
+                print(f"BackgroundTokenizer: Lexing hatası: {e}")
+
+    def _process(self, version: int, base_version: Optional[int], content: str, lexer: Any,
+                 edit: Optional[EditHint] = None) -> TokenizeResult:
+        base = self._states.get(base_version) if base_version is not None else None
+        update = None
+        if base is not None and base.lexer is lexer:
+            update = relex_document(base, content, self.checkpoint_interval, edit)
+            if update is None:
+                # İçerik değişmemiş: boş bir artımlı sonuç döndür
+                self._remember(version, base)
+                return TokenizeResult(version, base_version, False, content, lexer, 0, 0, [], base.tokens)
+
+        if update is not None:
+            state, start, stop, tokens = update
+            result = TokenizeResult(version, base_version, False, content, lexer, start, stop, tokens,
+                                    state.tokens)
+        else:
+            state, tokens = lex_document(content, lexer, self.checkpoint_interval)
+            result = TokenizeResult(version, None, True, content, lexer, 0, len(content), tokens, tokens)
+
+        if state is not None:
+            self._remember(version, state)
+        return result
+
+    def _remember(self, version: int, state: LexState) -> None:
+        self._states[version] = state
+        while len(self._states) > self.MAX_STATES:
+            self._states.popitem(last=False)
+
+
+class TokenCache:
+    """
+    Bir belge için paylaşılan token önbelleği.
+
+    Editörün SyntaxHighlighter'ı belgeyi her lexleyişinde (tam, artımlı veya arka planda) tüm
+    belgenin token dizisini buraya yayınlar. Minimap gibi tüketiciler aynı içerik ve lexer
+    için pygments'ı yeniden çalıştırmak yerine bu token'ları kendi widget'larına uygular.
+    Girdi içerik sürümü (`version`) ve lexer ile anahtarlanır; sadece Tk iş parçacığından kullanılır.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.content: Optional[str] = None
+        self.lexer: Any = None
+        self.tokens: Optional[TokenList] = None
+        # Son yayında token'ları bir önceki yayına göre değişmiş olabilecek [başlangıç, bitiş) aralığı
+        self.changed: Optional[Tuple[int, int]] = None
+        self._token_starts: Optional[List[int]] = None
+        self._listeners: List[Callable[[], None]] = []
+
+    def publish(self, content: str, lexer: Any, tokens: TokenList,
+                changed: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Belgenin `content` içeriği için `lexer` ile üretilmiş token'ları kaydeder ve dinleyicilere haber verir.
+        `changed`, bir önceki yayına göre token'ları değişmiş olabilecek (yeni içerikteki) konum
+        aralığıdır; None ise tüm belge değişmiş sayılır.
+        """
+        self.version += 1
+        self.content = content
+        self.lexer = lexer
+        self.tokens = tokens
+        self.changed = changed
+        self._token_starts = None
+        for listener in list(self._listeners):
+            listener()
+
+    def lookup(self, content: str, lexer: Any) -> Optional[TokenList]:
+        """Önbellekteki token'lar bu içerik ve lexer'a aitse döndürür, değilse None."""
+        if self.tokens is None or lexer is not self.lexer or content != self.content:
+            return None
+        return self.tokens
+
+    def token_starts(self) -> Optional[List[int]]:
+        """
+        Token'ların belgedeki başlangıç konumları (sonda belge uzunluğu ile); ikili aramayla bir
+        konumu kapsayan token'ı bulmak için. Her yayın için bir kez hesaplanır.
+        """
+        if self.tokens is None:
+            return None
+        if self._token_starts is None:
+            self._token_starts = list(accumulate((len(text) for _, text in self.tokens), initial=0))
+        return self._token_starts
+
+    def invalidate(self) -> None:
+        """Önbelleği boşaltır (ör. görünüm alanı modunda tam belge token'ları yoktur)."""
+        self.version += 1
+        self.content = None
+        self.tokens = None
+        self.changed = None
+        self._token_starts = None
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Her yayından sonra çağrılacak bir geri çağırma ekler."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
@@ -0,0 +1,273 @@
+import time
+import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Iterator, List, Optional, Tuple
+
+from text_editor.utils.settings_manager import SettingsManager
+
+# (satır, sütun, eklenen metin, silinen metin): düzenlemeden önceki belgede (satır, sütun)
+# konumundaki `silinen` metin `eklenen` ile değiştirilmiştir
+Delta = Tuple[int, int, str, str]
+
+
+def _end_of(line: int, col: int, text: str) -> str:
+    """(satır, sütun) konumuna eklenen `text` metninin bitiş indeksi."""
+    newlines = text.count("\n")
+    if not newlines:
+        return f"{line}.{col + len(text)}"
+    return f"{line + newlines}.{len(text) - text.rfind(chr(10)) - 1}"
+
+
+class _UndoGroup:
+    """Tek adımda geri alınan düzenlemeler (uygulandıkları sırayla)."""
+    __slots__ = ("deltas", "size", "time", "typing")
+
+    def __init__(self):
+        self.deltas: List[Delta] = []
+        self.size = 0
+        self.time = time.monotonic()
+        self.typing = True  # Sadece tek karakterlik yazma/silmelerden oluşuyor mu?
+
+
+class UndoManager:
+    """
+    Editör düzeyinde geri alma/yineleme yöneticisi.
+
+    Tk'nın yerleşik geri alma yığını yerine ChangeTracker dinleyicisi olarak her düzenlemeyi
+    küçük bir fark (satır, sütun, eklenen, silinen) olarak kaydeder. Geri alma, farkların
+    tersini tek bir `replace` çağrısıyla uygular.
+
+    Gruplama:
+    - `transaction()` bloğundaki tüm düzenlemeler (çoklu imleç, satır işlemleri, tümünü
+      değiştir) tek adımdır.
+    - Blok dışında aynı olay döngüsü turundaki düzenlemeler (örn. seçimi silip yapıştırma)
+      bir gruptur; grup boşta kalınca kapanır.
+    - Art arda yazılan veya silinen karakterler MERGE_MS içinde ve bitişikse tek farkta
+      birleştirilir; yeni bir kelimeye başlamak, Enter veya imleci başka yere taşımak yeni
+      bir adım başlatır. Çoklu imleçle yazılan karakterler de imleç başına birleştirilir.
+
+    Bellek: farkların tahmini boyutu `undo_memory_limit` (MB, sekme başına) ayarını aşarsa
+    en eski adımlar atılır. Son adım sınırdan büyük olsa bile tutulur.
+    """
+    MERGE_MS = 2000
+    DELTA_OVERHEAD = 100  # Bir farkın metinler dışındaki tahmini bellek maliyeti (bayt)
+
+    def __init__(self, text_widget: tk.Text, change_tracker: Any):
+        self.widget = text_widget
+        self._undo: Deque[_UndoGroup] = deque()
+        self._redo: List[_UndoGroup] = []
+        self._size = 0
+        self._open: Optional[_UndoGroup] = None
+        self._depth = 0
+        self._idle_job = None
+        self._applying = False
+        self._suspended = False
+        change_tracker.add_listener(self.on_change)
+
+    @staticmethod
+    def memory_limit() -> int:
+        try:
+            megabytes = float(SettingsManager.get_instance().get("undo_memory_limit", 16))
+        except (TypeError, ValueError):
+            megabytes = 16
+        return int(max(megabytes, 0.1) * 1024 * 1024)
+
+    # --- Kayıt ---
+
+    def on_change(self, change: Any) -> None:
+        if self._applying or self._suspended:
+            return
+        if self._redo:
+            self._size -= sum(group.size for group in self._redo)
+            self._redo.clear()
+        delta = (change.start_line, change.start_col, change.text, change.deleted)
+        group = self._open
+        if group is None:
+            group = self._open = _UndoGroup()
+            if self._depth == 0:
+                self._schedule_close()
+        if group.deltas and self._merge_into(group, len(group.deltas) - 1, delta):
+            return
+        group.deltas.append(delta)
+        group.typing = group.typing and self._is_keystroke(delta)
+        self._add_size(group, delta)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Bloktaki tüm düzenlemeleri tek geri alma adımında toplar (iç içe kullanılabilir)."""
+        if self._depth == 0:
+            self.close_group()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.close_group()
+
+    def close_group(self) -> None:
+        """Açık grubu kapatır; mümkünse önceki yazma adımıyla birleştirir."""
+        self._cancel_idle()
+        group, self._open = self._open, None
+        if group is None or not group.deltas:
+            return
+        if self._undo and self._merge_groups(self._undo[-1], group):
+            return
+        self._undo.append(group)
+        self._trim()
+
+    def suspend(self) -> None:
+        """Dosya yüklenirken düzenlemeler kaydedilmez (yükleme sonunda `reset` çağrılır)."""
+        self._suspended = True
+
+    def reset(self) -> None:
+        """Geçmişi siler ve kaydı yeniden başlatır."""
+        self._cancel_idle()
+        self._undo.clear()
+        self._redo.clear()
+        self._open = None
+        self._size = 0
+        self._suspended = False
+
+    def can_undo(self) -> bool:
+        return bool(self._undo or (self._open and self._open.deltas))
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    # --- Birleştirme ---
+
+    @staticmethod
+    def _is_keystroke(delta: Delta) -> bool:
+        _, _, text, deleted = delta
+        return len(text) + len(deleted) == 1 and "\n" not in text and "\n" not in deleted
+
+    def _merge_into(self, group: _UndoGroup, index: int, delta: Delta) -> bool:
+        """`delta`, gruptaki farkın bitişiğindeki bir tuş vuruşuysa o farka eklenir."""
+        if not self._is_keystroke(delta):
+            return False
+        line, col, text, deleted = group.deltas[index]
+        new_line, new_col, new_text, new_deleted = delta
+        if new_line != line or "\n" in text or "\n" in deleted:
+            return False
+        if new_text and not deleted and text and new_col == col + len(text):
+            if text[-1].isspace() and not new_text.isspace():
+                return False  # Yeni kelime yeni adım
+            merged = (line, col, text + new_text, "")
+        elif new_deleted and not text and not new_text and deleted:
+            if new_col + 1 == col:      # Backspace
+                merged = (line, new_col, "", new_deleted + deleted)
+            elif new_col == col:        # Delete
+                merged = (line, col, "", deleted + new_deleted)
+            else:
+                return False
+        else:
+            return False
+        group.deltas[index] = merged
+        self._add_size(group, delta, overhead=False)
+        return True
+
+    def _merge_groups(self, previous: _UndoGroup, group: _UndoGroup) -> bool:
+        """
+        Yeni tuş vuruşu grubunu önceki yazma adımına ekler. Her fark önceki adımdaki aynı
+        sıradaki farka bitişik olmalıdır; farklar ayrı satırlarda olmalıdır ki birbirlerinin
+        konumunu kaydırmasınlar (çoklu imleç).
+        """
+        if not (previous.typing and group.typing and len(previous.deltas) == len(group.deltas)):
+            return False
+        if group.time - previous.time > self.MERGE_MS / 1000:
+            return False
+        if len(group.deltas) > 1 and len({d[0] for d in group.deltas}) != len(group.deltas):
+            return False
+        saved = list(previous.deltas), previous.size
+        for index, delta in enumerate(group.deltas):
+            if not self._merge_into(previous, index, delta):
+                previous.deltas, previous.size = saved
+                self._size -= sum(self._delta_size(d) for d in group.deltas[:index])
+                return False
+        previous.time = group.time
+        self._size -= group.size  # Farklar artık önceki adımda sayılıyor
+        return True
+
+    # --- Bellek ---
+
+    def _delta_size(self, delta: Delta) -> int:
+        return len(delta[2]) + len(delta[3])
+
+    def _add_size(self, group: _UndoGroup, delta: Delta, overhead: bool = True) -> None:
+        size = self._delta_size(delta) + (self.DELTA_OVERHEAD if overhead else 0)
+        group.size += size
+        self._size += size
+
+    def _trim(self) -> None:
+        """Bellek sınırı aşıldıysa en eski adımları atar."""
+        limit = self.memory_limit()
+        while self._size > limit and len(self._undo) > 1:
+            self._size -= self._undo.popleft().size
+
+    # --- Geri alma / yineleme ---
+
+    def undo(self) -> bool:
+        self.close_group()
+        if not self._undo:
+            return False
+        group = self._undo.pop()
+        if self._undo:
+            self._undo[-1].time = 0.0  # Geri alınan yerden sonra yazılanlar yeni adımdır
+        position = None
+        for line, col, text, deleted in reversed(group.deltas):
+            position = self._apply(line, col, text, deleted)
+        self._redo.append(group)
+        self._finish(position)
+        return True
+
+    def redo(self) -> bool:
+        self.close_group()
+        if not self._redo:
+            return False
+        group = self._redo.pop()
+        position = None
+        for line, col, text, deleted in group.deltas:
+            position = self._apply(line, col, deleted, text)
+        # Yinelenen adım sonraki yazmayla birleşmesin
+        group.time = 0.0
+        self._undo.append(group)
+        self._finish(position)
+        return True
+
+    def _apply(self, line: int, col: int, current: str, restored: str) -> str:
+        """(satır, sütun) konumundaki `current` metnini `restored` ile değiştirir."""
+        start = f"{line}.{col}"
+        self._applying = True
+        try:
+            self.widget.replace(start, _end_of(line, col, current), restored)
+        finally:
+            self._applying = False
+        return _end_of(line, col, restored)
+
+    def _finish(self, position: Optional[str]) -> None:
+        if position is None:
+            return
+        self.widget.tag_remove("sel", "1.0", "end")
+        self.widget.mark_set("insert", position)
+        self.widget.see("insert")
+
+    def _schedule_close(self) -> None:
+        try:
+            self._idle_job = self.widget.after_idle(self._on_idle)
+        except tk.TclError:
+            self._idle_job = None
+
+    def _on_idle(self) -> None:
+        self._idle_job = None
+        if self._depth == 0:
+            self.close_group()
+
+    def _cancel_idle(self) -> None:
+        if self._idle_job is not None:
+            try:
+                self.widget.after_cancel(self._idle_job)
+            except tk.TclError:
+                pass
+            self._idle_job = None